@@ -4,7 +4,10 @@ Voice Conversation Generator CLI - Clean modular interface
 """
 import asyncio
 import sys
+import time
+from datetime import datetime
 from pathlib import Path
+from typing import Dict, Any, Optional, Tuple
 import click
 
 # Add parent directory to path for imports
@@ -14,9 +17,33 @@ from voice_conversation_generator.config.config import Config, get_config
 from voice_conversation_generator.services import (
     ConversationOrchestrator,
     PersonaService,
-    ProviderFactory
+    ProviderFactory,
+    ShardedBatchRunner
 )
-from voice_conversation_generator.models import ConversationConfig
+from voice_conversation_generator.models import ConversationConfig, BatchJob, BatchResult, BatchRunReport
+from voice_conversation_generator.jobs import JobQueue, QueueWorker
+from voice_conversation_generator.providers.response_cache import CACHE_MODES
+
+AUDIO_MODES = ConversationOrchestrator.AUDIO_MODES
+PROMPT_MODES = ConversationOrchestrator.PROMPT_MODES
+LLM_CACHE_HELP = ('Persistent LLM response cache: read_through (serve hits, store misses), record (always call, store), '
+                  'replay (fail on a miss, no API calls) or bypass')
+
+
+def _apply_llm_cache(config: Config, mode: Optional[str]) -> None:
+    """Override the LLM response cache mode (keeping any configured backend and path)"""
+    if mode:
+        config.providers.llm['cache'] = {**(config.providers.llm.get('cache') or {}), 'mode': mode}
+
+
+def _role_llm_settings(customer_llm: Optional[str], customer_model: Optional[str],
+                       support_model: Optional[str]) -> Dict[str, Any]:
+    """ConversationConfig overrides routing each side of the call to its own LLM"""
+    return {
+        'customer_llm_provider': customer_llm,
+        'customer_llm_model': customer_model,
+        'support_llm_model': support_model
+    }
 
 
 @click.group()
@@ -32,20 +59,35 @@ def cli(ctx):
 @click.option('--customer', '-c', default='cooperative_parent', help='Customer persona ID')
 @click.option('--support', '-s', default='default', help='Support persona ID')
 @click.option('--max-turns', '-t', default=10, help='Maximum conversation turns')
-@click.option('--tts', type=click.Choice(['openai', 'elevenlabs', 'cartesia', 'auto']), default='auto', help='TTS provider')
+@click.option('--tts', type=click.Choice(['openai', 'elevenlabs', 'cartesia', 'mock', 'auto']), default='auto', help='TTS provider')
+@click.option('--audio-mode', type=click.Choice(AUDIO_MODES), default='pipelined',
+              help='pipelined: audio per turn; streaming: audio per sentence as the LLM streams; script_first: full script then parallel audio; text_only: no audio')
+@click.option('--budget', type=float, default=None, help='Stop the conversation once its estimated cost reaches this (USD)')
+@click.option('--prompt-mode', type=click.Choice(PROMPT_MODES), default='text',
+              help='text: history pasted into one prompt; messages: cache-friendly chat messages')
+@click.option('--llm-cache', type=click.Choice(CACHE_MODES), default=None, help=LLM_CACHE_HELP)
+@click.option('--customer-model', default=None, help='Model for the customer side (default: the LLM config\'s model)')
+@click.option('--customer-llm', default=None, help='Named LLM section (providers.named_llms) for the customer side')
+@click.option('--support-model', default=None, help='Model for the support side (default: the LLM config\'s model)')
 @click.option('--save/--no-save', default=True, help='Save conversation to storage')
 @click.pass_context
-def generate(ctx, customer: str, support: str, max_turns: int, tts: str, save: bool):
+def generate(ctx, customer: str, support: str, max_turns: int, tts: str, audio_mode: str,
+             budget: Optional[float], prompt_mode: str, llm_cache: Optional[str], customer_model: Optional[str],
+             customer_llm: Optional[str], support_model: Optional[str], save: bool):
     """Generate a synthetic conversation"""
 
     config = ctx.obj['config']
+    _apply_llm_cache(config, llm_cache)
 
     # Override TTS provider if specified
     if tts != 'auto':
         config.providers.tts['type'] = tts
 
     # Run async function
-    asyncio.run(_generate_conversation(config, customer, support, max_turns, save))
+    role_llm = _role_llm_settings(customer_llm, customer_model, support_model)
+    asyncio.run(_generate_conversation(
+        config, customer, support, max_turns, audio_mode, save, budget, prompt_mode, role_llm
+    ))
 
 
 async def _generate_conversation(
@@ -53,7 +95,11 @@ async def _generate_conversation(
     customer_id: str,
     support_id: str,
     max_turns: int,
-    save: bool
+    audio_mode: str,
+    save: bool,
+    budget: Optional[float] = None,
+    prompt_mode: str = "text",
+    role_llm: Optional[Dict[str, Any]] = None
 ):
     """Async function to generate conversation"""
 
@@ -92,15 +138,21 @@ async def _generate_conversation(
     orchestrator = ConversationOrchestrator(
         llm_provider=providers['llm'],
         tts_provider=providers['tts'],
-        storage_gateway=providers['storage']
+        storage_gateway=providers['storage'],
+        llm_providers=providers['llm_providers']
     )
+    await orchestrator.warm_up()
 
     # Configure conversation
     conv_config = ConversationConfig(
         max_turns=max_turns,
         llm_provider=config.providers.llm['type'],
         llm_model=config.providers.llm.get('model', 'gpt-4'),
-        tts_provider=config.providers.tts['type']
+        tts_provider=config.providers.tts['type'],
+        audio_mode=audio_mode,
+        budget_usd=budget,
+        prompt_mode=prompt_mode,
+        **(role_llm or {})
     )
 
     # Generate conversation
@@ -122,6 +174,530 @@ async def _generate_conversation(
     print(metrics.generate_summary())
 
 
+@cli.command()
+@click.option('--customer', '-c', multiple=True, help='Customer persona ID (repeatable, default: all personas)')
+@click.option('--support', '-s', default='default', help='Support persona ID')
+@click.option('--count', '-n', default=1, help='Conversations to generate per customer persona')
+@click.option('--concurrency', '-j', default=4, help='Maximum conversations in flight at once (per process)')
+@click.option('--processes', '-p', default=1, help='Worker processes to shard the batch across (0: one per CPU)')
+@click.option('--max-turns', '-t', default=10, help='Maximum conversation turns')
+@click.option('--tts', type=click.Choice(['openai', 'elevenlabs', 'cartesia', 'mock', 'auto']), default='auto', help='TTS provider')
+@click.option('--audio-mode', type=click.Choice(AUDIO_MODES), default='pipelined',
+              help='pipelined: audio per turn; streaming: audio per sentence as the LLM streams; script_first: full script then parallel audio; text_only: no audio')
+@click.option('--run-id', default=None, help='Batch run ID used to prefix conversation IDs')
+@click.option('--save/--no-save', default=True, help='Save conversations to storage')
+@click.option('--checkpoint/--no-checkpoint', default=True, help='Checkpoint every turn so the batch can be resumed')
+@click.option('--resume', is_flag=True, help='Resume an interrupted batch (requires its --run-id)')
+@click.option('--budget', type=float, default=None, help='Per-conversation estimated cost cap (USD)')
+@click.option('--batch-budget', type=float, default=None, help='Estimated cost cap for the whole batch (USD)')
+@click.option('--prompt-mode', type=click.Choice(PROMPT_MODES), default='text',
+              help='text: history pasted into one prompt; messages: cache-friendly chat messages')
+@click.option('--request-timeout', type=float, default=None, help='Fail any single LLM/TTS request after this many seconds')
+@click.option('--conversation-timeout', type=float, default=None,
+              help='Save a conversation as partial once it runs this many seconds')
+@click.option('--llm-cache', type=click.Choice(CACHE_MODES), default=None, help=LLM_CACHE_HELP)
+@click.option('--customer-model', default=None, help='Model for the customer side (default: the LLM config\'s model)')
+@click.option('--customer-llm', default=None, help='Named LLM section (providers.named_llms) for the customer side')
+@click.option('--support-model', default=None, help='Model for the support side (default: the LLM config\'s model)')
+@click.option('--llm-batch', is_flag=True,
+              help='Send LLM requests through the OpenAI Batch API (half price; each turn waits for its batch, '
+                   'best with --audio-mode text_only and a high --concurrency)')
+@click.pass_context
+def batch(ctx, customer: Tuple[str, ...], support: str, count: int, concurrency: int, processes: int,
+          max_turns: int, tts: str, audio_mode: str, run_id: str, save: bool,
+          checkpoint: bool, resume: bool, budget: Optional[float], batch_budget: Optional[float],
+          prompt_mode: str, request_timeout: Optional[float], conversation_timeout: Optional[float],
+          llm_cache: Optional[str], customer_model: Optional[str], customer_llm: Optional[str],
+          support_model: Optional[str], llm_batch: bool):
+    """Generate many conversations concurrently"""
+
+    config = ctx.obj['config']
+    _apply_llm_cache(config, llm_cache)
+    if llm_batch:
+        config.providers.llm['batch'] = {**(config.providers.llm.get('batch') or {}), 'enabled': True}
+
+    if resume and not run_id:
+        raise click.UsageError("--resume requires the --run-id of the interrupted batch")
+
+    # Override TTS provider if specified
+    if tts != 'auto':
+        config.providers.tts['type'] = tts
+
+    run_id = run_id or datetime.now().strftime("batch_%Y%m%d_%H%M%S")
+
+    # Run async function
+    asyncio.run(_generate_batch(
+        config, list(customer), support, count, concurrency, max_turns, audio_mode, run_id, save,
+        checkpoint, resume, budget, batch_budget, processes, request_timeout, conversation_timeout, prompt_mode,
+        _role_llm_settings(customer_llm, customer_model, support_model)
+    ))
+
+
+async def _generate_batch(
+    config: Config,
+    customer_ids: list,
+    support_id: str,
+    count: int,
+    concurrency: int,
+    max_turns: int,
+    audio_mode: str,
+    run_id: str,
+    save: bool,
+    checkpoint: bool = True,
+    resume: bool = False,
+    budget: Optional[float] = None,
+    batch_budget: Optional[float] = None,
+    processes: int = 1,
+    request_timeout: Optional[float] = None,
+    conversation_timeout: Optional[float] = None,
+    prompt_mode: str = "text",
+    role_llm: Optional[Dict[str, Any]] = None
+):
+    """Async function to generate a batch of conversations"""
+
+    print("\n🚀 Voice Conversation Generator - Batch")
+    print("=" * 50)
+
+    # Initialize services
+    print("📦 Loading services...")
+    tts_provider = config.providers.tts.get('type', 'openai')
+    persona_service = PersonaService(tts_provider=tts_provider)
+    persona_service.load_default_personas()
+
+    support_persona = persona_service.get_support_persona(support_id)
+    if not support_persona:
+        print(f"❌ Support persona '{support_id}' not found")
+        return
+
+    customer_ids = customer_ids or list(persona_service.customer_personas.keys())
+    customer_personas = []
+    for customer_id in customer_ids:
+        customer_persona = persona_service.get_customer_persona(customer_id)
+        if not customer_persona:
+            print(f"❌ Customer persona '{customer_id}' not found")
+            print(f"Available personas: {', '.join(persona_service.customer_personas.keys())}")
+            return
+        customer_personas.append(customer_persona)
+
+    # Create providers (shared by every conversation in the batch, or by
+    # every conversation of a worker process when sharded)
+    print("\n🔧 Initializing providers...")
+    providers = ProviderFactory.create_all_providers(config)
+    print(f"  LLM: {providers['llm'].get_model_name()}")
+    print(f"  TTS: {providers['tts'].get_provider_name()}")
+    print(f"  Storage: {providers['storage'].get_storage_type()}")
+
+    if processes != 1:
+        runner = ShardedBatchRunner(config, processes=processes or None)
+    else:
+        runner = ConversationOrchestrator(
+            llm_provider=providers['llm'],
+            tts_provider=providers['tts'],
+            storage_gateway=providers['storage'],
+            verbose=False,
+            llm_providers=providers['llm_providers']
+        )
+
+    conv_config = ConversationConfig(
+        max_turns=max_turns,
+        llm_provider=config.providers.llm['type'],
+        llm_model=config.providers.llm.get('model', 'gpt-4'),
+        tts_provider=config.providers.tts['type'],
+        audio_mode=audio_mode,
+        checkpoint=checkpoint or resume,
+        budget_usd=budget,
+        request_timeout=request_timeout,
+        conversation_timeout=conversation_timeout,
+        prompt_mode=prompt_mode,
+        **(role_llm or {})
+    )
+
+    jobs = []
+    for customer_persona in customer_personas:
+        for _ in range(count):
+            jobs.append(BatchJob(
+                customer_persona=customer_persona,
+                support_persona=support_persona,
+                config=conv_config,
+                job_id=f"{run_id}_{len(jobs):05d}",
+                metadata={'run_id': run_id}
+            ))
+
+    action = "Resuming" if resume else "Generating"
+    print(f"\n🎭 {action} {len(jobs)} conversations (concurrency: {concurrency})...")
+    finished = 0
+
+    def report(result: BatchResult):
+        nonlocal finished
+        finished += 1
+        status = "✅" if result.succeeded else "❌"
+        detail = f"{len(result.conversation.turns)} turns" if result.succeeded else result.error
+        if result.succeeded and result.conversation.metadata.get('partial'):
+            detail += f" (partial: {result.conversation.metadata['stop_reason']})"
+        print(f"  {status} [{finished}/{len(jobs)}] {result.job.job_id} "
+              f"{result.job.customer_persona.id}: {detail} ({result.duration_seconds:.1f}s)")
+
+    start_time = time.time()
+    results = await runner.generate_batch(
+        jobs,
+        max_concurrency=concurrency,
+        save=save,
+        on_result=report,
+        resume=resume,
+        budget_usd=batch_budget
+    )
+    elapsed = time.time() - start_time
+
+    sharded = isinstance(runner, ShardedBatchRunner)
+    run_report = BatchRunReport.from_results(
+        run_id, results, elapsed, processes=runner.processes if sharded else 1
+    )
+    if sharded:
+        run_report.rate_limits = runner.rate_limits
+        run_report.shards = runner.shards
+
+    print(f"\n📊 Batch Summary:")
+    print(f"  Run ID: {run_id}")
+    print(f"  Succeeded: {run_report.succeeded}/{run_report.total_jobs}")
+    print(f"  Tokens: {run_report.total_tokens} ({run_report.cached_tokens} cached prompt tokens)")
+    if run_report.llm_cache_hits:
+        print(f"  LLM responses served from cache: {run_report.llm_cache_hits}")
+    print(f"  TTS characters: {run_report.tts_characters}")
+    print(f"  Estimated cost: ${run_report.total_cost_usd:.4f}")
+    print(f"  Wall time: {elapsed:.1f}s" + (f" ({run_report.processes} processes)" if sharded else ""))
+    if elapsed > 0:
+        print(f"  Throughput: {run_report.conversations_per_minute:.1f} conversations/min")
+    if sharded:
+        for name, state in run_report.rate_limits.items():
+            if state['waits']:
+                print(f"  {name}: queued {state['waits']} times "
+                      f"for {state['wait_seconds']:.1f}s by the shared rate limit")
+    else:
+        for name, state in runner.concurrency.snapshot().items():
+            print(f"  {name}: concurrency limit {state['limit']} "
+                  f"({state['successes']} ok, {state['overloads']} rate limited)")
+        for kind in ('llm', 'tts'):
+            rate_limiter = providers[kind].rate_limiter
+            if rate_limiter is not None and rate_limiter.waits:
+                print(f"  {rate_limiter.name}: queued {rate_limiter.waits} times "
+                      f"for {rate_limiter.wait_seconds:.1f}s by the rate limit")
+            circuit_breaker = getattr(providers[kind], 'circuit_breaker', None)
+            if circuit_breaker is not None and circuit_breaker.times_opened:
+                print(f"  {circuit_breaker.name}: circuit {circuit_breaker.state}, "
+                      f"opened {circuit_breaker.times_opened} times")
+        pool_snapshot = getattr(providers['llm'], 'pool_snapshot', None)
+        if pool_snapshot is not None:
+            pool = pool_snapshot()
+            print(f"  LLM pool ({pool['strategy']}): {pool['failovers']} failovers")
+            for name, state in pool['endpoints'].items():
+                print(f"    {name}: {state['requests']} requests, {state['failures']} failed, "
+                      f"circuit {state['state']}")
+        batch_snapshot = getattr(providers['llm'], 'batch_snapshot', None)
+        if batch_snapshot is not None:
+            batching = batch_snapshot()
+            print(f"  LLM batches: {batching['batches']} ({batching['avg_requests_per_batch']} requests each, "
+                  f"{batching['avg_batch_seconds']:.0f}s each), {batching['failed_requests']} requests failed")
+        hedge_snapshot = getattr(providers['tts'], 'hedge_snapshot', None)
+        if hedge_snapshot is not None:
+            hedging = hedge_snapshot()
+            print(f"  TTS hedging: {hedging['hedges']}/{hedging['requests']} requests hedged "
+                  f"({hedging['hedge_rate']:.1%}), hedge won {hedging['win_rate']:.0%}, "
+                  f"{hedging['extra_characters']} extra characters")
+    if run_report.retries or run_report.turns_missing_audio:
+        print(f"  Retries: {run_report.retries}, turns missing audio: {run_report.turns_missing_audio}")
+    if save:
+        print(f"  Report: {await providers['storage'].save_run_report(run_id, run_report.to_dict())}")
+    if run_report.failed and conv_config.checkpoint:
+        print(f"  Resume with: vcg batch --run-id {run_id} --resume")
+
+
+@cli.command()
+@click.argument('transcript')
+@click.option('--tts', type=click.Choice(['openai', 'elevenlabs', 'cartesia', 'mock', 'auto']), default='auto', help='TTS provider')
+@click.option('--concurrency', '-j', default=4, help='Maximum parallel TTS requests')
+@click.option('--save/--no-save', default=True, help='Save rendered conversation to storage')
+@click.pass_context
+def render(ctx, transcript: str, tts: str, concurrency: int, save: bool):
+    """Render audio for an existing transcript (key or path)"""
+
+    config = ctx.obj['config']
+
+    # Override TTS provider if specified
+    if tts != 'auto':
+        config.providers.tts['type'] = tts
+
+    # Run async function
+    asyncio.run(_render_transcript(config, transcript, concurrency, save))
+
+
+async def _render_transcript(config: Config, transcript_key: str, concurrency: int, save: bool):
+    """Async function to render audio for a saved transcript"""
+
+    print("\n🔊 Voice Conversation Generator - Render")
+    print("=" * 50)
+
+    providers = ProviderFactory.create_all_providers(config)
+    storage = providers['storage']
+
+    # Load transcript to find the personas whose voices to use
+    try:
+        data = await storage.load_transcript(transcript_key)
+    except FileNotFoundError as e:
+        print(f"❌ {e}")
+        return
+
+    tts_provider = config.providers.tts.get('type', 'openai')
+    persona_service = PersonaService(tts_provider=tts_provider)
+    persona_service.load_default_personas()
+
+    customer_persona = persona_service.get_customer_persona(data.get('customer_persona_id'))
+    support_persona = persona_service.get_support_persona(data.get('support_persona_id') or 'default')
+    if not customer_persona or not support_persona:
+        print(f"❌ Personas for transcript not found "
+              f"(customer: {data.get('customer_persona_id')}, support: {data.get('support_persona_id')})")
+        return
+
+    print(f"  TTS: {providers['tts'].get_provider_name()}")
+    print(f"  Turns: {len(data.get('turns', []))}")
+
+    orchestrator = ConversationOrchestrator(
+        llm_provider=providers['llm'],
+        tts_provider=providers['tts'],
+        storage_gateway=storage
+    )
+    await orchestrator.warm_up(concurrency)
+
+    conversation, metrics = await orchestrator.render_transcript(
+        transcript_key,
+        customer_persona=customer_persona,
+        support_persona=support_persona,
+        max_concurrency=concurrency
+    )
+
+    if save:
+        print("\n💾 Saving conversation...")
+        await orchestrator.save_conversation(conversation, metrics)
+        print(f"✅ Saved successfully!")
+
+    print("\n📊 Metrics Summary:")
+    print(metrics.generate_summary())
+
+
+def _queue_path(config: Config, db: Optional[str]) -> str:
+    """Queue database path (default: queue.db in the local storage directory)"""
+    return db or str(Path(config.storage.local['base_path']) / 'queue.db')
+
+
+@cli.command()
+@click.option('--customer', '-c', multiple=True, help='Customer persona ID (repeatable, default: all personas)')
+@click.option('--support', '-s', default='default', help='Support persona ID')
+@click.option('--count', '-n', default=1, help='Jobs to enqueue per customer persona')
+@click.option('--priority', default=0, help='Higher priorities are generated first')
+@click.option('--max-turns', '-t', type=int, default=None, help='Override the workers\' maximum conversation turns')
+@click.option('--audio-mode', type=click.Choice(AUDIO_MODES), default=None, help='Override the workers\' audio mode')
+@click.option('--key', default=None, help='Idempotency key prefix; enqueueing the same key again adds no duplicates')
+@click.option('--db', default=None, help='Queue database (default: queue.db in the storage directory)')
+@click.pass_context
+def enqueue(ctx, customer: Tuple[str, ...], support: str, count: int, priority: int,
+            max_turns: Optional[int], audio_mode: Optional[str], key: Optional[str], db: Optional[str]):
+    """Add generation jobs to the durable queue"""
+
+    config = ctx.obj['config']
+    persona_service = PersonaService(tts_provider=config.providers.tts.get('type', 'openai'))
+    persona_service.load_default_personas()
+
+    customer_ids = list(customer) or list(persona_service.customer_personas.keys())
+    unknown = [customer_id for customer_id in customer_ids if not persona_service.get_customer_persona(customer_id)]
+    if unknown:
+        raise click.BadParameter(f"Unknown customer personas: {', '.join(unknown)}", param_hint='--customer')
+
+    overrides = {}
+    if max_turns is not None:
+        overrides['max_turns'] = max_turns
+    if audio_mode is not None:
+        overrides['audio_mode'] = audio_mode
+
+    queue = JobQueue(_queue_path(config, db))
+    existing = sum(queue.stats().values())
+    for customer_id in customer_ids:
+        for index in range(count):
+            queue.enqueue(
+                customer_id,
+                support_persona_id=support,
+                config=overrides,
+                priority=priority,
+                idempotency_key=f"{key}:{customer_id}:{index}" if key else None
+            )
+
+    added = sum(queue.stats().values()) - existing
+    print(f"📥 Enqueued {added} jobs in {queue.path}"
+          + (f" ({len(customer_ids) * count - added} already queued)" if added < len(customer_ids) * count else ""))
+    print(f"  Queue: {queue.stats()}")
+    queue.close()
+
+
+@cli.command()
+@click.option('--concurrency', '-j', default=2, help='Jobs generated at once by this worker')
+@click.option('--worker-id', default=None, help='Lease owner name (default: host:pid)')
+@click.option('--poll-interval', default=2.0, help='Seconds between polls of an empty queue')
+@click.option('--lease-seconds', default=300.0, help='Seconds a job stays reserved without a heartbeat')
+@click.option('--drain', is_flag=True, help='Exit once the queue is empty instead of waiting for jobs')
+@click.option('--max-turns', '-t', default=10, help='Maximum conversation turns (jobs may override)')
+@click.option('--tts', type=click.Choice(['openai', 'elevenlabs', 'cartesia', 'mock', 'auto']), default='auto', help='TTS provider')
+@click.option('--audio-mode', type=click.Choice(AUDIO_MODES), default='pipelined', help='Audio mode (jobs may override)')
+@click.option('--save/--no-save', default=True, help='Save conversations to storage')
+@click.option('--db', default=None, help='Queue database (default: queue.db in the storage directory)')
+@click.pass_context
+def worker(ctx, concurrency: int, worker_id: Optional[str], poll_interval: float, lease_seconds: float,
+           drain: bool, max_turns: int, tts: str, audio_mode: str, save: bool, db: Optional[str]):
+    """Generate conversations from the durable queue"""
+
+    config = ctx.obj['config']
+
+    # Override TTS provider if specified
+    if tts != 'auto':
+        config.providers.tts['type'] = tts
+
+    asyncio.run(_run_worker(
+        config, _queue_path(config, db), concurrency, worker_id, poll_interval, lease_seconds,
+        drain, max_turns, audio_mode, save
+    ))
+
+
+async def _run_worker(
+    config: Config,
+    db: str,
+    concurrency: int,
+    worker_id: Optional[str],
+    poll_interval: float,
+    lease_seconds: float,
+    drain: bool,
+    max_turns: int,
+    audio_mode: str,
+    save: bool
+):
+    """Async function to run a queue worker"""
+
+    print("\n🚀 Voice Conversation Generator - Worker")
+    print("=" * 50)
+
+    persona_service = PersonaService(tts_provider=config.providers.tts.get('type', 'openai'))
+    persona_service.load_default_personas()
+
+    print("\n🔧 Initializing providers...")
+    providers = ProviderFactory.create_all_providers(config)
+    print(f"  LLM: {providers['llm'].get_model_name()}")
+    print(f"  TTS: {providers['tts'].get_provider_name()}")
+    print(f"  Storage: {providers['storage'].get_storage_type()}")
+
+    orchestrator = ConversationOrchestrator(
+        llm_provider=providers['llm'],
+        tts_provider=providers['tts'],
+        storage_gateway=providers['storage'],
+        verbose=False,
+        llm_providers=providers['llm_providers']
+    )
+    base_config = ConversationConfig(
+        max_turns=max_turns,
+        llm_provider=config.providers.llm['type'],
+        llm_model=config.providers.llm.get('model', 'gpt-4'),
+        tts_provider=config.providers.tts['type'],
+        audio_mode=audio_mode
+    )
+
+    queue = JobQueue(db, lease_seconds=lease_seconds)
+    queue_worker = QueueWorker(
+        queue,
+        orchestrator,
+        persona_service,
+        base_config=base_config,
+        worker_id=worker_id,
+        concurrency=concurrency,
+        poll_interval=poll_interval,
+        save=save
+    )
+    processed = await queue_worker.run(drain=drain)
+
+    print(f"\n📊 Worker Summary:")
+    print(f"  Succeeded: {processed['succeeded']}, failed: {processed['failed']}, released: {processed['released']}")
+    print(f"  Queue: {queue.stats()}")
+    queue.close()
+
+
+@cli.command(name='queue')
+@click.option('--status', type=click.Choice(['queued', 'leased', 'succeeded', 'dead']), default=None,
+              help='List jobs in this state')
+@click.option('--limit', '-l', default=20, help='Number of jobs to list')
+@click.option('--requeue-dead', is_flag=True, help='Move dead-lettered jobs back to the queue')
+@click.option('--db', default=None, help='Queue database (default: queue.db in the storage directory)')
+@click.pass_context
+def queue_status(ctx, status: Optional[str], limit: int, requeue_dead: bool, db: Optional[str]):
+    """Show (or requeue) jobs in the durable queue"""
+
+    config = ctx.obj['config']
+    queue = JobQueue(_queue_path(config, db))
+
+    if requeue_dead:
+        print(f"♻️  Requeued {queue.requeue_dead()} dead-lettered jobs")
+
+    print(f"\n📋 Queue {queue.path}: {queue.stats()}")
+    if status:
+        for job in queue.list_jobs(status=status, limit=limit):
+            detail = job.last_error or (job.result or {}).get('storage_paths', {}).get('transcript', '')
+            print(f"  {job.id} {job.customer_persona_id} (priority {job.priority}, "
+                  f"attempt {job.attempts}/{job.max_attempts}) {detail}")
+    queue.close()
+
+
+@cli.command()
+@click.option('--host', default='127.0.0.1', help='Interface to bind')
+@click.option('--port', default=8765, help='Port to bind')
+@click.option('--seed', type=int, default=None, help='Seed for reproducible replies, latencies and faults')
+@click.option('--ttft-ms', type=float, default=400, help='Median time to first token of chat completions')
+@click.option('--ttfb-ms', type=float, default=300, help='Median time to first byte of speech')
+@click.option('--error-rate', type=float, default=0.0, help='Share of requests failing with a random 429')
+@click.option('--slow-first-byte-rate', type=float, default=0.0, help='Share of requests delayed before responding')
+@click.option('--first-byte-delay-ms', type=float, default=2000, help='Delay of slow requests')
+@click.option('--burst-every', type=float, default=0.0, help='Seconds between bursts where every request gets a 429')
+@click.option('--burst-seconds', type=float, default=2.0, help='Length of each 429 burst')
+@click.option('--truncate-rate', type=float, default=0.0, help='Share of responses cut off halfway')
+@click.option('--reset-rate', type=float, default=0.0, help='Share of connections dropped before responding')
+def standin(host: str, port: int, seed: Optional[int], ttft_ms: float, ttfb_ms: float, error_rate: float,
+            slow_first_byte_rate: float, first_byte_delay_ms: float, burst_every: float, burst_seconds: float,
+            truncate_rate: float, reset_rate: float):
+    """Serve local stand-ins for the OpenAI, Cartesia and ElevenLabs APIs"""
+    from voice_conversation_generator.standin import StandInServer
+
+    server = StandInServer(
+        host=host,
+        port=port,
+        seed=seed,
+        llm={'latency': {'ttft_ms': ttft_ms}, 'errors': {'rate_limit_rate': error_rate}},
+        tts={'latency': {'ttfb_ms': ttfb_ms}, 'errors': {'rate_limit_rate': error_rate}},
+        faults={
+            'slow_first_byte_rate': slow_first_byte_rate,
+            'first_byte_delay_ms': first_byte_delay_ms,
+            'burst_every_seconds': burst_every,
+            'burst_seconds': burst_seconds,
+            'truncate_rate': truncate_rate,
+            'reset_rate': reset_rate
+        }
+    )
+
+    async def serve():
+        async with server:
+            print(f"🧪 Stand-in APIs on {server.url} (Ctrl-C to stop). Set base_url to:")
+            for provider, url in server.base_urls().items():
+                print(f"  {provider}: {url}")
+            await asyncio.Event().wait()
+
+    try:
+        asyncio.run(serve())
+    except KeyboardInterrupt:
+        pass
+    print(f"\n📊 Stand-in stats: {server.stats}")
+
+
 @cli.command()
 @click.option('--type', '-t', type=click.Choice(['customer', 'support', 'all']), default='all', help='Persona type to list')
 @click.pass_context
@@ -222,9 +798,9 @@ def show_config(ctx):
     print(f"  LiveKit: {'Enabled' if config.livekit.enabled else 'Disabled'}")
 
 
-# Note: LiveKit functionality has been moved to dedicated files:
+# Note: Batch generation is available via the `batch` command above.
+# LiveKit functionality has been moved to dedicated files:
 # - livekit_conversation_runner.py for orchestration
-# - batch_conversation_processor.py for batch processing
 # - customer_agent.py and support_agent.py for agent implementations
 
 
@@ -56,6 +56,32 @@ class StorageConfig:
 @dataclass
 class ProvidersConfig:
     """Provider configuration"""
+    # The llm and tts sections accept these optional keys:
+    # - rate_limit: requests_per_minute, tokens_per_minute (llm) or
+    #   characters_per_minute (tts), burst_seconds (default 60); shared by
+    #   every provider with the same API key, base_url and organization
+    # - retry: max_attempts, base_delay, max_delay, max_retry_after,
+    #   attempt_timeout (false disables retries)
+    # - circuit_breaker: failure_threshold, reset_timeout
+    # - base_url: send requests elsewhere, e.g. a StandInServer ('vcg standin')
+    #
+    # llm only:
+    # - cache: mode (read_through, record, replay, bypass), backend (sqlite,
+    #   directory), path (default under the storage base_path), max_mb
+    #   (default 512), seed
+    # - batch: OpenAI Batch API at half price, for offline runs only;
+    #   collect_seconds (default 2), max_requests, poll_interval (default 30),
+    #   completion_window (default '24h'), timeout, discount (default 0.5)
+    # - endpoints: list of overrides of this section (API keys,
+    #   organizations or OpenAI-compatible servers), each with an optional
+    #   name and weight; tuned by 'pool': strategy (least_outstanding,
+    #   weighted_round_robin), failure_threshold, reset_timeout,
+    #   health_check_interval
+    #
+    # tts only:
+    # - hedge: duplicate slow requests; percentile, min_samples, window,
+    #   min_delay_ms, max_hedge_rate, and an optional 'secondary' section
+    #   (same shape as tts) whose equivalent voice serves the duplicate
     llm: Dict[str, Any] = field(default_factory=lambda: {
         "type": "openai",
         "model": "gpt-4"
@@ -66,6 +92,12 @@ class ProvidersConfig:
         "default_voice": "onyx"
     })
     stt: Optional[Dict[str, Any]] = None
+    # Shared HTTP connection pool: max_connections, max_keepalive_connections,
+    # keepalive_expiry, http2 (needs the h2 package), connect_timeout
+    http: Dict[str, Any] = field(default_factory=dict)
+    # Extra LLM sections (same shape as llm) by name, which a conversation
+    # routes a side to with customer_llm_provider / support_llm_provider
+    named_llms: Dict[str, Dict[str, Any]] = field(default_factory=dict)
 
 
 @dataclass
@@ -237,8 +269,10 @@ class Config:
             },
             'providers': {
                 'llm': self.providers.llm,
+                'named_llms': self.providers.named_llms,
                 'tts': self.providers.tts,
-                'stt': self.providers.stt
+                'stt': self.providers.stt,
+                'http': self.providers.http
             },
             'database': {
                 'enabled': self.database.enabled,
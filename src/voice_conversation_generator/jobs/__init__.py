@@ -0,0 +1,11 @@
+"""
+Durable job queue and workers for distributed generation
+"""
+from .job_queue import JobQueue, QueuedJob
+from .worker import QueueWorker
+
+__all__ = [
+    "JobQueue",
+    "QueuedJob",
+    "QueueWorker"
+]
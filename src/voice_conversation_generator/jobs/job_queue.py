@@ -0,0 +1,373 @@
+"""
+Job Queue - Durable SQLite queue of generation jobs
+Worker processes lease jobs from a shared database file, so a batch can be
+spread over any number of workers without an external broker. Leases
+expire, so jobs held by a crashed worker are picked up again.
+"""
+import json
+import sqlite3
+import threading
+import time
+import uuid
+from dataclasses import dataclass, field
+from typing import Dict, Any, List, Optional
+
+
+# Job states
+QUEUED = "queued"
+LEASED = "leased"
+SUCCEEDED = "succeeded"
+DEAD = "dead"
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS jobs (
+    id TEXT PRIMARY KEY,
+    idempotency_key TEXT UNIQUE,
+    customer_persona_id TEXT NOT NULL,
+    support_persona_id TEXT NOT NULL,
+    config TEXT NOT NULL,
+    metadata TEXT NOT NULL,
+    priority INTEGER NOT NULL DEFAULT 0,
+    status TEXT NOT NULL,
+    attempts INTEGER NOT NULL DEFAULT 0,
+    max_attempts INTEGER NOT NULL,
+    available_at REAL NOT NULL,
+    lease_owner TEXT,
+    lease_expires_at REAL,
+    last_error TEXT,
+    result TEXT,
+    created_at REAL NOT NULL,
+    updated_at REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS jobs_ready ON jobs (status, priority DESC, created_at);
+"""
+
+
+@dataclass
+class QueuedJob:
+    """A generation job stored in the queue"""
+    id: str
+    customer_persona_id: str
+    support_persona_id: str = "default"
+
+    # ConversationConfig overrides for this job (e.g. {"max_turns": 6})
+    config: Dict[str, Any] = field(default_factory=dict)
+    metadata: Dict[str, Any] = field(default_factory=dict)
+    priority: int = 0  # Higher priorities are leased first
+    idempotency_key: Optional[str] = None
+
+    status: str = QUEUED
+    attempts: int = 0
+    max_attempts: int = 3
+    available_at: float = 0  # Not leased before this time (retry backoff)
+    lease_owner: Optional[str] = None
+    lease_expires_at: Optional[float] = None
+    last_error: Optional[str] = None
+    result: Optional[Dict[str, Any]] = None
+    created_at: float = 0
+    updated_at: float = 0
+
+    @classmethod
+    def from_row(cls, row: sqlite3.Row) -> 'QueuedJob':
+        """Create from a jobs table row"""
+        data = dict(row)
+        for key in ('config', 'metadata', 'result'):
+            data[key] = json.loads(data[key]) if data[key] else ({} if key != 'result' else None)
+        return cls(**data)
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert to dictionary for JSON serialization"""
+        return {
+            "id": self.id,
+            "customer_persona_id": self.customer_persona_id,
+            "support_persona_id": self.support_persona_id,
+            "config": self.config,
+            "metadata": self.metadata,
+            "priority": self.priority,
+            "idempotency_key": self.idempotency_key,
+            "status": self.status,
+            "attempts": self.attempts,
+            "max_attempts": self.max_attempts,
+            "available_at": self.available_at,
+            "lease_owner": self.lease_owner,
+            "lease_expires_at": self.lease_expires_at,
+            "last_error": self.last_error,
+            "result": self.result,
+            "created_at": self.created_at,
+            "updated_at": self.updated_at
+        }
+
+
+class JobQueue:
+    """SQLite-backed job queue with leases, retries and dead-lettering
+
+    Every state change is a single transaction, so any number of workers
+    (threads or processes) can share one database file. WAL mode lets them
+    read while one writes; it needs shared memory, so for a database on a
+    network filesystem pass wal=False.
+    """
+
+    def __init__(
+        self,
+        path: str,
+        lease_seconds: float = 300.0,
+        max_attempts: int = 3,
+        retry_delay: float = 30.0,
+        wal: bool = True
+    ):
+        """Open (and create if needed) the queue database
+
+        Args:
+            path: SQLite database file
+            lease_seconds: How long a leased job stays reserved without a heartbeat
+            max_attempts: Default attempts per job before it is dead-lettered
+            retry_delay: Backoff before the first retry in seconds (doubles per attempt)
+            wal: Use write-ahead logging (disable on network filesystems)
+        """
+        self.path = path
+        self.lease_seconds = lease_seconds
+        self.max_attempts = max_attempts
+        self.retry_delay = retry_delay
+
+        # One connection per queue, shared by the threads the worker uses
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(path, timeout=30, isolation_level=None, check_same_thread=False)
+        self._conn.row_factory = sqlite3.Row
+        if wal:
+            self._conn.execute("PRAGMA journal_mode=WAL")
+            self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.executescript(_SCHEMA)
+
+    def _transaction(self, work) -> Any:
+        """Run work(connection) in an immediate (write-locked) transaction"""
+        with self._lock:
+            self._conn.execute("BEGIN IMMEDIATE")
+            try:
+                result = work(self._conn)
+            except BaseException:
+                self._conn.execute("ROLLBACK")
+                raise
+            self._conn.execute("COMMIT")
+            return result
+
+    def enqueue(
+        self,
+        customer_persona_id: str,
+        support_persona_id: str = "default",
+        config: Optional[Dict[str, Any]] = None,
+        priority: int = 0,
+        idempotency_key: Optional[str] = None,
+        max_attempts: Optional[int] = None,
+        metadata: Optional[Dict[str, Any]] = None
+    ) -> QueuedJob:
+        """Add a job to the queue
+
+        Args:
+            customer_persona_id: Customer persona to generate
+            support_persona_id: Support persona to generate
+            config: ConversationConfig overrides for this job
+            priority: Higher priorities are leased first
+            idempotency_key: Optional key; enqueueing the same key again
+                returns the existing job instead of adding a duplicate
+            max_attempts: Attempts before the job is dead-lettered
+            metadata: Extra data copied into the conversation metadata
+
+        Returns:
+            The new job, or the existing one with the same idempotency key
+        """
+        now = time.time()
+        job = QueuedJob(
+            id=uuid.uuid4().hex,
+            customer_persona_id=customer_persona_id,
+            support_persona_id=support_persona_id,
+            config=config or {},
+            metadata=metadata or {},
+            priority=priority,
+            idempotency_key=idempotency_key,
+            max_attempts=max_attempts or self.max_attempts,
+            available_at=now,
+            created_at=now,
+            updated_at=now
+        )
+
+        def insert(conn: sqlite3.Connection) -> QueuedJob:
+            if idempotency_key is not None:
+                row = conn.execute("SELECT * FROM jobs WHERE idempotency_key = ?", (idempotency_key,)).fetchone()
+                if row is not None:
+                    return QueuedJob.from_row(row)
+            conn.execute(
+                "INSERT INTO jobs (id, idempotency_key, customer_persona_id, support_persona_id, config, "
+                "metadata, priority, status, attempts, max_attempts, available_at, created_at, updated_at) "
+                "VALUES (?, ?, ?, ?, ?, ?, ?, ?, 0, ?, ?, ?, ?)",
+                (
+                    job.id, job.idempotency_key, job.customer_persona_id, job.support_persona_id,
+                    json.dumps(job.config), json.dumps(job.metadata), job.priority, QUEUED,
+                    job.max_attempts, job.available_at, job.created_at, job.updated_at
+                )
+            )
+            return job
+
+        return self._transaction(insert)
+
+    def lease(self, worker_id: str, limit: int = 1) -> List[QueuedJob]:
+        """Reserve up to limit ready jobs for a worker
+
+        Jobs whose lease expired (their worker died or stalled) are ready
+        again, unless they have used up their attempts, in which case they
+        are dead-lettered.
+
+        Args:
+            worker_id: Identifier of the leasing worker
+            limit: Maximum jobs to lease
+
+        Returns:
+            Leased jobs, highest priority first
+        """
+        now = time.time()
+
+        def take(conn: sqlite3.Connection) -> List[QueuedJob]:
+            conn.execute(
+                "UPDATE jobs SET status = ?, lease_owner = NULL, updated_at = ?, "
+                "last_error = 'Lease expired after ' || attempts || ' attempts' "
+                "WHERE status = ? AND lease_expires_at <= ? AND attempts >= max_attempts",
+                (DEAD, now, LEASED, now)
+            )
+            ids = [row['id'] for row in conn.execute(
+                "SELECT id FROM jobs WHERE (status = ? AND available_at <= ?) "
+                "OR (status = ? AND lease_expires_at <= ?) "
+                "ORDER BY priority DESC, created_at LIMIT ?",
+                (QUEUED, now, LEASED, now, limit)
+            )]
+            if not ids:
+                return []
+
+            placeholders = ",".join("?" * len(ids))
+            conn.execute(
+                f"UPDATE jobs SET status = ?, lease_owner = ?, lease_expires_at = ?, "
+                f"attempts = attempts + 1, updated_at = ? WHERE id IN ({placeholders})",
+                (LEASED, worker_id, now + self.lease_seconds, now, *ids)
+            )
+            rows = conn.execute(
+                f"SELECT * FROM jobs WHERE id IN ({placeholders}) ORDER BY priority DESC, created_at", ids
+            ).fetchall()
+            return [QueuedJob.from_row(row) for row in rows]
+
+        return self._transaction(take)
+
+    def _update_leased(self, job_id: str, worker_id: str, sql: str, params: tuple) -> bool:
+        """Apply an update to a job only while worker_id still holds its lease"""
+        def update(conn: sqlite3.Connection) -> bool:
+            cursor = conn.execute(
+                f"UPDATE jobs SET {sql}, updated_at = ? WHERE id = ? AND status = ? AND lease_owner = ?",
+                (*params, time.time(), job_id, LEASED, worker_id)
+            )
+            return cursor.rowcount == 1
+
+        return self._transaction(update)
+
+    def heartbeat(self, job_id: str, worker_id: str) -> bool:
+        """Extend a lease; False if the worker no longer holds it"""
+        return self._update_leased(job_id, worker_id, "lease_expires_at = ?", (time.time() + self.lease_seconds,))
+
+    def complete(self, job_id: str, worker_id: str, result: Optional[Dict[str, Any]] = None) -> bool:
+        """Mark a leased job as succeeded; False if the lease was lost"""
+        return self._update_leased(
+            job_id, worker_id,
+            "status = ?, lease_owner = NULL, lease_expires_at = NULL, last_error = NULL, result = ?",
+            (SUCCEEDED, json.dumps(result or {}))
+        )
+
+    def fail(self, job_id: str, worker_id: str, error: str, retryable: bool = True) -> bool:
+        """Record a failed attempt
+
+        The job is retried after an exponential backoff, or dead-lettered
+        once it has used all its attempts (or at once if not retryable).
+
+        Returns:
+            False if the worker no longer held the lease
+        """
+        def update(conn: sqlite3.Connection) -> bool:
+            row = conn.execute(
+                "SELECT attempts, max_attempts FROM jobs WHERE id = ? AND status = ? AND lease_owner = ?",
+                (job_id, LEASED, worker_id)
+            ).fetchone()
+            if row is None:
+                return False
+
+            now = time.time()
+            if not retryable or row['attempts'] >= row['max_attempts']:
+                status, available_at = DEAD, now
+            else:
+                status, available_at = QUEUED, now + self.retry_delay * 2 ** (row['attempts'] - 1)
+            conn.execute(
+                "UPDATE jobs SET status = ?, available_at = ?, lease_owner = NULL, lease_expires_at = NULL, "
+                "last_error = ?, updated_at = ? WHERE id = ?",
+                (status, available_at, error, now, job_id)
+            )
+            return True
+
+        return self._transaction(update)
+
+    def release(self, job_id: str, worker_id: str) -> bool:
+        """Return a leased job without counting the attempt (e.g. on shutdown)"""
+        return self._update_leased(
+            job_id, worker_id,
+            "status = ?, attempts = attempts - 1, available_at = ?, lease_owner = NULL, lease_expires_at = NULL",
+            (QUEUED, time.time())
+        )
+
+    def requeue_dead(self, job_ids: Optional[List[str]] = None) -> int:
+        """Move dead-lettered jobs back to the queue with fresh attempts
+
+        Args:
+            job_ids: Jobs to requeue (default: every dead job)
+
+        Returns:
+            Number of jobs requeued
+        """
+        def update(conn: sqlite3.Connection) -> int:
+            sql = "UPDATE jobs SET status = ?, attempts = 0, available_at = ?, updated_at = ? WHERE status = ?"
+            params: List[Any] = [QUEUED, time.time(), time.time(), DEAD]
+            if job_ids is not None:
+                sql += f" AND id IN ({','.join('?' * len(job_ids))})"
+                params.extend(job_ids)
+            return conn.execute(sql, params).rowcount
+
+        return self._transaction(update)
+
+    def get(self, job_id: str) -> Optional[QueuedJob]:
+        """Get a job by ID"""
+        with self._lock:
+            row = self._conn.execute("SELECT * FROM jobs WHERE id = ?", (job_id,)).fetchone()
+        return QueuedJob.from_row(row) if row else None
+
+    def list_jobs(self, status: Optional[str] = None, limit: int = 100) -> List[QueuedJob]:
+        """List jobs, newest first
+
+        Args:
+            status: Optional status to filter by
+            limit: Maximum number of jobs to return
+        """
+        sql = "SELECT * FROM jobs"
+        params: List[Any] = []
+        if status is not None:
+            sql += " WHERE status = ?"
+            params.append(status)
+        sql += " ORDER BY created_at DESC LIMIT ?"
+        params.append(limit)
+        with self._lock:
+            rows = self._conn.execute(sql, params).fetchall()
+        return [QueuedJob.from_row(row) for row in rows]
+
+    def stats(self) -> Dict[str, int]:
+        """Number of jobs in each state"""
+        with self._lock:
+            rows = self._conn.execute("SELECT status, COUNT(*) AS count FROM jobs GROUP BY status").fetchall()
+        counts = {status: 0 for status in (QUEUED, LEASED, SUCCEEDED, DEAD)}
+        counts.update({row['status']: row['count'] for row in rows})
+        return counts
+
+    def close(self) -> None:
+        """Close the database connection"""
+        with self._lock:
+            self._conn.close()
@@ -0,0 +1,209 @@
+"""
+Queue Worker - Runs queued generation jobs with a ConversationOrchestrator
+"""
+import asyncio
+import os
+import signal
+import socket
+from typing import Dict, Any, Optional
+
+from ..models import BatchJob, BatchResult, ConversationConfig
+from ..services.local_orchestrator import ConversationOrchestrator
+from ..services.persona_service import PersonaService
+from .job_queue import JobQueue, QueuedJob
+
+
+class QueueWorker:
+    """Pulls jobs from a JobQueue and generates them
+
+    A job's queue ID doubles as its conversation ID and conversations are
+    checkpointed, so a retried job (or one taken over after its worker
+    died) resumes from its last finished turn.
+    """
+
+    def __init__(
+        self,
+        queue: JobQueue,
+        orchestrator: ConversationOrchestrator,
+        persona_service: PersonaService,
+        base_config: Optional[ConversationConfig] = None,
+        worker_id: Optional[str] = None,
+        concurrency: int = 2,
+        poll_interval: float = 2.0,
+        save: bool = True,
+        verbose: bool = True
+    ):
+        """Initialize the worker
+
+        Args:
+            queue: Queue to pull jobs from
+            orchestrator: Orchestrator that generates the conversations
+            persona_service: Loaded personas, to resolve the jobs' persona IDs
+            base_config: Config each job's overrides are applied to
+            worker_id: Lease owner name (default: host:pid)
+            concurrency: Jobs generated at once
+            poll_interval: Seconds between polls of an empty queue
+            save: Whether to save each conversation to storage
+            verbose: Print progress output
+        """
+        self.queue = queue
+        self.orchestrator = orchestrator
+        self.persona_service = persona_service
+        self.base_config = base_config or ConversationConfig()
+        self.worker_id = worker_id or f"{socket.gethostname()}:{os.getpid()}"
+        self.concurrency = max(1, concurrency)
+        self.poll_interval = poll_interval
+        self.save = save
+        self.verbose = verbose
+
+        self.processed: Dict[str, int] = {"succeeded": 0, "failed": 0, "released": 0}
+
+    def _log(self, message: str) -> None:
+        """Print progress output when running in verbose mode"""
+        if self.verbose:
+            print(message)
+
+    def _build_job(self, queued: QueuedJob) -> BatchJob:
+        """Resolve a queued job's personas and config
+
+        Raises:
+            ValueError: If a persona ID is unknown
+        """
+        customer_persona = self.persona_service.get_customer_persona(queued.customer_persona_id)
+        if customer_persona is None:
+            raise ValueError(f"Customer persona '{queued.customer_persona_id}' not found")
+        support_persona = self.persona_service.get_support_persona(queued.support_persona_id)
+        if support_persona is None:
+            raise ValueError(f"Support persona '{queued.support_persona_id}' not found")
+
+        # Checkpoints make retries resume instead of starting over
+        config = ConversationConfig.from_dict({**self.base_config.to_dict(), **queued.config, 'checkpoint': True})
+        return BatchJob(
+            customer_persona=customer_persona,
+            support_persona=support_persona,
+            config=config,
+            job_id=queued.id,
+            metadata={**queued.metadata, 'queue_job_id': queued.id, 'attempt': queued.attempts}
+        )
+
+    async def _call(self, method, *args) -> Any:
+        """Run a blocking queue call off the event loop"""
+        return await asyncio.get_running_loop().run_in_executor(None, method, *args)
+
+    async def _heartbeat(self, queued: QueuedJob, task: asyncio.Task) -> None:
+        """Keep a job's lease alive, cancelling the job if the lease is lost"""
+        while True:
+            await asyncio.sleep(self.queue.lease_seconds / 3)
+            if not await self._call(self.queue.heartbeat, queued.id, self.worker_id):
+                self._log(f"  ⚠️  Lost the lease on {queued.id}, abandoning it")
+                task.cancel()
+                return
+
+    async def _process(self, queued: QueuedJob, stop_event: asyncio.Event) -> None:
+        """Generate one leased job and record its outcome in the queue"""
+        try:
+            job = self._build_job(queued)
+        except ValueError as e:
+            # Retrying won't find the persona; dead-letter right away
+            await self._call(self.queue.fail, queued.id, self.worker_id, str(e), False)
+            self.processed["failed"] += 1
+            self._log(f"  ☠️  {queued.id}: {e}")
+            return
+
+        task = asyncio.create_task(
+            self.orchestrator.run_job(job, save=self.save, resume=True, stop_event=stop_event)
+        )
+        heartbeat = asyncio.create_task(self._heartbeat(queued, task))
+        try:
+            result: BatchResult = await task
+        except asyncio.CancelledError:
+            # Abandoned after a lost lease; anything else is a real cancellation
+            if heartbeat.done() and not heartbeat.cancelled():
+                return
+            raise
+        finally:
+            heartbeat.cancel()
+
+        if result.succeeded:
+            await self._call(self.queue.complete, queued.id, self.worker_id, {
+                "storage_paths": result.storage_paths,
+                "total_turns": len(result.conversation.turns),
+                "cost_usd": result.metrics.total_cost_usd if result.metrics else 0,
+                "duration_seconds": result.duration_seconds
+            })
+            self.processed["succeeded"] += 1
+            self._log(f"  ✅ {queued.id} {queued.customer_persona_id}: "
+                      f"{len(result.conversation.turns)} turns ({result.duration_seconds:.1f}s)")
+        elif stop_event.is_set():
+            # Shutting down; the checkpoint lets another worker pick it up
+            await self._call(self.queue.release, queued.id, self.worker_id)
+            self.processed["released"] += 1
+            self._log(f"  ⏸️  {queued.id}: released")
+        else:
+            await self._call(self.queue.fail, queued.id, self.worker_id, result.error)
+            self.processed["failed"] += 1
+            self._log(f"  ❌ {queued.id} (attempt {queued.attempts}/{queued.max_attempts}): {result.error}")
+
+    async def run(self, drain: bool = False) -> Dict[str, int]:
+        """Process jobs until stopped (or, with drain, until the queue is empty)
+
+        The first Ctrl-C stops leasing and lets in-flight conversations stop
+        at their next turn boundary, then releases them to the queue; a
+        second Ctrl-C cancels them (their leases expire and another worker
+        takes over).
+
+        Args:
+            drain: Exit once no job is ready and none is in flight
+
+        Returns:
+            Counts of succeeded, failed and released jobs
+        """
+        stop_event = asyncio.Event()
+        running: Dict[asyncio.Task, QueuedJob] = {}
+
+        def on_interrupt():
+            if stop_event.is_set():
+                self._log("\n⛔ Interrupted again, cancelling in-flight jobs...")
+                for task in list(running):
+                    task.cancel()
+            else:
+                self._log("\n⏸️  Stopping, finishing current turns (Ctrl-C again to abort)...")
+                stop_event.set()
+
+        loop = asyncio.get_running_loop()
+        try:
+            loop.add_signal_handler(signal.SIGINT, on_interrupt)
+            handles_signal = True
+        except (NotImplementedError, RuntimeError):
+            handles_signal = False
+
+        self._log(f"👷 Worker {self.worker_id} polling {self.queue.path} (concurrency: {self.concurrency})")
+        await self.orchestrator.warm_up(self.concurrency)
+        try:
+            while not stop_event.is_set():
+                free = self.concurrency - len(running)
+                leased = await self._call(self.queue.lease, self.worker_id, free) if free else []
+                for queued in leased:
+                    task = asyncio.create_task(self._process(queued, stop_event))
+                    running[task] = queued
+                    task.add_done_callback(running.pop)
+
+                if not running and not leased and drain:
+                    break
+
+                # Wake up when a slot frees up, on shutdown, or to poll again
+                stop_waiter = asyncio.create_task(stop_event.wait())
+                await asyncio.wait(
+                    {stop_waiter, *running},
+                    timeout=self.poll_interval,
+                    return_when=asyncio.FIRST_COMPLETED
+                )
+                stop_waiter.cancel()
+
+            if running:
+                await asyncio.gather(*running, return_exceptions=True)
+        finally:
+            if handles_signal:
+                loop.remove_signal_handler(signal.SIGINT)
+
+        return dict(self.processed)
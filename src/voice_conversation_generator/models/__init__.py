@@ -16,6 +16,14 @@ from .conversation import (
     ConversationConfig
 )
 from .metrics import ConversationMetrics
+from .batch import BatchJob, BatchResult, BatchBudget, BatchRunReport
+from .events import (
+    ConversationEvent,
+    TurnTextReady,
+    TurnAudioReady,
+    MetricsUpdated,
+    ConversationFinished
+)
 
 __all__ = [
     # Persona models
@@ -33,5 +41,18 @@ __all__ = [
     "ConversationConfig",
 
     # Metrics
-    "ConversationMetrics"
+    "ConversationMetrics",
+
+    # Batch models
+    "BatchJob",
+    "BatchResult",
+    "BatchBudget",
+    "BatchRunReport",
+
+    # Generation events
+    "ConversationEvent",
+    "TurnTextReady",
+    "TurnAudioReady",
+    "MetricsUpdated",
+    "ConversationFinished"
 ]
\ No newline at end of file
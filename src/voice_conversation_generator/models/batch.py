@@ -0,0 +1,160 @@
+"""
+Batch Model - Defines jobs and results for batch conversation generation
+"""
+from typing import Dict, Any, List, Optional
+from dataclasses import dataclass, field
+
+from .conversation import Conversation, ConversationConfig
+from .metrics import ConversationMetrics
+from .persona import CustomerPersona, SupportPersona
+
+
+@dataclass
+class BatchJob:
+    """A single conversation to generate as part of a batch"""
+    customer_persona: CustomerPersona
+    support_persona: SupportPersona
+    config: Optional[ConversationConfig] = None
+
+    # Stable identifier for the job (also used as the conversation ID)
+    job_id: Optional[str] = None
+    metadata: Dict[str, Any] = field(default_factory=dict)
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert to dictionary for JSON serialization"""
+        return {
+            "job_id": self.job_id,
+            "customer_persona_id": self.customer_persona.id,
+            "support_persona_id": self.support_persona.id,
+            "config": self.config.to_dict() if self.config else None,
+            "metadata": self.metadata
+        }
+
+
+@dataclass
+class BatchResult:
+    """Outcome of a single batch job"""
+    job: BatchJob
+    conversation: Optional[Conversation] = None
+    metrics: Optional[ConversationMetrics] = None
+    storage_paths: Dict[str, str] = field(default_factory=dict)
+    error: Optional[str] = None
+    duration_seconds: float = 0
+
+    @property
+    def succeeded(self) -> bool:
+        """Whether the conversation was generated without errors"""
+        return self.error is None and self.conversation is not None
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert to dictionary for JSON serialization"""
+        return {
+            "job": self.job.to_dict(),
+            "conversation_id": self.conversation.id if self.conversation else None,
+            "total_turns": len(self.conversation.turns) if self.conversation else 0,
+            "storage_paths": self.storage_paths,
+            "error": self.error,
+            "duration_seconds": self.duration_seconds
+        }
+
+
+@dataclass
+class BatchBudget:
+    """Spending cap shared by every conversation in a batch"""
+    limit_usd: float
+    spent_usd: float = 0
+
+    @property
+    def exhausted(self) -> bool:
+        """Whether the batch has spent its whole budget"""
+        return self.spent_usd >= self.limit_usd
+
+    def add(self, cost_usd: float) -> None:
+        """Count the estimated cost of one provider call"""
+        self.spent_usd += cost_usd
+
+
+@dataclass
+class BatchRunReport:
+    """Run-level totals for a batch, merged across every job (and process)"""
+    run_id: str
+    total_jobs: int = 0
+    succeeded: int = 0
+    processes: int = 1
+    wall_time_seconds: float = 0
+
+    # Usage totals over every job that produced metrics
+    llm_calls: int = 0
+    total_tokens: int = 0
+    cached_tokens: int = 0
+    llm_cache_hits: int = 0
+    tts_characters: int = 0
+    total_cost_usd: float = 0
+    retries: int = 0
+    turns_missing_audio: int = 0
+
+    # Shared rate limiter state and per-process provider state
+    rate_limits: Dict[str, Dict[str, Any]] = field(default_factory=dict)
+    shards: List[Dict[str, Any]] = field(default_factory=list)
+
+    results: List[Dict[str, Any]] = field(default_factory=list)
+
+    @property
+    def failed(self) -> int:
+        """Number of jobs that did not produce a conversation"""
+        return self.total_jobs - self.succeeded
+
+    @property
+    def conversations_per_minute(self) -> float:
+        """Batch throughput"""
+        return self.total_jobs / self.wall_time_seconds * 60 if self.wall_time_seconds > 0 else 0.0
+
+    @classmethod
+    def from_results(
+        cls,
+        run_id: str,
+        results: List[BatchResult],
+        wall_time_seconds: float,
+        processes: int = 1
+    ) -> 'BatchRunReport':
+        """Build the report from the results of every job in the run"""
+        metrics = [r.metrics for r in results if r.metrics]
+        return cls(
+            run_id=run_id,
+            total_jobs=len(results),
+            succeeded=sum(1 for r in results if r.succeeded),
+            processes=processes,
+            wall_time_seconds=wall_time_seconds,
+            llm_calls=sum(m.llm_calls for m in metrics),
+            total_tokens=sum(m.total_tokens for m in metrics),
+            cached_tokens=sum(m.cached_tokens for m in metrics),
+            llm_cache_hits=sum(m.llm_cache_hits for m in metrics),
+            tts_characters=sum(m.tts_characters for m in metrics),
+            total_cost_usd=sum(m.total_cost_usd for m in metrics),
+            retries=sum(m.llm_retries + m.tts_retries for m in metrics),
+            turns_missing_audio=sum(m.turns_missing_audio for m in metrics),
+            results=[r.to_dict() for r in results]
+        )
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert to dictionary for JSON serialization"""
+        return {
+            "run_id": self.run_id,
+            "total_jobs": self.total_jobs,
+            "succeeded": self.succeeded,
+            "failed": self.failed,
+            "processes": self.processes,
+            "wall_time_seconds": self.wall_time_seconds,
+            "conversations_per_minute": self.conversations_per_minute,
+            "llm_calls": self.llm_calls,
+            "total_tokens": self.total_tokens,
+            "cached_tokens": self.cached_tokens,
+            "llm_cache_hits": self.llm_cache_hits,
+            "tts_characters": self.tts_characters,
+            "total_cost_usd": self.total_cost_usd,
+            "retries": self.retries,
+            "turns_missing_audio": self.turns_missing_audio,
+            "rate_limits": self.rate_limits,
+            "shards": self.shards,
+            "results": self.results
+        }
@@ -29,6 +29,10 @@ class Turn:
 
     # Metrics for this turn
     latency_ms: Optional[float] = None
+    time_to_first_token_ms: Optional[float] = None
+    time_to_first_audio_ms: Optional[float] = None
+    # Per-stage breakdown: prompt_build, llm, tts, audio_encode, storage_write
+    stage_timings_ms: Dict[str, float] = field(default_factory=dict)
     interruption: bool = False
     speech_rate_wpm: Optional[float] = None
 
@@ -44,6 +48,9 @@ class Turn:
             "timestamp": self.timestamp.isoformat() if self.timestamp else None,
             "metadata": self.metadata,
             "latency_ms": self.latency_ms,
+            "time_to_first_token_ms": self.time_to_first_token_ms,
+            "time_to_first_audio_ms": self.time_to_first_audio_ms,
+            "stage_timings_ms": self.stage_timings_ms,
             "interruption": self.interruption,
             "speech_rate_wpm": self.speech_rate_wpm
         }
@@ -70,6 +77,9 @@ class Turn:
             timestamp=timestamp,
             metadata=data.get("metadata", {}),
             latency_ms=data.get("latency_ms"),
+            time_to_first_token_ms=data.get("time_to_first_token_ms"),
+            time_to_first_audio_ms=data.get("time_to_first_audio_ms"),
+            stage_timings_ms=data.get("stage_timings_ms", {}),
             interruption=data.get("interruption", False),
             speech_rate_wpm=data.get("speech_rate_wpm")
         )
@@ -86,6 +96,33 @@ class ConversationConfig:
     stt_provider: Optional[str] = None
     temperature: float = 0.8
     max_tokens: int = 150
+    # text: history pasted into one prompt; messages: byte-stable system
+    # prompt plus the turns as chat messages, so provider prompt caching hits
+    prompt_mode: str = "text"
+
+    # Per-role LLM routing, so the simulated customer can run on a cheaper,
+    # faster model than the support agent under evaluation. None falls back
+    # to the shared setting; a provider is the name of an extra LLM section
+    # (providers.named_llms) and a model overrides that provider's model.
+    customer_llm_provider: Optional[str] = None
+    customer_llm_model: Optional[str] = None
+    customer_temperature: Optional[float] = None
+    customer_max_tokens: Optional[int] = None
+    support_llm_provider: Optional[str] = None
+    support_llm_model: Optional[str] = None
+    support_temperature: Optional[float] = None
+    support_max_tokens: Optional[int] = None
+
+    # Audio generation settings
+    audio_mode: str = "pipelined"  # pipelined, streaming, script_first, text_only
+    tts_concurrency: int = 4  # Max parallel TTS requests per provider when rendering a script
+    checkpoint: bool = False  # Checkpoint after every turn so generation can be resumed
+    budget_usd: Optional[float] = None  # Stop generating turns once estimated cost reaches this
+
+    # Deadlines in seconds (None = no limit)
+    request_timeout: Optional[float] = None  # Per LLM/TTS request, including its retries
+    turn_timeout: Optional[float] = None  # Per turn's text (prompt build and LLM)
+    conversation_timeout: Optional[float] = None  # Whole conversation; ends it as partial
 
     # LiveKit simulation settings
     simulate_livekit: bool = False
@@ -104,12 +141,48 @@ class ConversationConfig:
             "stt_provider": self.stt_provider,
             "temperature": self.temperature,
             "max_tokens": self.max_tokens,
+            "prompt_mode": self.prompt_mode,
+            "customer_llm_provider": self.customer_llm_provider,
+            "customer_llm_model": self.customer_llm_model,
+            "customer_temperature": self.customer_temperature,
+            "customer_max_tokens": self.customer_max_tokens,
+            "support_llm_provider": self.support_llm_provider,
+            "support_llm_model": self.support_llm_model,
+            "support_temperature": self.support_temperature,
+            "support_max_tokens": self.support_max_tokens,
+            "audio_mode": self.audio_mode,
+            "tts_concurrency": self.tts_concurrency,
+            "checkpoint": self.checkpoint,
+            "budget_usd": self.budget_usd,
+            "request_timeout": self.request_timeout,
+            "turn_timeout": self.turn_timeout,
+            "conversation_timeout": self.conversation_timeout,
             "simulate_livekit": self.simulate_livekit,
             "add_network_latency": self.add_network_latency,
             "min_latency_ms": self.min_latency_ms,
             "max_latency_ms": self.max_latency_ms
         }
 
+    def llm_settings(self, role: str) -> Dict[str, Any]:
+        """LLM settings for one side of the conversation
+
+        Args:
+            role: 'customer' or 'support'
+
+        Returns:
+            Dictionary with provider (None for the default LLM provider),
+            model (None for the provider's configured model), temperature
+            and max_tokens
+        """
+        temperature = getattr(self, f"{role}_temperature")
+        max_tokens = getattr(self, f"{role}_max_tokens")
+        return {
+            "provider": getattr(self, f"{role}_llm_provider"),
+            "model": getattr(self, f"{role}_llm_model"),
+            "temperature": self.temperature if temperature is None else temperature,
+            "max_tokens": self.max_tokens if max_tokens is None else max_tokens
+        }
+
     @classmethod
     def from_dict(cls, data: Dict[str, Any]) -> 'ConversationConfig':
         """Create from dictionary"""
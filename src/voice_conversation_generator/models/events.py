@@ -0,0 +1,74 @@
+"""
+Event Models - Progress events emitted while a conversation is generated
+"""
+from typing import Dict, Any, ClassVar
+from dataclasses import dataclass
+
+from .conversation import Conversation, Turn
+from .metrics import ConversationMetrics
+
+
+@dataclass
+class ConversationEvent:
+    """Base class of every generation event"""
+    conversation_id: str
+
+    # Event name used when serialized (e.g. for a web UI)
+    type: ClassVar[str] = "event"
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert to dictionary for JSON serialization"""
+        return {"type": self.type, "conversation_id": self.conversation_id}
+
+
+@dataclass
+class TurnTextReady(ConversationEvent):
+    """A turn's text is final (its audio may still be rendering)"""
+    turn: Turn
+
+    type: ClassVar[str] = "turn_text"
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert to dictionary for JSON serialization"""
+        return {**super().to_dict(), "turn": self.turn.to_dict()}
+
+
+@dataclass
+class TurnAudioReady(ConversationEvent):
+    """A turn's audio has been rendered (turn.audio_data is set)"""
+    turn: Turn
+
+    type: ClassVar[str] = "turn_audio"
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert to dictionary for JSON serialization"""
+        return {**super().to_dict(), "turn": self.turn.to_dict(include_audio=True)}
+
+
+@dataclass
+class MetricsUpdated(ConversationEvent):
+    """Usage or timing metrics changed (after a turn's text or audio)"""
+    metrics: ConversationMetrics
+
+    type: ClassVar[str] = "metrics"
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert to dictionary for JSON serialization"""
+        return {**super().to_dict(), "metrics": self.metrics.to_dict()}
+
+
+@dataclass
+class ConversationFinished(ConversationEvent):
+    """Generation is complete; always the last event of a stream"""
+    conversation: Conversation
+    metrics: ConversationMetrics
+
+    type: ClassVar[str] = "finished"
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert to dictionary for JSON serialization"""
+        return {
+            **super().to_dict(),
+            "conversation": self.conversation.to_dict(include_turns=False),
+            "metrics": self.metrics.to_dict()
+        }
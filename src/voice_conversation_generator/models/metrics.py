@@ -23,6 +23,18 @@ class ConversationMetrics:
     min_latency_ms: float = 0
     latency_percentile_95: float = 0
 
+    # Streaming latency metrics (measured from the start of each LLM request)
+    average_ttft_ms: float = 0
+    ttft_percentile_95: float = 0
+    average_ttfa_ms: float = 0
+    ttfa_percentile_95: float = 0
+
+    # Per-stage latency breakdown (prompt_build, llm, tts, audio_encode, storage_write)
+    # stage_percentiles maps stage -> {'p50': ..., 'p95': ..., 'p99': ...}
+    stage_percentiles: Dict[str, Dict[str, float]] = field(default_factory=dict)
+    audio_combine_ms: float = 0
+    storage_write_ms: float = 0
+
     # Speech metrics
     average_speech_rate_wpm: float = 0
     interruption_count: int = 0
@@ -45,6 +57,37 @@ class ConversationMetrics:
     llm_provider: str = ""
     llm_model: str = ""
 
+    # Usage and cost (estimated from provider list prices)
+    llm_calls: int = 0
+    prompt_tokens: int = 0
+    completion_tokens: int = 0
+    cached_tokens: int = 0
+    tts_requests: int = 0
+    tts_characters: int = 0
+    failed_tts_requests: int = 0
+    tts_hedged_requests: int = 0
+    tts_hedge_wins: int = 0
+    # Characters and cost of hedge races' losing requests (included in tts_cost_usd)
+    tts_hedge_extra_characters: int = 0
+    tts_hedge_extra_cost_usd: float = 0
+    llm_cost_usd: float = 0
+    tts_cost_usd: float = 0
+    # Per conversation role: model, calls, tokens and cost
+    llm_usage_by_role: Dict[str, Dict[str, Any]] = field(default_factory=dict)
+
+    # Adaptive provider concurrency (provider key -> limit, in_flight, overloads, ...)
+    provider_limits: Dict[str, Dict[str, Any]] = field(default_factory=dict)
+
+    # Resilience (retries of transient failures, turns left without audio)
+    llm_retries: int = 0
+    tts_retries: int = 0
+    turns_missing_audio: int = 0
+    circuit_breakers: Dict[str, Dict[str, Any]] = field(default_factory=dict)
+
+    # Persistent LLM response cache (hits cost no tokens)
+    llm_cache_hits: int = 0
+    llm_cache_misses: int = 0
+
     # Timestamps
     started_at: Optional[datetime] = None
     completed_at: Optional[datetime] = None
@@ -52,6 +95,18 @@ class ConversationMetrics:
     # Per-turn metrics storage
     turn_latencies: List[float] = field(default_factory=list)
     turn_speech_rates: List[float] = field(default_factory=list)
+    turn_ttft_ms: List[float] = field(default_factory=list)
+    turn_ttfa_ms: List[float] = field(default_factory=list)
+    stage_latencies: Dict[str, List[float]] = field(default_factory=dict)
+
+    STAGES = ['prompt_build', 'llm', 'tts', 'audio_encode', 'storage_write']
+
+    @staticmethod
+    def _percentile(values: List[float], percentile: float) -> float:
+        """Nearest-rank percentile of a list of values"""
+        sorted_values = sorted(values)
+        idx = int(len(sorted_values) * percentile)
+        return sorted_values[min(idx, len(sorted_values) - 1)]
 
     def calculate_aggregates(self):
         """Calculate aggregate metrics from turn data"""
@@ -65,23 +120,128 @@ class ConversationMetrics:
             idx = int(len(sorted_latencies) * 0.95)
             self.latency_percentile_95 = sorted_latencies[idx] if idx < len(sorted_latencies) else self.max_latency_ms
 
+        if self.turn_ttft_ms:
+            self.average_ttft_ms = sum(self.turn_ttft_ms) / len(self.turn_ttft_ms)
+            self.ttft_percentile_95 = self._percentile(self.turn_ttft_ms, 0.95)
+
+        if self.turn_ttfa_ms:
+            self.average_ttfa_ms = sum(self.turn_ttfa_ms) / len(self.turn_ttfa_ms)
+            self.ttfa_percentile_95 = self._percentile(self.turn_ttfa_ms, 0.95)
+
+        self.stage_percentiles = {
+            stage: {
+                "p50": self._percentile(values, 0.50),
+                "p95": self._percentile(values, 0.95),
+                "p99": self._percentile(values, 0.99)
+            }
+            for stage, values in self.stage_latencies.items()
+            if values
+        }
+
         if self.turn_speech_rates:
             self.average_speech_rate_wpm = sum(self.turn_speech_rates) / len(self.turn_speech_rates)
 
         if self.started_at and self.completed_at:
             self.total_duration_seconds = (self.completed_at - self.started_at).total_seconds()
 
-    def add_turn_metrics(self, latency_ms: float = None, speech_rate_wpm: float = None, is_interruption: bool = False):
+    @property
+    def total_cost_usd(self) -> float:
+        """Estimated LLM plus TTS cost in USD"""
+        return self.llm_cost_usd + self.tts_cost_usd
+
+    @property
+    def total_tokens(self) -> int:
+        """Prompt plus completion tokens across all LLM calls"""
+        return self.prompt_tokens + self.completion_tokens
+
+    def add_llm_usage(
+        self,
+        prompt_tokens: int = 0,
+        completion_tokens: int = 0,
+        cached_tokens: int = 0,
+        cost_usd: float = 0,
+        role: Optional[str] = None,
+        model: Optional[str] = None
+    ):
+        """Add token usage and cost for a single LLM call
+
+        Calls made for a role ('customer' or 'support') are also totalled
+        per role, to compare models routed to each side.
+        """
+        self.llm_calls += 1
+        self.prompt_tokens += prompt_tokens
+        self.completion_tokens += completion_tokens
+        self.cached_tokens += cached_tokens
+        self.llm_cost_usd += cost_usd
+
+        if role:
+            usage = self.llm_usage_by_role.setdefault(role, {
+                "model": model,
+                "calls": 0,
+                "prompt_tokens": 0,
+                "completion_tokens": 0,
+                "cost_usd": 0.0
+            })
+            usage["model"] = model or usage["model"]
+            usage["calls"] += 1
+            usage["prompt_tokens"] += prompt_tokens
+            usage["completion_tokens"] += completion_tokens
+            usage["cost_usd"] += cost_usd
+
+    @property
+    def prompt_cache_hit_rate(self) -> float:
+        """Fraction of prompt tokens served from the provider's prompt cache"""
+        return self.cached_tokens / self.prompt_tokens if self.prompt_tokens else 0.0
+
+    def add_tts_usage(self, characters: int = 0, cost_usd: float = 0):
+        """Add character usage and cost for a single TTS call"""
+        self.tts_requests += 1
+        self.tts_characters += characters
+        self.tts_cost_usd += cost_usd
+
+    def add_hedge_overhead(self, characters: int = 0, cost_usd: float = 0):
+        """Add the characters and cost of a hedge race's losing request"""
+        self.tts_hedge_extra_characters += characters
+        self.tts_hedge_extra_cost_usd += cost_usd
+        self.tts_cost_usd += cost_usd
+
+    def add_turn_metrics(
+        self,
+        latency_ms: float = None,
+        speech_rate_wpm: float = None,
+        is_interruption: bool = False,
+        ttft_ms: float = None,
+        ttfa_ms: float = None,
+        stage_timings_ms: Dict[str, float] = None
+    ):
         """Add metrics for a single turn"""
         if latency_ms is not None:
             self.turn_latencies.append(latency_ms)
 
+        if ttft_ms is not None:
+            self.turn_ttft_ms.append(ttft_ms)
+
+        if ttfa_ms is not None:
+            self.turn_ttfa_ms.append(ttfa_ms)
+
+        for stage, duration_ms in (stage_timings_ms or {}).items():
+            self.stage_latencies.setdefault(stage, []).append(duration_ms)
+
         if speech_rate_wpm is not None:
             self.turn_speech_rates.append(speech_rate_wpm)
 
         if is_interruption:
             self.interruption_count += 1
 
+    def reset_turn_metrics(self):
+        """Clear per-turn samples so they can be collected again from the turns"""
+        self.turn_latencies = []
+        self.turn_ttft_ms = []
+        self.turn_ttfa_ms = []
+        self.stage_latencies = {}
+        self.turn_speech_rates = []
+        self.interruption_count = 0
+
     def to_dict(self) -> Dict[str, Any]:
         """Convert to dictionary for JSON serialization"""
         return {
@@ -94,6 +254,13 @@ class ConversationMetrics:
             "max_latency_ms": self.max_latency_ms,
             "min_latency_ms": self.min_latency_ms,
             "latency_percentile_95": self.latency_percentile_95,
+            "average_ttft_ms": self.average_ttft_ms,
+            "ttft_percentile_95": self.ttft_percentile_95,
+            "average_ttfa_ms": self.average_ttfa_ms,
+            "ttfa_percentile_95": self.ttfa_percentile_95,
+            "stage_percentiles": self.stage_percentiles,
+            "audio_combine_ms": self.audio_combine_ms,
+            "storage_write_ms": self.storage_write_ms,
             "average_speech_rate_wpm": self.average_speech_rate_wpm,
             "interruption_count": self.interruption_count,
             "silence_duration_seconds": self.silence_duration_seconds,
@@ -108,10 +275,36 @@ class ConversationMetrics:
             "stt_provider": self.stt_provider,
             "llm_provider": self.llm_provider,
             "llm_model": self.llm_model,
+            "llm_calls": self.llm_calls,
+            "prompt_tokens": self.prompt_tokens,
+            "completion_tokens": self.completion_tokens,
+            "cached_tokens": self.cached_tokens,
+            "prompt_cache_hit_rate": round(self.prompt_cache_hit_rate, 4),
+            "tts_requests": self.tts_requests,
+            "tts_characters": self.tts_characters,
+            "failed_tts_requests": self.failed_tts_requests,
+            "tts_hedged_requests": self.tts_hedged_requests,
+            "tts_hedge_wins": self.tts_hedge_wins,
+            "tts_hedge_extra_characters": self.tts_hedge_extra_characters,
+            "tts_hedge_extra_cost_usd": self.tts_hedge_extra_cost_usd,
+            "llm_cost_usd": self.llm_cost_usd,
+            "tts_cost_usd": self.tts_cost_usd,
+            "total_cost_usd": self.total_cost_usd,
+            "llm_usage_by_role": self.llm_usage_by_role,
+            "provider_limits": self.provider_limits,
+            "llm_retries": self.llm_retries,
+            "tts_retries": self.tts_retries,
+            "turns_missing_audio": self.turns_missing_audio,
+            "circuit_breakers": self.circuit_breakers,
+            "llm_cache_hits": self.llm_cache_hits,
+            "llm_cache_misses": self.llm_cache_misses,
             "started_at": self.started_at.isoformat() if self.started_at else None,
             "completed_at": self.completed_at.isoformat() if self.completed_at else None,
             "turn_latencies": self.turn_latencies,
-            "turn_speech_rates": self.turn_speech_rates
+            "turn_speech_rates": self.turn_speech_rates,
+            "turn_ttft_ms": self.turn_ttft_ms,
+            "turn_ttfa_ms": self.turn_ttfa_ms,
+            "stage_latencies": self.stage_latencies
         }
 
     @classmethod
@@ -131,6 +324,13 @@ class ConversationMetrics:
             max_latency_ms=data.get("max_latency_ms", 0),
             min_latency_ms=data.get("min_latency_ms", 0),
             latency_percentile_95=data.get("latency_percentile_95", 0),
+            average_ttft_ms=data.get("average_ttft_ms", 0),
+            ttft_percentile_95=data.get("ttft_percentile_95", 0),
+            average_ttfa_ms=data.get("average_ttfa_ms", 0),
+            ttfa_percentile_95=data.get("ttfa_percentile_95", 0),
+            stage_percentiles=data.get("stage_percentiles", {}),
+            audio_combine_ms=data.get("audio_combine_ms", 0),
+            storage_write_ms=data.get("storage_write_ms", 0),
             average_speech_rate_wpm=data.get("average_speech_rate_wpm", 0),
             interruption_count=data.get("interruption_count", 0),
             silence_duration_seconds=data.get("silence_duration_seconds", 0),
@@ -145,10 +345,34 @@ class ConversationMetrics:
             stt_provider=data.get("stt_provider"),
             llm_provider=data.get("llm_provider", ""),
             llm_model=data.get("llm_model", ""),
+            llm_calls=data.get("llm_calls", 0),
+            prompt_tokens=data.get("prompt_tokens", 0),
+            completion_tokens=data.get("completion_tokens", 0),
+            cached_tokens=data.get("cached_tokens", 0),
+            tts_requests=data.get("tts_requests", 0),
+            tts_characters=data.get("tts_characters", 0),
+            failed_tts_requests=data.get("failed_tts_requests", 0),
+            tts_hedged_requests=data.get("tts_hedged_requests", 0),
+            tts_hedge_wins=data.get("tts_hedge_wins", 0),
+            tts_hedge_extra_characters=data.get("tts_hedge_extra_characters", 0),
+            tts_hedge_extra_cost_usd=data.get("tts_hedge_extra_cost_usd", 0),
+            llm_cost_usd=data.get("llm_cost_usd", 0),
+            tts_cost_usd=data.get("tts_cost_usd", 0),
+            llm_usage_by_role=data.get("llm_usage_by_role", {}),
+            provider_limits=data.get("provider_limits", {}),
+            llm_retries=data.get("llm_retries", 0),
+            tts_retries=data.get("tts_retries", 0),
+            turns_missing_audio=data.get("turns_missing_audio", 0),
+            circuit_breakers=data.get("circuit_breakers", {}),
+            llm_cache_hits=data.get("llm_cache_hits", 0),
+            llm_cache_misses=data.get("llm_cache_misses", 0),
             started_at=started_at,
             completed_at=completed_at,
             turn_latencies=data.get("turn_latencies", []),
-            turn_speech_rates=data.get("turn_speech_rates", [])
+            turn_speech_rates=data.get("turn_speech_rates", []),
+            turn_ttft_ms=data.get("turn_ttft_ms", []),
+            turn_ttfa_ms=data.get("turn_ttfa_ms", []),
+            stage_latencies=data.get("stage_latencies", {})
         )
 
         return metrics
@@ -171,6 +395,25 @@ class ConversationMetrics:
                 f"  95th percentile: {self.latency_percentile_95:.1f}ms"
             ])
 
+        if self.turn_ttft_ms or self.turn_ttfa_ms:
+            lines.extend([
+                f"",
+                f"Responsiveness:",
+                f"  Time to first token: {self.average_ttft_ms:.1f}ms avg, {self.ttft_percentile_95:.1f}ms p95",
+                f"  Time to first audio: {self.average_ttfa_ms:.1f}ms avg, {self.ttfa_percentile_95:.1f}ms p95"
+            ])
+
+        if self.stage_percentiles:
+            lines.extend([f"", f"Stage latency (p50 / p95 / p99):"])
+            stages = [s for s in self.STAGES if s in self.stage_percentiles]
+            stages += [s for s in self.stage_percentiles if s not in self.STAGES]
+            for stage in stages:
+                p = self.stage_percentiles[stage]
+                lines.append(f"  {stage}: {p['p50']:.1f}ms / {p['p95']:.1f}ms / {p['p99']:.1f}ms")
+
+        if self.audio_combine_ms or self.storage_write_ms:
+            lines.append(f"  audio combine: {self.audio_combine_ms:.1f}ms, storage write: {self.storage_write_ms:.1f}ms")
+
         if self.turn_speech_rates:
             lines.append(f"")
             lines.append(f"Average speech rate: {self.average_speech_rate_wpm:.1f} WPM")
@@ -178,6 +421,44 @@ class ConversationMetrics:
         if self.interruption_count > 0:
             lines.append(f"Interruptions: {self.interruption_count}")
 
+        if self.llm_calls or self.tts_requests:
+            lines.extend([
+                f"",
+                f"Usage:",
+                f"  LLM: {self.llm_calls} calls, {self.prompt_tokens} prompt tokens "
+                f"({self.cached_tokens} cached, {self.prompt_cache_hit_rate:.0%}), "
+                f"{self.completion_tokens} completion tokens"
+                + (f", {self.llm_cache_hits}/{self.llm_cache_hits + self.llm_cache_misses} served from cache"
+                   if self.llm_cache_hits or self.llm_cache_misses else ""),
+                f"  TTS: {self.tts_requests} requests, {self.tts_characters} characters"
+                + (f", {self.failed_tts_requests} failed" if self.failed_tts_requests else "")
+                + (f", {self.tts_hedged_requests} hedged ({self.tts_hedge_wins} won by the hedge, "
+                   f"{self.tts_hedge_extra_characters} extra characters, ${self.tts_hedge_extra_cost_usd:.4f})"
+                   if self.tts_hedged_requests else ""),
+                f"  Estimated cost: ${self.total_cost_usd:.4f} "
+                f"(LLM ${self.llm_cost_usd:.4f}, TTS ${self.tts_cost_usd:.4f})"
+            ])
+            for role, usage in self.llm_usage_by_role.items():
+                lines.append(
+                    f"  LLM {role} ({usage['model']}): {usage['calls']} calls, "
+                    f"{usage['prompt_tokens'] + usage['completion_tokens']} tokens, ${usage['cost_usd']:.4f}"
+                )
+
+        if self.provider_limits:
+            lines.extend([f"", f"Provider concurrency:"])
+            for name, state in self.provider_limits.items():
+                lines.append(f"  {name}: limit {state['limit']}, {state['overloads']} overloads")
+
+        if self.llm_retries or self.tts_retries or self.turns_missing_audio or self.circuit_breakers:
+            lines.extend([
+                f"",
+                f"Resilience:",
+                f"  Retries: {self.llm_retries} LLM, {self.tts_retries} TTS",
+                f"  Turns missing audio: {self.turns_missing_audio}"
+            ])
+            for name, state in self.circuit_breakers.items():
+                lines.append(f"  {name}: circuit {state['state']}, opened {state['times_opened']} times")
+
         lines.extend([
             f"",
             f"Outcomes:",
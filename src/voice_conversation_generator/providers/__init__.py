@@ -7,14 +7,29 @@ from .base import (
     STTProvider,
     StorageGateway
 )
+from .errors import ProviderError
+from .rate_limit import RateLimiter, RateLimitCoordinator, get_rate_limiter, set_rate_limit_coordinator
+from .resilience import (
+    CircuitBreaker,
+    CircuitOpenError,
+    RetryPolicy,
+    ResilientLLMProvider,
+    ResilientTTSProvider,
+    get_circuit_breaker
+)
+from .response_cache import CachingLLMProvider, CacheMissError, get_response_cache
+from .batching import BatchingLLMProvider
+from .pool import PooledLLMProvider
 
 # LLM Providers
 from .llm.openai import OpenAILLMProvider
+from .llm.mock import MockLLMProvider
 
 # TTS Providers
 from .tts.openai import OpenAITTSProvider
 from .tts.elevenlabs import ElevenLabsTTSProvider
 from .tts.cartesia import CartesiaTTSProvider
+from .tts.mock import MockTTSProvider
 
 # Storage Providers
 from .storage.local import LocalStorageProvider
@@ -25,14 +40,32 @@ __all__ = [
     "TTSProvider",
     "STTProvider",
     "StorageGateway",
+    "ProviderError",
+    "RateLimiter",
+    "RateLimitCoordinator",
+    "get_rate_limiter",
+    "set_rate_limit_coordinator",
+    "CircuitBreaker",
+    "CircuitOpenError",
+    "RetryPolicy",
+    "ResilientLLMProvider",
+    "ResilientTTSProvider",
+    "get_circuit_breaker",
+    "CachingLLMProvider",
+    "CacheMissError",
+    "get_response_cache",
+    "BatchingLLMProvider",
+    "PooledLLMProvider",
 
     # LLM implementations
     "OpenAILLMProvider",
+    "MockLLMProvider",
 
     # TTS implementations
     "OpenAITTSProvider",
     "ElevenLabsTTSProvider",
     "CartesiaTTSProvider",
+    "MockTTSProvider",
 
     # Storage implementations
     "LocalStorageProvider",
@@ -2,8 +2,9 @@
 Base provider classes - Abstract interfaces for all providers
 """
 from abc import ABC, abstractmethod
-from typing import Dict, Any, Optional, List
+from typing import Dict, Any, Optional, List, AsyncIterator
 from ..models import VoiceConfig, Conversation, ConversationMetrics
+from .rate_limit import RateLimiter
 
 
 class LLMProvider(ABC):
@@ -13,6 +14,9 @@ class LLMProvider(ABC):
         """Initialize with provider configuration"""
         self.config = config
 
+        # Shared request budget, attached by ProviderFactory from config['rate_limit']
+        self.rate_limiter: Optional[RateLimiter] = None
+
     @abstractmethod
     async def generate_completion(
         self,
@@ -29,7 +33,9 @@ class LLMProvider(ABC):
             system_prompt: Optional system prompt
             temperature: Temperature for sampling
             max_tokens: Maximum tokens to generate
-            **kwargs: Provider-specific parameters
+            **kwargs: Provider-specific parameters. A 'stats' dict, if given,
+                is filled with token usage ('prompt_tokens', 'completion_tokens',
+                'cached_tokens', 'model') and must not be forwarded to the API.
 
         Returns:
             Generated text response
@@ -50,18 +56,149 @@ class LLMProvider(ABC):
             messages: List of message dictionaries with 'role' and 'content'
             temperature: Temperature for sampling
             max_tokens: Maximum tokens to generate
-            **kwargs: Provider-specific parameters
+            **kwargs: Provider-specific parameters. A 'stats' dict, if given,
+                is filled with token usage ('prompt_tokens', 'completion_tokens',
+                'cached_tokens', 'model') and must not be forwarded to the API.
 
         Returns:
             Generated text response
         """
         pass
 
+    async def generate_completion_stream(
+        self,
+        prompt: str,
+        system_prompt: Optional[str] = None,
+        temperature: float = 0.8,
+        max_tokens: int = 150,
+        **kwargs
+    ) -> AsyncIterator[str]:
+        """Stream a text completion from the LLM token by token
+
+        Args:
+            prompt: The user prompt
+            system_prompt: Optional system prompt
+            temperature: Temperature for sampling
+            max_tokens: Maximum tokens to generate
+            **kwargs: Provider-specific parameters
+
+        Yields:
+            Text fragments as they are generated
+        """
+        messages = []
+        if system_prompt:
+            messages.append({"role": "system", "content": system_prompt})
+        messages.append({"role": "user", "content": prompt})
+
+        async for token in self.generate_chat_completion_stream(
+            messages=messages,
+            temperature=temperature,
+            max_tokens=max_tokens,
+            **kwargs
+        ):
+            yield token
+
+    async def generate_chat_completion_stream(
+        self,
+        messages: List[Dict[str, str]],
+        temperature: float = 0.8,
+        max_tokens: int = 150,
+        **kwargs
+    ) -> AsyncIterator[str]:
+        """Stream a chat completion from the LLM token by token
+
+        Providers without native streaming yield the full reply as one chunk.
+
+        Args:
+            messages: List of message dictionaries with 'role' and 'content'
+            temperature: Temperature for sampling
+            max_tokens: Maximum tokens to generate
+            **kwargs: Provider-specific parameters
+
+        Yields:
+            Text fragments as they are generated
+        """
+        yield await self.generate_chat_completion(
+            messages=messages,
+            temperature=temperature,
+            max_tokens=max_tokens,
+            **kwargs
+        )
+
+    async def warm_up(self, connections: int = 1) -> None:
+        """Open connections ahead of the first request
+
+        Called by the CLI and batch runner so the first turn doesn't pay for
+        DNS, TLS and connection setup. Providers without a network
+        connection keep this no-op.
+
+        Args:
+            connections: Connections to open (about the expected concurrency)
+        """
+        return None
+
     @abstractmethod
     def get_model_name(self) -> str:
         """Get the name of the model being used"""
         pass
 
+    def get_pricing(self, model: Optional[str] = None) -> Dict[str, float]:
+        """Get token prices for a model
+
+        Args:
+            model: Model name (defaults to the configured model)
+
+        Returns:
+            USD per 1M tokens keyed by 'input', 'cached_input' and 'output'
+            (empty when unknown, which makes every request cost 0)
+        """
+        return self.config.get('pricing') or {}
+
+    def estimate_cost(self, usage: Dict[str, Any]) -> float:
+        """Estimate the USD cost of one request from its usage stats
+
+        Args:
+            usage: Stats filled in by a completion call
+
+        Returns:
+            Estimated cost in USD
+        """
+        pricing = self.get_pricing(usage.get('model'))
+        if not pricing:
+            return 0.0
+
+        cached = usage.get('cached_tokens', 0)
+        uncached = usage.get('prompt_tokens', 0) - cached
+        return (
+            uncached * pricing.get('input', 0)
+            + cached * pricing.get('cached_input', pricing.get('input', 0))
+            + usage.get('completion_tokens', 0) * pricing.get('output', 0)
+        ) / 1_000_000
+
+    async def _throttle(self, messages: List[Dict[str, str]], max_tokens: int) -> float:
+        """Wait for the rate limiter (if any) to admit one request
+
+        Args:
+            messages: Request messages, used to estimate prompt tokens
+            max_tokens: Completion token limit of the request
+
+        Returns:
+            Tokens reserved for the request (pass to _settle_rate_limit)
+        """
+        if self.rate_limiter is None:
+            return 0
+
+        # Roughly four characters per token, plus the full completion budget
+        estimated = sum(len(m.get('content') or '') for m in messages) / 4 + max_tokens
+        await self.rate_limiter.acquire(estimated)
+        return estimated
+
+    def _settle_rate_limit(self, estimated_tokens: float, usage: Dict[str, Any]) -> None:
+        """Correct the reserved tokens with the usage the provider reported"""
+        if self.rate_limiter is not None and 'prompt_tokens' in usage:
+            actual = usage['prompt_tokens'] + usage.get('completion_tokens', 0)
+            self.rate_limiter.settle(estimated_tokens, actual)
+
 
 class TTSProvider(ABC):
     """Abstract base class for Text-to-Speech providers"""
@@ -70,6 +207,9 @@ class TTSProvider(ABC):
         """Initialize with provider configuration"""
         self.config = config
 
+        # Shared request budget, attached by ProviderFactory from config['rate_limit']
+        self.rate_limiter: Optional[RateLimiter] = None
+
     @abstractmethod
     async def generate_speech(
         self,
@@ -82,13 +222,27 @@ class TTSProvider(ABC):
         Args:
             text: Text to convert to speech
             voice_config: Voice configuration settings
-            **kwargs: Provider-specific parameters
+            **kwargs: Provider-specific parameters. A 'stats' dict, if given,
+                is filled with per-call telemetry ('characters', 'model',
+                'audio_encode_ms') and must not be forwarded to the provider API.
 
         Returns:
             Audio data as bytes
         """
         pass
 
+    async def warm_up(self, connections: int = 1) -> None:
+        """Open connections ahead of the first request
+
+        Called by the CLI and batch runner so the first turn doesn't pay for
+        DNS, TLS and connection setup. Providers without a network
+        connection keep this no-op.
+
+        Args:
+            connections: Connections to open (about the expected concurrency)
+        """
+        return None
+
     @abstractmethod
     def get_supported_voices(self) -> List[str]:
         """Get list of supported voice IDs"""
@@ -99,6 +253,34 @@ class TTSProvider(ABC):
         """Get the name of the TTS provider"""
         pass
 
+    def get_pricing(self, model: Optional[str] = None) -> Dict[str, float]:
+        """Get speech prices for a model
+
+        Args:
+            model: Model name (defaults to the configured model)
+
+        Returns:
+            USD per 1M characters under 'characters' (empty when unknown)
+        """
+        return self.config.get('pricing') or {}
+
+    def estimate_cost(self, usage: Dict[str, Any]) -> float:
+        """Estimate the USD cost of one request from its usage stats
+
+        Args:
+            usage: Stats filled in by a generate_speech call
+
+        Returns:
+            Estimated cost in USD
+        """
+        pricing = self.get_pricing(usage.get('model'))
+        return usage.get('characters', 0) * pricing.get('characters', 0) / 1_000_000
+
+    async def _throttle(self, text: str) -> None:
+        """Wait for the rate limiter (if any) to admit a request for text"""
+        if self.rate_limiter is not None:
+            await self.rate_limiter.acquire(len(text))
+
 
 class STTProvider(ABC):
     """Abstract base class for Speech-to-Text providers"""
@@ -186,6 +368,9 @@ class StorageGateway(ABC):
     ) -> Dict[str, str]:
         """Save a complete conversation with all artifacts
 
+        Implementations set metrics.storage_write_ms (time to write the
+        audio) before serializing the metrics, so the saved files include it.
+
         Args:
             conversation: Conversation object
             metrics: Conversation metrics
@@ -254,6 +439,83 @@ class StorageGateway(ABC):
         """
         pass
 
+    @abstractmethod
+    async def save_checkpoint(
+        self,
+        conversation: Conversation,
+        metrics: ConversationMetrics,
+        status: str = "in_progress",
+        extra: Optional[Dict[str, Any]] = None
+    ) -> str:
+        """Save an in-progress conversation so it can be resumed later
+
+        Called after every turn, so implementations should only write turn
+        audio that has not been checkpointed yet and replace the checkpoint
+        atomically.
+
+        Args:
+            conversation: Conversation generated so far (turns may carry audio)
+            metrics: Metrics collected so far
+            status: Checkpoint status (in_progress, text_complete, completed,
+                interrupted, failed, saved)
+            extra: Optional additional data to store (e.g. error, storage paths)
+
+        Returns:
+            URL or path to the stored checkpoint
+        """
+        pass
+
+    @abstractmethod
+    async def load_checkpoint(self, conversation_id: str) -> Optional[Dict[str, Any]]:
+        """Load a conversation checkpoint
+
+        Args:
+            conversation_id: ID of the checkpointed conversation
+
+        Returns:
+            None if no checkpoint exists, otherwise a dictionary with
+            'status', 'conversation' (with turn audio restored), 'metrics',
+            'updated_at' and any extra data saved with the checkpoint
+        """
+        pass
+
+    @abstractmethod
+    async def delete_checkpoint(self, conversation_id: str) -> bool:
+        """Delete a conversation checkpoint and its turn audio
+
+        Args:
+            conversation_id: ID of the checkpointed conversation
+
+        Returns:
+            True if a checkpoint was deleted
+        """
+        pass
+
+    @abstractmethod
+    async def list_checkpoints(self, status: Optional[str] = None) -> List[Dict[str, Any]]:
+        """List conversation checkpoints
+
+        Args:
+            status: Optional status to filter by
+
+        Returns:
+            List of checkpoint summaries (conversation_id, status, turns, updated_at)
+        """
+        pass
+
+    @abstractmethod
+    async def save_run_report(self, run_id: str, report: Dict[str, Any]) -> str:
+        """Save the run-level report of a batch
+
+        Args:
+            run_id: Batch run ID
+            report: Report data as dictionary
+
+        Returns:
+            URL or path to the stored report
+        """
+        pass
+
     @abstractmethod
     def get_storage_type(self) -> str:
         """Get the type of storage (local, gcs, s3)"""
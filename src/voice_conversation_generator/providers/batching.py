@@ -0,0 +1,243 @@
+"""
+Batching LLM wrapper - Sends concurrent completions through a batch API
+Every conversation of a batch run waits on its next turn at about the same
+time; their requests are collected into one batch submission, so all
+conversations advance in lockstep, one batch per turn, at batch prices
+"""
+import asyncio
+import time
+import uuid
+from typing import Dict, Any, Optional, List, AsyncIterator
+
+from .base import LLMProvider
+from .errors import ProviderError
+
+
+class _PendingRequest:
+    """A completion waiting for the next batch submission"""
+
+    def __init__(self, request: Dict[str, Any], stats: Optional[Dict[str, Any]]):
+        self.request = request
+        self.stats = stats
+        self.future: asyncio.Future = asyncio.get_running_loop().create_future()
+
+
+class BatchingLLMProvider(LLMProvider):
+    """Wraps a provider with a batch API (e.g. OpenAILLMProvider)
+
+    Completions are held until no new request has arrived for
+    collect_seconds (or max_requests are waiting), then submitted together
+    and resolved when the batch finishes. A request that fails within the
+    batch raises a ProviderError with its status code, so retry wrappers
+    outside this one resubmit it with the next batch.
+
+    Batches take minutes to hours, so this only suits offline runs; the
+    wrapped provider's rate limiter is bypassed since batch jobs have
+    their own (much larger) quota.
+    """
+
+    def __init__(
+        self,
+        provider: LLMProvider,
+        collect_seconds: float = 2.0,
+        max_requests: int = 50000,
+        poll_interval: float = 30.0,
+        completion_window: str = "24h",
+        timeout: Optional[float] = None,
+        discount: float = 0.5
+    ):
+        """Initialize the wrapper
+
+        Args:
+            provider: Provider exposing build_batch_request, submit_batch,
+                wait_for_batch and parse_batch_result
+            collect_seconds: Quiet period after the last request before a
+                batch is submitted
+            max_requests: Submit as soon as this many requests are waiting
+            poll_interval: Seconds between batch status checks
+            completion_window: Time the API has to finish each batch
+            timeout: Fail a batch's requests after this many seconds
+            discount: Batch price as a fraction of the provider's pricing
+
+        Raises:
+            ValueError: If the provider has no batch API
+        """
+        if not hasattr(provider, 'submit_batch'):
+            raise ValueError(f"LLM provider {provider.get_model_name()} does not support batch requests")
+
+        # In-flight requests all sit in the same batch, so the adaptive
+        # concurrency limit must not cap them below max_requests
+        config = dict(provider.config)
+        config.setdefault('concurrency', {'initial_limit': max_requests, 'max_limit': max_requests})
+        super().__init__(config)
+
+        self.provider = provider
+        self.collect_seconds = collect_seconds
+        self.max_requests = max_requests
+        self.poll_interval = poll_interval
+        self.completion_window = completion_window
+        self.timeout = timeout
+        self.discount = discount
+
+        self._pending: List[_PendingRequest] = []
+        self._last_arrival = 0.0
+        self._flusher: Optional[asyncio.Task] = None
+        self._batch_tasks: set = set()
+
+        self.batches = 0
+        self.requests = 0
+        self.failed_requests = 0
+        self.batch_seconds = 0.0
+
+    def __getattr__(self, name: str) -> Any:
+        # Only called for attributes the wrapper lacks (client, model, ...)
+        if name == 'provider':
+            raise AttributeError(name)
+        return getattr(self.provider, name)
+
+    async def _submit(
+        self,
+        messages: List[Dict[str, str]],
+        temperature: float,
+        max_tokens: int,
+        kwargs: Dict[str, Any]
+    ) -> str:
+        """Queue one completion for the next batch and wait for its reply"""
+        stats = kwargs.pop('stats', None)
+        request = self.provider.build_batch_request(
+            f"req-{uuid.uuid4().hex}", messages, temperature, max_tokens, **kwargs
+        )
+        pending = _PendingRequest(request, stats)
+        self._pending.append(pending)
+        self._last_arrival = time.monotonic()
+
+        if len(self._pending) >= self.max_requests:
+            self._dispatch()
+        elif self._flusher is None or self._flusher.done():
+            self._flusher = asyncio.create_task(self._flush_when_quiet())
+
+        return await pending.future
+
+    async def _flush_when_quiet(self) -> None:
+        """Submit the waiting requests once none has arrived for collect_seconds"""
+        while self._pending:
+            quiet_for = time.monotonic() - self._last_arrival
+            if quiet_for >= self.collect_seconds:
+                self._dispatch()
+                return
+            await asyncio.sleep(self.collect_seconds - quiet_for)
+
+    def _dispatch(self) -> None:
+        """Hand the waiting requests to a new batch"""
+        pending, self._pending = self._pending, []
+        task = asyncio.create_task(self._run_batch(pending))
+        self._batch_tasks.add(task)
+        task.add_done_callback(self._batch_tasks.discard)
+
+    async def _run_batch(self, pending: List[_PendingRequest]) -> None:
+        """Submit one batch, wait for it and resolve each request's future"""
+        # Requests whose caller gave up (timeout, cancellation) are dropped
+        pending = [item for item in pending if not item.future.done()]
+        if not pending:
+            return
+
+        self.batches += 1
+        self.requests += len(pending)
+        start_time = time.time()
+        try:
+            batch_id = await self.provider.submit_batch(
+                [item.request for item in pending],
+                completion_window=self.completion_window
+            )
+            results = await self.provider.wait_for_batch(batch_id, self.poll_interval, self.timeout)
+        except Exception as e:
+            self.failed_requests += len(pending)
+            for item in pending:
+                if not item.future.done():
+                    item.future.set_exception(e)
+            return
+        finally:
+            self.batch_seconds += time.time() - start_time
+
+        for item in pending:
+            if item.future.done():
+                continue
+            custom_id = item.request['custom_id']
+            try:
+                if custom_id not in results:
+                    raise ProviderError(f"Batch {batch_id} returned no result for {custom_id}", provider="openai")
+                usage = item.stats if item.stats is not None else {}
+                text = self.provider.parse_batch_result(results[custom_id], usage)
+                usage['batch_id'] = batch_id
+                item.future.set_result(text)
+            except ProviderError as e:
+                self.failed_requests += 1
+                item.future.set_exception(e)
+
+    async def generate_completion(
+        self,
+        prompt: str,
+        system_prompt: Optional[str] = None,
+        temperature: float = 0.8,
+        max_tokens: int = 150,
+        **kwargs
+    ) -> str:
+        """Generate text completion in the next batch"""
+        messages = []
+        if system_prompt:
+            messages.append({"role": "system", "content": system_prompt})
+        messages.append({"role": "user", "content": prompt})
+        return await self._submit(messages, temperature, max_tokens, kwargs)
+
+    async def generate_chat_completion(
+        self,
+        messages: List[Dict[str, str]],
+        temperature: float = 0.8,
+        max_tokens: int = 150,
+        **kwargs
+    ) -> str:
+        """Generate chat completion in the next batch"""
+        return await self._submit(messages, temperature, max_tokens, kwargs)
+
+    async def generate_completion_stream(
+        self,
+        prompt: str,
+        system_prompt: Optional[str] = None,
+        temperature: float = 0.8,
+        max_tokens: int = 150,
+        **kwargs
+    ) -> AsyncIterator[str]:
+        """Batches can't stream; yields the whole reply once it is ready"""
+        yield await self.generate_completion(prompt, system_prompt, temperature, max_tokens, **kwargs)
+
+    async def generate_chat_completion_stream(
+        self,
+        messages: List[Dict[str, str]],
+        temperature: float = 0.8,
+        max_tokens: int = 150,
+        **kwargs
+    ) -> AsyncIterator[str]:
+        """Batches can't stream; yields the whole reply once it is ready"""
+        yield await self._submit(messages, temperature, max_tokens, kwargs)
+
+    async def warm_up(self, connections: int = 1) -> None:
+        """Open connections of the wrapped provider"""
+        await self.provider.warm_up(connections)
+
+    def get_model_name(self) -> str:
+        """Get the name of the model being used"""
+        return self.provider.get_model_name()
+
+    def get_pricing(self, model: Optional[str] = None) -> Dict[str, float]:
+        """Get token prices of the wrapped provider at the batch discount"""
+        return {kind: price * self.discount for kind, price in self.provider.get_pricing(model).items()}
+
+    def batch_snapshot(self) -> Dict[str, Any]:
+        """Batch counters, for reporting"""
+        return {
+            "batches": self.batches,
+            "requests": self.requests,
+            "failed_requests": self.failed_requests,
+            "avg_requests_per_batch": round(self.requests / self.batches, 1) if self.batches else 0.0,
+            "avg_batch_seconds": round(self.batch_seconds / self.batches, 1) if self.batches else 0.0
+        }
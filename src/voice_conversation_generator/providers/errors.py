@@ -0,0 +1,85 @@
+"""
+Provider errors - Structured failures raised by provider implementations
+"""
+import asyncio
+from typing import Optional
+
+
+class ProviderError(RuntimeError):
+    """A failed provider request, classified for retry and backoff decisions
+
+    Subclasses RuntimeError so existing callers that catch RuntimeError keep
+    working.
+    """
+
+    def __init__(
+        self,
+        message: str,
+        provider: str = "",
+        status_code: Optional[int] = None,
+        retry_after: Optional[float] = None,
+        is_timeout: bool = False
+    ):
+        """Initialize the error
+
+        Args:
+            message: Human-readable error message
+            provider: Name of the provider that failed
+            status_code: HTTP status code, if the provider returned one
+            retry_after: Seconds the provider asked us to wait, if any
+            is_timeout: Whether the request timed out
+        """
+        super().__init__(message)
+        self.provider = provider
+        self.status_code = status_code
+        self.retry_after = retry_after
+        self.is_timeout = is_timeout
+
+    @property
+    def is_rate_limit(self) -> bool:
+        """Whether the provider rejected the request for exceeding its quota"""
+        return self.status_code == 429
+
+    @property
+    def is_overload(self) -> bool:
+        """Whether the failure signals that we are sending too much traffic"""
+        return self.is_rate_limit or self.is_timeout or self.status_code in (503, 529)
+
+    @classmethod
+    def from_exception(cls, provider: str, message: str, error: BaseException) -> 'ProviderError':
+        """Build a ProviderError from an SDK or HTTP client exception
+
+        Works with any exception exposing 'status_code' (and optionally
+        'headers' or 'response.headers'), which covers the OpenAI,
+        ElevenLabs and Cartesia SDKs.
+
+        Args:
+            provider: Name of the provider that failed
+            message: Error message (the original error is appended)
+            error: The exception raised by the SDK
+
+        Returns:
+            Classified ProviderError
+        """
+        status_code = getattr(error, 'status_code', None)
+
+        headers = getattr(error, 'headers', None)
+        if headers is None and getattr(error, 'response', None) is not None:
+            headers = getattr(error.response, 'headers', None)
+
+        retry_after = None
+        if headers:
+            try:
+                retry_after = float(headers.get('retry-after'))
+            except (TypeError, ValueError):
+                retry_after = None
+
+        is_timeout = isinstance(error, (asyncio.TimeoutError, TimeoutError)) or 'Timeout' in type(error).__name__
+
+        return cls(
+            f"{message}: {error}",
+            provider=provider,
+            status_code=status_code if isinstance(status_code, int) else None,
+            retry_after=retry_after,
+            is_timeout=is_timeout
+        )
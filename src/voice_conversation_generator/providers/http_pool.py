@@ -0,0 +1,126 @@
+"""
+HTTP Pool - Connection pools shared by every HTTP provider
+One async and one sync httpx client per process, so the LLM and TTS
+providers reuse kept-alive (and, with h2 installed, multiplexed HTTP/2)
+connections instead of each opening their own
+"""
+import asyncio
+import importlib.util
+from typing import Dict, Any, Optional
+
+import httpx
+
+
+# HTTP/2 needs the optional h2 package (pip install 'httpx[http2]')
+HTTP2_AVAILABLE = importlib.util.find_spec("h2") is not None
+
+
+class HTTPPool:
+    """Tunable httpx clients shared by providers
+
+    The async client binds its connections to the event loop that first
+    uses it, so a pool must only be used from one event loop (one per
+    process, as in the CLI and the sharded batch runner).
+    """
+
+    def __init__(
+        self,
+        max_connections: int = 100,
+        max_keepalive_connections: int = 20,
+        keepalive_expiry: float = 30.0,
+        http2: bool = True,
+        connect_timeout: float = 10.0
+    ):
+        """Initialize the pool (clients are created on first use)
+
+        Args:
+            max_connections: Maximum open connections per client
+            max_keepalive_connections: Idle connections kept open for reuse
+            keepalive_expiry: Seconds an idle connection is kept open
+            http2: Negotiate HTTP/2 where the server supports it (needs h2)
+            connect_timeout: Seconds allowed for DNS, TCP and TLS setup
+        """
+        self.limits = httpx.Limits(
+            max_connections=max_connections,
+            max_keepalive_connections=max_keepalive_connections,
+            keepalive_expiry=keepalive_expiry
+        )
+        self.http2 = http2 and HTTP2_AVAILABLE
+        # Providers pass their own read timeouts per request
+        self.timeout = httpx.Timeout(60.0, connect=connect_timeout)
+
+        self._async_client: Optional[httpx.AsyncClient] = None
+        self._sync_client: Optional[httpx.Client] = None
+
+    def async_client(self) -> httpx.AsyncClient:
+        """Shared client for async SDKs (OpenAI, Cartesia)"""
+        if self._async_client is None or self._async_client.is_closed:
+            self._async_client = httpx.AsyncClient(
+                limits=self.limits,
+                http2=self.http2,
+                timeout=self.timeout,
+                follow_redirects=True
+            )
+        return self._async_client
+
+    def sync_client(self) -> httpx.Client:
+        """Shared client for sync SDKs run in executor threads (ElevenLabs)"""
+        if self._sync_client is None or self._sync_client.is_closed:
+            self._sync_client = httpx.Client(
+                limits=self.limits,
+                http2=self.http2,
+                timeout=self.timeout,
+                follow_redirects=True
+            )
+        return self._sync_client
+
+    async def warm_up(self, url: str, connections: int = 1) -> None:
+        """Open connections to a host ahead of the first real request
+
+        Any response, even an error status, leaves a connection set up in
+        the pool; only network failures raise.
+
+        Args:
+            url: Any URL on the host (usually the API base URL)
+            connections: Connections to open in parallel (HTTP/2 needs one)
+
+        Raises:
+            httpx.HTTPError: If the host can't be reached
+        """
+        client = self.async_client()
+        count = 1 if self.http2 else max(1, min(connections, self.limits.max_keepalive_connections or 1))
+        await asyncio.gather(*(client.head(url) for _ in range(count)))
+
+    async def warm_up_sync(self, url: str, connections: int = 1) -> None:
+        """Open connections for the sync client (see warm_up)"""
+        client = self.sync_client()
+        count = 1 if self.http2 else max(1, min(connections, self.limits.max_keepalive_connections or 1))
+        loop = asyncio.get_running_loop()
+        await asyncio.gather(*(loop.run_in_executor(None, client.head, url) for _ in range(count)))
+
+    async def aclose(self) -> None:
+        """Close both clients and their connections"""
+        if self._async_client is not None:
+            await self._async_client.aclose()
+        if self._sync_client is not None:
+            self._sync_client.close()
+
+
+# Pool shared by every provider in this process
+_http_pool: Optional[HTTPPool] = None
+
+
+def get_http_pool(settings: Optional[Dict[str, Any]] = None) -> HTTPPool:
+    """Get the shared HTTP pool
+
+    Args:
+        settings: HTTPPool settings (only used on creation, i.e. by the
+            first caller; ProviderFactory passes config.providers.http)
+
+    Returns:
+        Shared HTTPPool
+    """
+    global _http_pool
+    if _http_pool is None:
+        _http_pool = HTTPPool(**(settings or {}))
+    return _http_pool
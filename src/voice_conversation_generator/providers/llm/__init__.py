@@ -3,7 +3,9 @@ LLM Provider implementations
 """
 
 from .openai import OpenAILLMProvider
+from .mock import MockLLMProvider
 
 __all__ = [
     "OpenAILLMProvider",
+    "MockLLMProvider",
 ]
\ No newline at end of file
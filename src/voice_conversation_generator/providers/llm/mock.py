@@ -0,0 +1,318 @@
+"""
+Mock LLM Provider Implementation
+Scripted, persona-aware replies with realistic latency and injected
+failures, for load-testing the orchestrator without API calls
+"""
+import asyncio
+import hashlib
+import random
+import re
+from typing import Dict, Any, Optional, List, AsyncIterator
+
+from ..base import LLMProvider
+from ..simulation import LatencyModel, FaultInjector, load_recorded_latencies
+
+
+# Reply templates by side, conversation stage and language. Only the
+# 'resolved' and 'closing' stages use phrases the orchestrator's ending
+# heuristics match, so scripted conversations run their full course.
+TEMPLATES: Dict[str, Dict[str, Dict[str, List[str]]]] = {
+    "support": {
+        "opening": {
+            "en": [
+                "Hello, this is {agent} calling from {company}. I am calling about your child's school fee payment, do you have a minute?",
+                "Good morning, my name is {agent} from {company}. I wanted to talk to you about a pending fee payment."
+            ],
+            "hinglish": [
+                "Namaste, main {agent} bol raha hoon {company} se. Aapke bachche ki school fee ke baare mein call kiya tha, kya abhi do minute baat ho sakti hai?",
+                "Hello ji, main {agent}, {company} se. Aapki fee payment pending dikh rahi hai, uske baare mein baat karni thi."
+            ]
+        },
+        "middle": {
+            "en": [
+                "I see. Your last payment attempt on the account did not go through.",
+                "There is a pending amount on the account. A payment link is one option, or a short extension.",
+                "No problem, the amount may also be split into two installments."
+            ],
+            "hinglish": [
+                "Achha, aapke account par pichhli payment attempt fail hui thi.",
+                "Aapke paas payment link ka option hai, ya thoda extension bhi mil jayega.",
+                "Koi baat nahi, amount do installments mein bhi pay ho jayega."
+            ]
+        },
+        "closing": {
+            "en": [
+                "Thank you for your time, I will send the payment link right away. Have a great day!",
+                "Glad I could help. Thank you for calling, and take care!"
+            ],
+            "hinglish": [
+                "Aapka bahut dhanyavaad, main abhi payment link bhej deta hoon. Apna khayal rakhiye!",
+                "Madad karke khushi hui. Dhanyavaad, apna khayal rakhiye!"
+            ]
+        }
+    },
+    "customer": {
+        "angry": {
+            "en": ["Why do you people keep calling me about this? I already told you I am dealing with it."],
+            "hinglish": ["Aap log baar baar call kyun kar rahe ho? Maine bola na main dekh raha hoon."]
+        },
+        "confused": {
+            "en": ["Sorry, I don't really follow. Which payment is this about?"],
+            "hinglish": ["Maaf kijiye, mujhe pata nahi chala, kaunsi payment ki baat kar rahe hain?"]
+        },
+        "first": {
+            "en": ["Oh yes, I was expecting this call. {issue}, what should I do now?"],
+            "hinglish": ["Haan ji, boliye. Mujhe pata hai, {issue}. Ab kya karna hoga?"]
+        },
+        "middle": {
+            "en": [
+                "Okay, and how many days do I have to pay the remaining amount?",
+                "Please send me the details on WhatsApp first.",
+                "I need a few days, my salary comes on the first of the month."
+            ],
+            "hinglish": [
+                "Achha, toh mujhe payment ke liye kitne din milenge?",
+                "Aap mujhe details WhatsApp par bhej dijiye.",
+                "Mujhe thoda time chahiye, salary pehli tareekh ko aati hai."
+            ]
+        },
+        "resolved": {
+            "en": [
+                "Okay, that works for me. Thank you so much for your help.",
+                "Perfect, I will make the payment today. Thanks!"
+            ],
+            "hinglish": [
+                "Theek hai, main aaj hi payment kar dunga. Bahut dhanyavaad!",
+                "Achha, yeh sahi hai. Shukriya aapki madad ke liye."
+            ]
+        }
+    }
+}
+
+FALLBACK_REPLY = "This is a mock response."
+
+DEVANAGARI = re.compile(r'[\u0900-\u097F]')
+
+
+class MockLLMProvider(LLMProvider):
+    """Offline LLM provider for benchmarks and tests
+
+    Replies are picked from templates by reading the prompts the
+    PromptBuilder produces (which side is speaking, the stage of the call,
+    the customer's emotional state and issue), in English or Hinglish.
+    Every call reports token usage like a real provider, honours the
+    attached rate limiter, and sleeps for a sampled latency.
+    """
+
+    def __init__(self, config: Dict[str, Any]):
+        """Initialize the mock
+
+        Config may include:
+        - model: Model name reported in stats (default 'mock')
+        - seed: Makes replies, latencies and failures reproducible
+        - language: 'auto' (Hinglish when the prompt has Devanagari or
+          mentions Hindi), 'en' or 'hinglish'
+        - turns_to_resolve: Customer turns before the customer is
+          satisfied (default 3, one more for angry customers)
+        - latency: distribution ('lognormal', 'normal', 'uniform' or
+          'constant'), ttft_ms (median or mean, default 400), sigma
+          (lognormal shape, default 0.5), stddev_ms (normal), min_ms and
+          max_ms (uniform), tokens_per_second (default 60), and replay
+          (metrics or transcript JSON file, or a directory of them, whose
+          recorded turn_ttft_ms are sampled instead)
+        - errors: rate_limit_rate, timeout_rate and server_error_rate
+          (fractions of requests that fail), retry_after (seconds sent
+          with a 429, default 1) and timeout_seconds (how long a timed
+          out request hangs, default 5)
+        - pricing: USD per 1M tokens, to exercise budgets (default free)
+        """
+        super().__init__(config)
+        self.model = config.get('model', 'mock')
+        self.seed = config.get('seed')
+        self.language = config.get('language', 'auto')
+        self.turns_to_resolve = config.get('turns_to_resolve', 3)
+
+        latency = dict(config.get('latency') or {})
+        self.tokens_per_second = latency.pop('tokens_per_second', 60.0)
+        replay = latency.pop('replay', None)
+
+        rng = random.Random(self.seed)
+        self.latency = LatencyModel(
+            rng,
+            median_ms=latency.pop('ttft_ms', 400.0),
+            recorded_ms=load_recorded_latencies(replay, metrics_key='turn_ttft_ms') if replay else None,
+            **latency
+        )
+        self.faults = FaultInjector.from_config(rng, "mock", config.get('errors'))
+
+    def _is_hinglish(self, prompt_text: str) -> bool:
+        if self.language != 'auto':
+            return self.language == 'hinglish'
+        return bool(DEVANAGARI.search(prompt_text)) or bool(re.search(r'\bhindi\b|\bhinglish\b', prompt_text, re.I))
+
+    def script_reply(self, messages: List[Dict[str, str]]) -> str:
+        """Pick a templated reply for the prompt the orchestrator built"""
+        text = "\n".join(m.get('content') or '' for m in messages)
+        # The same prompt always gets the same reply (per seed)
+        digest = hashlib.sha256(f"{self.seed}:{text}".encode("utf-8")).hexdigest()
+        rng = random.Random(digest)
+        language = 'hinglish' if self._is_hinglish(text) else 'en'
+
+        if 'receiving a call from customer support' in text:
+            templates = TEMPLATES['customer']
+            emotion = re.search(r'^Emotional state: (\w+)', text, re.M)
+            emotion = emotion.group(1) if emotion else 'neutral'
+
+            # Own earlier turns: assistant messages, or lines of the pasted history
+            spoken = sum(1 for m in messages if m.get('role') == 'assistant')
+            spoken += len(re.findall(r'^customer: ', text, re.M))
+
+            needed = self.turns_to_resolve + (1 if emotion == 'angry' else 0)
+            if spoken == 0:
+                stage = emotion if emotion in ('angry', 'confused') else 'first'
+            elif spoken >= needed - 1:
+                stage = 'resolved'
+            else:
+                stage = 'middle'
+        elif 'customer support agent' in text or 'You work for' in text or 'start of a new call' in text:
+            templates = TEMPLATES['support']
+            if 'Provide a warm closing' in text:
+                stage = 'closing'
+            elif messages[-1].get('content', '').startswith('This is the start of a new call'):
+                stage = 'opening'
+            else:
+                stage = 'middle'
+        else:
+            return FALLBACK_REPLY
+
+        agent = re.search(r'Your name is (.+?)\. ', text)
+        company = re.search(r'You work for (.+?)\. ', text)
+        issue = re.search(r'^Your issue/situation: (.+)$', text, re.M)
+        return rng.choice(templates[stage][language]).format(
+            agent=agent.group(1) if agent else 'Priya',
+            company=company.group(1) if company else 'Jodo',
+            issue=issue.group(1).rstrip('.') if issue else 'the payment did not go through'
+        )
+
+    def record_usage(
+        self,
+        stats: Dict[str, Any],
+        messages: List[Dict[str, str]],
+        reply: str,
+        max_tokens: int,
+        model: Optional[str] = None
+    ) -> None:
+        """Report token usage estimated at four characters per token"""
+        stats['model'] = model or self.model
+        stats['prompt_tokens'] = sum(len(m.get('content') or '') for m in messages) // 4
+        stats['completion_tokens'] = min(max(1, len(reply) // 4), max_tokens)
+        stats['cached_tokens'] = 0
+
+    async def generate_completion(
+        self,
+        prompt: str,
+        system_prompt: Optional[str] = None,
+        temperature: float = 0.8,
+        max_tokens: int = 150,
+        **kwargs
+    ) -> str:
+        """Generate a scripted text completion
+
+        Args:
+            prompt: The user prompt
+            system_prompt: Optional system prompt
+            temperature: Ignored
+            max_tokens: Caps the reported completion tokens
+            **kwargs: A 'stats' dict is filled like a real provider's
+                ('model' overrides the reported model)
+
+        Returns:
+            Scripted reply
+        """
+        messages = []
+        if system_prompt:
+            messages.append({"role": "system", "content": system_prompt})
+        messages.append({"role": "user", "content": prompt})
+
+        return await self.generate_chat_completion(
+            messages=messages,
+            temperature=temperature,
+            max_tokens=max_tokens,
+            **kwargs
+        )
+
+    async def generate_chat_completion(
+        self,
+        messages: List[Dict[str, str]],
+        temperature: float = 0.8,
+        max_tokens: int = 150,
+        **kwargs
+    ) -> str:
+        """Generate a scripted chat completion after the sampled latency
+
+        Args:
+            messages: List of message dictionaries with 'role' and 'content'
+            temperature: Ignored
+            max_tokens: Caps the reported completion tokens
+            **kwargs: A 'stats' dict is filled like a real provider's
+                ('model' overrides the reported model)
+
+        Returns:
+            Scripted reply
+
+        Raises:
+            ProviderError: For injected failures
+        """
+        stats = kwargs.pop('stats', None)
+        usage = stats if stats is not None else {}
+        reserved_tokens = await self._throttle(messages, max_tokens)
+        await self.faults.maybe_fail()
+
+        reply = self.script_reply(messages)
+        self.record_usage(usage, messages, reply, max_tokens, model=kwargs.get('model'))
+        await asyncio.sleep(self.latency.sample() + usage['completion_tokens'] / self.tokens_per_second)
+        self._settle_rate_limit(reserved_tokens, usage)
+        return reply
+
+    async def generate_chat_completion_stream(
+        self,
+        messages: List[Dict[str, str]],
+        temperature: float = 0.8,
+        max_tokens: int = 150,
+        **kwargs
+    ) -> AsyncIterator[str]:
+        """Stream a scripted chat completion word by word
+
+        The first word arrives after the sampled time to first token, the
+        rest at the configured tokens per second.
+
+        Args:
+            messages: List of message dictionaries with 'role' and 'content'
+            temperature: Ignored
+            max_tokens: Caps the reported completion tokens
+            **kwargs: A 'stats' dict is filled like a real provider's
+                ('model' overrides the reported model)
+
+        Yields:
+            Words of the scripted reply
+
+        Raises:
+            ProviderError: For injected failures
+        """
+        stats = kwargs.pop('stats', None)
+        usage = stats if stats is not None else {}
+        reserved_tokens = await self._throttle(messages, max_tokens)
+        await self.faults.maybe_fail()
+
+        reply = self.script_reply(messages)
+        await asyncio.sleep(self.latency.sample())
+        for word in re.findall(r'\S+\s*', reply):
+            yield word
+            await asyncio.sleep(len(word) / 4 / self.tokens_per_second)
+
+        self.record_usage(usage, messages, reply, max_tokens, model=kwargs.get('model'))
+        self._settle_rate_limit(reserved_tokens, usage)
+
+    def get_model_name(self) -> str:
+        """Get the name of the model being used"""
+        return self.model
@@ -1,15 +1,40 @@
 """
 OpenAI LLM Provider Implementation
 """
+import asyncio
+import json
 import os
-from typing import Dict, Any, Optional, List
+import time
+from typing import Dict, Any, Optional, List, AsyncIterator
 from openai import AsyncOpenAI
+from openai.types.chat import ChatCompletion
 from ..base import LLMProvider
+from ..errors import ProviderError
+from ..http_pool import get_http_pool
 
 
 class OpenAILLMProvider(LLMProvider):
     """OpenAI LLM provider for GPT models"""
 
+    # List prices in USD per 1M tokens, matched by longest model-name prefix.
+    # Override with config['pricing'] for other models or negotiated rates.
+    MODEL_PRICING = {
+        'gpt-5': {'input': 1.25, 'cached_input': 0.125, 'output': 10.00},
+        'gpt-5-mini': {'input': 0.25, 'cached_input': 0.025, 'output': 2.00},
+        'gpt-5-nano': {'input': 0.05, 'cached_input': 0.005, 'output': 0.40},
+        'gpt-4.1': {'input': 2.00, 'cached_input': 0.50, 'output': 8.00},
+        'gpt-4.1-mini': {'input': 0.40, 'cached_input': 0.10, 'output': 1.60},
+        'gpt-4.1-nano': {'input': 0.10, 'cached_input': 0.025, 'output': 0.40},
+        'gpt-4o': {'input': 2.50, 'cached_input': 1.25, 'output': 10.00},
+        'gpt-4o-mini': {'input': 0.15, 'cached_input': 0.075, 'output': 0.60},
+        'gpt-4-turbo': {'input': 10.00, 'output': 30.00},
+        'gpt-4': {'input': 30.00, 'output': 60.00},
+        'gpt-3.5-turbo': {'input': 0.50, 'output': 1.50}
+    }
+
+    # Batch states after which a batch makes no more progress
+    BATCH_FINAL_STATUSES = ('completed', 'failed', 'expired', 'cancelled')
+
     def __init__(self, config: Dict[str, Any]):
         """Initialize OpenAI client
 
@@ -17,6 +42,7 @@ class OpenAILLMProvider(LLMProvider):
         - api_key: OpenAI API key (or from env OPENAI_API_KEY)
         - model: Model name (e.g., 'gpt-4', 'gpt-3.5-turbo')
         - organization: Optional organization ID
+        - base_url: API base URL override (e.g. a local StandInServer)
         """
         super().__init__(config)
 
@@ -25,10 +51,12 @@ class OpenAILLMProvider(LLMProvider):
         if not api_key:
             raise ValueError("OpenAI API key not found in config or environment")
 
-        # Initialize client
+        # Initialize client on the connection pool shared by all providers
         self.client = AsyncOpenAI(
             api_key=api_key,
-            organization=config.get('organization')
+            organization=config.get('organization'),
+            base_url=config.get('base_url'),
+            http_client=get_http_pool().async_client()
         )
 
         # Set default model
@@ -84,6 +112,64 @@ class OpenAILLMProvider(LLMProvider):
         Returns:
             Generated text response
         """
+        stats = kwargs.pop('stats', None)
+        usage = stats if stats is not None else {}
+        completion_params = self._build_completion_params(messages, temperature, max_tokens, **kwargs)
+        reserved_tokens = await self._throttle(messages, max_tokens)
+
+        try:
+            response = await self.client.chat.completions.create(**completion_params)
+            self._record_usage(usage, response.usage, completion_params["model"])
+            self._settle_rate_limit(reserved_tokens, usage)
+            return response.choices[0].message.content.strip()
+        except Exception as e:
+            raise ProviderError.from_exception("openai", "OpenAI completion failed", e) from e
+
+    async def generate_chat_completion_stream(
+        self,
+        messages: List[Dict[str, str]],
+        temperature: float = 0.8,
+        max_tokens: int = 150,
+        **kwargs
+    ) -> AsyncIterator[str]:
+        """Stream a chat completion from OpenAI token by token
+
+        Args:
+            messages: List of message dictionaries with 'role' and 'content'
+            temperature: Temperature for sampling (0-2)
+            max_tokens: Maximum tokens to generate
+            **kwargs: Additional OpenAI parameters
+
+        Yields:
+            Text fragments as they are generated
+        """
+        stats = kwargs.pop('stats', None)
+        usage = stats if stats is not None else {}
+        completion_params = self._build_completion_params(messages, temperature, max_tokens, **kwargs)
+        completion_params["stream"] = True
+        # Usage arrives in a final chunk with no choices
+        completion_params["stream_options"] = {"include_usage": True}
+        reserved_tokens = await self._throttle(messages, max_tokens)
+
+        try:
+            stream = await self.client.chat.completions.create(**completion_params)
+            async for chunk in stream:
+                if chunk.choices and chunk.choices[0].delta.content:
+                    yield chunk.choices[0].delta.content
+                if chunk.usage is not None:
+                    self._record_usage(usage, chunk.usage, completion_params["model"])
+            self._settle_rate_limit(reserved_tokens, usage)
+        except Exception as e:
+            raise ProviderError.from_exception("openai", "OpenAI streaming completion failed", e) from e
+
+    def _build_completion_params(
+        self,
+        messages: List[Dict[str, str]],
+        temperature: float,
+        max_tokens: int,
+        **kwargs
+    ) -> Dict[str, Any]:
+        """Build chat completion request parameters for the configured model"""
         # Handle model-specific parameters
         model = kwargs.pop('model', self.model)
 
@@ -103,11 +189,211 @@ class OpenAILLMProvider(LLMProvider):
         # Add any additional parameters
         completion_params.update(kwargs)
 
+        return completion_params
+
+    def _record_usage(self, stats: Dict[str, Any], usage: Any, model: str) -> None:
+        """Copy token usage from an API response into a stats dict"""
+        stats['model'] = model
+        if usage is None:
+            return
+
+        stats['prompt_tokens'] = usage.prompt_tokens or 0
+        stats['completion_tokens'] = usage.completion_tokens or 0
+        details = getattr(usage, 'prompt_tokens_details', None)
+        stats['cached_tokens'] = (getattr(details, 'cached_tokens', None) or 0) if details else 0
+
+    # Batch API: asynchronous completions at half price (see BatchingLLMProvider)
+
+    def build_batch_request(
+        self,
+        custom_id: str,
+        messages: List[Dict[str, str]],
+        temperature: float = 0.8,
+        max_tokens: int = 150,
+        **kwargs
+    ) -> Dict[str, Any]:
+        """Build one line of a batch input file
+
+        Args:
+            custom_id: ID that the request's result is returned under
+            messages: List of message dictionaries with 'role' and 'content'
+            temperature: Temperature for sampling (0-2)
+            max_tokens: Maximum tokens to generate
+            **kwargs: Additional OpenAI parameters
+
+        Returns:
+            Batch request dictionary
+        """
+        kwargs.pop('stats', None)
+        return {
+            "custom_id": custom_id,
+            "method": "POST",
+            "url": "/v1/chat/completions",
+            "body": self._build_completion_params(messages, temperature, max_tokens, **kwargs)
+        }
+
+    async def submit_batch(
+        self,
+        requests: List[Dict[str, Any]],
+        completion_window: str = "24h",
+        metadata: Optional[Dict[str, str]] = None
+    ) -> str:
+        """Upload requests as a JSONL file and start a batch on it
+
+        Args:
+            requests: Lines built by build_batch_request
+            completion_window: Time the API has to finish the batch
+            metadata: Optional labels stored with the batch
+
+        Returns:
+            Batch ID
+
+        Raises:
+            ProviderError: If the upload or the batch creation failed
+        """
+        payload = "".join(json.dumps(request) + "\n" for request in requests).encode("utf-8")
         try:
-            response = await self.client.chat.completions.create(**completion_params)
-            return response.choices[0].message.content.strip()
+            batch_file = await self.client.files.create(file=("batch.jsonl", payload), purpose="batch")
+            batch = await self.client.batches.create(
+                input_file_id=batch_file.id,
+                endpoint="/v1/chat/completions",
+                completion_window=completion_window,
+                metadata=metadata
+            )
+        except Exception as e:
+            raise ProviderError.from_exception("openai", "OpenAI batch submission failed", e) from e
+        return batch.id
+
+    async def wait_for_batch(
+        self,
+        batch_id: str,
+        poll_interval: float = 30.0,
+        timeout: Optional[float] = None
+    ) -> Dict[str, Dict[str, Any]]:
+        """Poll a batch until it finishes and download its results
+
+        Polls that fail with a rate limit or server error are retried at the
+        next interval. A batch abandoned by timeout or cancellation is
+        cancelled on the API, so it stops accruing cost.
+
+        Args:
+            batch_id: ID returned by submit_batch
+            poll_interval: Seconds between status checks
+            timeout: Give up after this many seconds (default: wait for
+                the batch's completion window)
+
+        Returns:
+            Result lines (from the output and error files) by custom_id
+
+        Raises:
+            ProviderError: If the batch failed, expired, was cancelled or
+                timed out
+        """
+        deadline = time.monotonic() + timeout if timeout else None
+        try:
+            while True:
+                try:
+                    batch = await self.client.batches.retrieve(batch_id)
+                    if batch.status in self.BATCH_FINAL_STATUSES:
+                        break
+                except Exception as e:
+                    error = ProviderError.from_exception("openai", f"OpenAI batch {batch_id} poll failed", e)
+                    if error.status_code is not None and error.status_code < 500 and not error.is_rate_limit:
+                        raise error from e
+
+                if deadline is not None and time.monotonic() >= deadline:
+                    raise ProviderError(
+                        f"OpenAI batch {batch_id} not finished after {timeout:g}s",
+                        provider="openai",
+                        is_timeout=True
+                    )
+                await asyncio.sleep(poll_interval)
+        except BaseException:
+            await self.cancel_batch(batch_id)
+            raise
+
+        if batch.status != 'completed':
+            errors = [error.message for error in (batch.errors.data or [])] if batch.errors else []
+            raise ProviderError(
+                f"OpenAI batch {batch_id} {batch.status}" + (f": {'; '.join(errors)}" if errors else ""),
+                provider="openai"
+            )
+
+        results: Dict[str, Dict[str, Any]] = {}
+        for file_id in (batch.output_file_id, batch.error_file_id):
+            if not file_id:
+                continue
+            try:
+                content = await self.client.files.content(file_id)
+            except Exception as e:
+                raise ProviderError.from_exception("openai", f"OpenAI batch {batch_id} download failed", e) from e
+            for line in content.text.splitlines():
+                if line.strip():
+                    result = json.loads(line)
+                    results[result['custom_id']] = result
+        return results
+
+    async def cancel_batch(self, batch_id: str) -> None:
+        """Cancel a batch (best effort: failures are ignored)"""
+        try:
+            await asyncio.shield(self.client.batches.cancel(batch_id))
+        except Exception:
+            pass
+
+    def parse_batch_result(self, result: Dict[str, Any], stats: Optional[Dict[str, Any]] = None) -> str:
+        """Extract the reply and token usage from one batch result line
+
+        Args:
+            result: Result line returned by wait_for_batch
+            stats: Optional dict to fill with the request's usage
+
+        Returns:
+            Generated text response
+
+        Raises:
+            ProviderError: If the request failed within the batch
+        """
+        response = result.get('response') or {}
+        status_code = response.get('status_code')
+        if result.get('error') or status_code != 200:
+            error = result.get('error') or (response.get('body') or {}).get('error') or {}
+            raise ProviderError(
+                f"OpenAI batch request {result.get('custom_id')} failed: {error.get('message', 'unknown error')}",
+                provider="openai",
+                status_code=status_code
+            )
+
+        completion = ChatCompletion.model_validate(response['body'])
+        if stats is not None:
+            self._record_usage(stats, completion.usage, completion.model)
+        return (completion.choices[0].message.content or "").strip()
+
+    def get_pricing(self, model: Optional[str] = None) -> Dict[str, float]:
+        """Get token prices for a model (configured pricing takes precedence)"""
+        if self.config.get('pricing'):
+            return self.config['pricing']
+
+        model = model or self.model
+        matches = [prefix for prefix in self.MODEL_PRICING if model.startswith(prefix)]
+        return self.MODEL_PRICING[max(matches, key=len)] if matches else {}
+
+    async def warm_up(self, connections: int = 1) -> None:
+        """Open pooled connections to the API ahead of the first request"""
+        await get_http_pool().warm_up(str(self.client.base_url), connections)
+
+    async def health_check(self) -> None:
+        """Check that the endpoint answers and accepts the API key
+
+        Lists the available models, which OpenAI-compatible servers (such
+        as vLLM) also support and which costs no tokens.
+
+        Raises:
+            ProviderError: If the endpoint is unreachable or rejects the key
+        """
+        try:
+            await self.client.models.list()
         except Exception as e:
-            raise RuntimeError(f"OpenAI completion failed: {e}")
+            raise ProviderError.from_exception("openai", "OpenAI health check failed", e) from e
 
     def get_model_name(self) -> str:
         """Get the name of the model being used"""
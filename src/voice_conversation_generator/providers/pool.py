@@ -0,0 +1,341 @@
+"""
+Pooled LLM Provider - Load balancing and failover across LLM endpoints
+Spreads requests over several API keys, organizations or OpenAI-compatible
+servers, so throughput is bounded by their combined quotas rather than one
+key's tokens-per-minute limit
+"""
+import asyncio
+import itertools
+from typing import Dict, Any, Optional, List, AsyncIterator, Awaitable, Callable
+
+from .base import LLMProvider
+from .errors import ProviderError
+from .resilience import CircuitBreaker, CircuitOpenError, RetryPolicy
+
+
+class PoolMember:
+    """One endpoint of a pool and its load and health"""
+
+    def __init__(self, name: str, provider: LLMProvider, weight: float, circuit_breaker: CircuitBreaker):
+        self.name = name
+        self.provider = provider
+        self.weight = weight
+        self.circuit_breaker = circuit_breaker
+
+        self.outstanding = 0
+        self.requests = 0
+        self.failures = 0
+        # Smooth weighted round-robin state
+        self.current_weight = 0.0
+
+    def snapshot(self) -> Dict[str, Any]:
+        """Load and health counters, for reporting"""
+        return {
+            "model": self.provider.get_model_name(),
+            "weight": self.weight,
+            "outstanding": self.outstanding,
+            "requests": self.requests,
+            "failures": self.failures,
+            **self.circuit_breaker.snapshot()
+        }
+
+
+class PooledLLMProvider(LLMProvider):
+    """Spreads LLM requests over several endpoints with failover
+
+    Each request goes to the endpoint with the fewest requests in flight
+    per unit of weight (least_outstanding), or to endpoints in proportion
+    to their weights (weighted_round_robin). Requests waiting on an
+    endpoint's rate limiter count as in flight, so a throttled key gets
+    less traffic.
+
+    A request failing with a retryable error (rate limit, overload,
+    timeout, connection error) is sent to the next endpoint at once.
+    Repeated failures take an endpoint out of rotation for reset_timeout
+    seconds, after which a single probe request decides whether it is back.
+    """
+
+    STRATEGIES = ['least_outstanding', 'weighted_round_robin']
+
+    def __init__(
+        self,
+        providers: List[LLMProvider],
+        names: Optional[List[str]] = None,
+        weights: Optional[List[float]] = None,
+        strategy: str = 'least_outstanding',
+        failure_threshold: int = 3,
+        reset_timeout: float = 30.0,
+        health_check_interval: Optional[float] = None
+    ):
+        """Initialize the pool
+
+        Args:
+            providers: One provider per endpoint (the first sets the
+                reported model name)
+            names: Endpoint names for reporting (default endpoint0, ...)
+            weights: Relative capacity of each endpoint (default 1 each)
+            strategy: 'least_outstanding' or 'weighted_round_robin'
+            failure_threshold: Consecutive failures that take an endpoint
+                out of rotation
+            reset_timeout: Seconds before an endpoint out of rotation is
+                probed again
+            health_check_interval: Seconds between active health checks of
+                every endpoint (None disables them); a failed check counts
+                as a failure, a passing one returns an endpoint to rotation
+
+        Raises:
+            ValueError: If no providers are given or the strategy is not supported
+        """
+        if not providers:
+            raise ValueError("An LLM pool needs at least one endpoint")
+        if strategy not in self.STRATEGIES:
+            raise ValueError(f"Unsupported pool strategy: {strategy}")
+        super().__init__(providers[0].config)
+
+        names = names or [f"endpoint{i}" for i in range(len(providers))]
+        weights = weights or [1.0] * len(providers)
+        self.members = [
+            PoolMember(name, provider, float(weight), CircuitBreaker(f"llm:pool:{name}", failure_threshold, reset_timeout))
+            for name, provider, weight in zip(names, providers, weights)
+        ]
+        self.strategy = strategy
+        self.health_check_interval = health_check_interval
+
+        self.failovers = 0
+        self._retry_policy = RetryPolicy()
+        self._rotation = itertools.count()
+        self._health_task: Optional[asyncio.Task] = None
+
+    def __getattr__(self, name: str) -> Any:
+        # Only called for attributes the pool lacks (client, model, ...)
+        if name == 'members':
+            raise AttributeError(name)
+        return getattr(self.members[0].provider, name)
+
+    def _pick(self, exclude: List[PoolMember]) -> Optional[PoolMember]:
+        """Choose the endpoint for the next attempt (None if none is available)"""
+        candidates = [
+            member for member in self.members
+            if member not in exclude and member.circuit_breaker.allows_request()
+        ]
+        if not candidates:
+            return None
+
+        if self.strategy == 'weighted_round_robin':
+            # Smooth weighted round-robin: interleaves endpoints by weight
+            total = sum(member.weight for member in candidates)
+            for member in candidates:
+                member.current_weight += member.weight
+            chosen = max(candidates, key=lambda member: member.current_weight)
+            chosen.current_weight -= total
+            return chosen
+
+        # Rotate the starting point so ties don't always go to the first endpoint
+        offset = next(self._rotation) % len(candidates)
+        rotated = candidates[offset:] + candidates[:offset]
+        return min(rotated, key=lambda member: (member.outstanding + 1) / member.weight)
+
+    async def _call(
+        self,
+        request: Callable[[LLMProvider], Awaitable[str]],
+        stats: Optional[Dict[str, Any]]
+    ) -> str:
+        """Run a request on the pool, failing over on retryable errors
+
+        Raises:
+            ProviderError: The last endpoint's error, or a 503 if no
+                endpoint is available
+        """
+        self._ensure_health_checks()
+        tried: List[PoolMember] = []
+        last_error: Optional[BaseException] = None
+
+        while True:
+            member = self._pick(tried)
+            if member is None:
+                if last_error is not None:
+                    raise last_error
+                raise ProviderError("Every endpoint of the LLM pool is out of rotation", provider="llm:pool", status_code=503)
+
+            try:
+                member.circuit_breaker.before_request()
+            except CircuitOpenError:
+                tried.append(member)
+                continue
+
+            member.outstanding += 1
+            member.requests += 1
+            try:
+                result = await request(member.provider)
+            except Exception as e:
+                if not self._retry_policy.is_retryable(e):
+                    # Not the endpoint's fault (e.g. a bad request)
+                    member.circuit_breaker.record_client_error()
+                    raise
+                member.failures += 1
+                member.circuit_breaker.record_failure()
+                tried.append(member)
+                last_error = e
+                self.failovers += 1
+                if stats is not None:
+                    stats['failovers'] = stats.get('failovers', 0) + 1
+                continue
+            finally:
+                member.outstanding -= 1
+
+            member.circuit_breaker.record_success()
+            if stats is not None:
+                stats['endpoint'] = member.name
+            return result
+
+    def _ensure_health_checks(self) -> None:
+        """Start the health check loop on the running event loop, if enabled"""
+        if not self.health_check_interval:
+            return
+        if self._health_task is None or self._health_task.done():
+            self._health_task = asyncio.create_task(self._health_check_loop())
+
+    async def _health_check_loop(self) -> None:
+        while True:
+            await asyncio.sleep(self.health_check_interval)
+            await asyncio.gather(*(self._check(member) for member in self.members))
+
+    async def _check(self, member: PoolMember) -> None:
+        """Actively check one endpoint (providers without health_check are skipped)"""
+        health_check = getattr(member.provider, 'health_check', None)
+        if health_check is None:
+            return
+        try:
+            await health_check()
+        except Exception:
+            member.circuit_breaker.record_failure()
+            return
+        if member.circuit_breaker.state != "closed":
+            member.circuit_breaker.record_success()
+
+    async def generate_completion(
+        self,
+        prompt: str,
+        system_prompt: Optional[str] = None,
+        temperature: float = 0.8,
+        max_tokens: int = 150,
+        **kwargs
+    ) -> str:
+        """Generate text completion on the least loaded healthy endpoint"""
+        return await self._call(
+            lambda provider: provider.generate_completion(
+                prompt=prompt,
+                system_prompt=system_prompt,
+                temperature=temperature,
+                max_tokens=max_tokens,
+                **kwargs
+            ),
+            kwargs.get('stats')
+        )
+
+    async def generate_chat_completion(
+        self,
+        messages: List[Dict[str, str]],
+        temperature: float = 0.8,
+        max_tokens: int = 150,
+        **kwargs
+    ) -> str:
+        """Generate chat completion on the least loaded healthy endpoint"""
+        return await self._call(
+            lambda provider: provider.generate_chat_completion(
+                messages=messages,
+                temperature=temperature,
+                max_tokens=max_tokens,
+                **kwargs
+            ),
+            kwargs.get('stats')
+        )
+
+    async def generate_chat_completion_stream(
+        self,
+        messages: List[Dict[str, str]],
+        temperature: float = 0.8,
+        max_tokens: int = 150,
+        **kwargs
+    ) -> AsyncIterator[str]:
+        """Stream a chat completion, failing over only until the first token arrives"""
+        self._ensure_health_checks()
+        stats = kwargs.get('stats')
+        tried: List[PoolMember] = []
+        last_error: Optional[BaseException] = None
+
+        while True:
+            member = self._pick(tried)
+            if member is None:
+                if last_error is not None:
+                    raise last_error
+                raise ProviderError("Every endpoint of the LLM pool is out of rotation", provider="llm:pool", status_code=503)
+
+            try:
+                member.circuit_breaker.before_request()
+            except CircuitOpenError:
+                tried.append(member)
+                continue
+
+            member.outstanding += 1
+            member.requests += 1
+            started = False
+            try:
+                async for token in member.provider.generate_chat_completion_stream(
+                    messages=messages,
+                    temperature=temperature,
+                    max_tokens=max_tokens,
+                    **kwargs
+                ):
+                    started = True
+                    yield token
+            except Exception as e:
+                retryable = self._retry_policy.is_retryable(e)
+                if retryable:
+                    member.failures += 1
+                    member.circuit_breaker.record_failure()
+                else:
+                    member.circuit_breaker.record_client_error()
+                # Tokens already yielded can't be taken back
+                if started or not retryable:
+                    raise
+                tried.append(member)
+                last_error = e
+                self.failovers += 1
+                if stats is not None:
+                    stats['failovers'] = stats.get('failovers', 0) + 1
+                continue
+            finally:
+                member.outstanding -= 1
+
+            member.circuit_breaker.record_success()
+            if stats is not None:
+                stats['endpoint'] = member.name
+            return
+
+    async def warm_up(self, connections: int = 1) -> None:
+        """Open connections to every endpoint, splitting them by weight"""
+        total = sum(member.weight for member in self.members)
+        await asyncio.gather(*(
+            member.provider.warm_up(max(1, round(connections * member.weight / total)))
+            for member in self.members
+        ))
+
+    def get_model_name(self) -> str:
+        """Get the model name of the first endpoint"""
+        return self.members[0].provider.get_model_name()
+
+    def get_pricing(self, model: Optional[str] = None) -> Dict[str, float]:
+        """Get token prices of the endpoint serving the model"""
+        for member in self.members:
+            if model is None or member.provider.get_model_name() == model:
+                return member.provider.get_pricing(model)
+        return self.members[0].provider.get_pricing(model)
+
+    def pool_snapshot(self) -> Dict[str, Any]:
+        """Per-endpoint load and health, for reporting"""
+        return {
+            "strategy": self.strategy,
+            "failovers": self.failovers,
+            "endpoints": {member.name: member.snapshot() for member in self.members}
+        }
@@ -0,0 +1,298 @@
+"""
+Rate limiting - Token buckets shared by every provider using the same API key
+Requests queue locally until the configured per-minute budget allows them,
+instead of being sent and rejected by the provider. Worker processes can
+share one set of buckets through a RateLimitCoordinator.
+"""
+import asyncio
+import hashlib
+import threading
+import time
+from typing import Dict, Any, Optional
+
+
+class TokenBucket:
+    """Continuously refilling budget of units (requests, tokens, characters)"""
+
+    def __init__(self, per_minute: float, burst: Optional[float] = None):
+        """Initialize a full bucket
+
+        Args:
+            per_minute: Units added per minute
+            burst: Bucket capacity (defaults to one minute's worth)
+        """
+        self.rate = per_minute / 60
+        self.capacity = float(burst or per_minute)
+        self.available = self.capacity
+        self._updated = time.monotonic()
+
+    def _refill(self) -> None:
+        now = time.monotonic()
+        self.available = min(self.capacity, self.available + (now - self._updated) * self.rate)
+        self._updated = now
+
+    def wait_time(self, amount: float) -> float:
+        """Seconds until amount units are available (0 if available now)"""
+        self._refill()
+        # Requests larger than the bucket wait for a full bucket and go into debt
+        needed = min(amount, self.capacity) - self.available
+        return max(0.0, needed / self.rate)
+
+    def consume(self, amount: float) -> None:
+        """Take units from the bucket (may go negative)"""
+        self._refill()
+        self.available -= amount
+
+    def reserve(self, amount: float) -> float:
+        """Take units now and return the seconds to wait before using them
+
+        Later reservations queue behind this one, since the bucket is left
+        in debt until the wait has passed.
+        """
+        wait = self.wait_time(amount)
+        self.available -= amount
+        return wait
+
+    def refund(self, amount: float) -> None:
+        """Return units, e.g. when a request used fewer than estimated"""
+        self._refill()
+        self.available = min(self.capacity, self.available + amount)
+
+
+class RateLimiter:
+    """Requests-per-minute and units-per-minute limits for one provider key
+
+    Waiters are served in arrival order, so a large request is not starved
+    by a stream of small ones.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        requests_per_minute: Optional[float] = None,
+        units_per_minute: Optional[float] = None,
+        burst_seconds: Optional[float] = None
+    ):
+        """Initialize the limiter
+
+        Args:
+            name: Limiter key (for reporting)
+            requests_per_minute: Maximum requests per minute
+            units_per_minute: Maximum tokens (LLM) or characters (TTS) per minute
+            burst_seconds: Bucket size in seconds of budget (default 60)
+        """
+        self.name = name
+        self.settings = {
+            "requests_per_minute": requests_per_minute,
+            "units_per_minute": units_per_minute,
+            "burst_seconds": burst_seconds
+        }
+        self.requests = self._bucket(requests_per_minute, burst_seconds)
+        self.units = self._bucket(units_per_minute, burst_seconds)
+
+        self.waits = 0
+        self.wait_seconds = 0.0
+
+        # Set in worker processes so the buckets live in the coordinator
+        self.coordinator: Optional['RateLimitCoordinator'] = None
+
+        self._lock: Optional[asyncio.Lock] = None
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+
+    @staticmethod
+    def _bucket(per_minute: Optional[float], burst_seconds: Optional[float]) -> Optional[TokenBucket]:
+        """Create a bucket for a per-minute limit, or None if unlimited"""
+        if not per_minute:
+            return None
+        return TokenBucket(per_minute, per_minute * burst_seconds / 60 if burst_seconds else None)
+
+    def _get_lock(self) -> asyncio.Lock:
+        """Get the FIFO lock for the running event loop"""
+        loop = asyncio.get_running_loop()
+        if self._lock is None or self._loop is not loop:
+            self._lock = asyncio.Lock()
+            self._loop = loop
+        return self._lock
+
+    async def acquire(self, units: float = 0) -> None:
+        """Wait until one request of the given size fits in the budget
+
+        Args:
+            units: Tokens or characters the request will use (estimated)
+        """
+        if self.coordinator is not None:
+            # Coordinator calls block, so they run off the event loop
+            wait = await asyncio.get_running_loop().run_in_executor(
+                None, self.coordinator.reserve, self.name, self.settings, units
+            )
+            if wait > 0:
+                self.waits += 1
+                self.wait_seconds += wait
+                await asyncio.sleep(wait)
+            return
+
+        async with self._get_lock():
+            while True:
+                wait = 0.0
+                if self.requests is not None:
+                    wait = max(wait, self.requests.wait_time(1))
+                if self.units is not None and units:
+                    wait = max(wait, self.units.wait_time(units))
+                if wait <= 0:
+                    break
+
+                self.waits += 1
+                self.wait_seconds += wait
+                await asyncio.sleep(wait)
+
+            if self.requests is not None:
+                self.requests.consume(1)
+            if self.units is not None and units:
+                self.units.consume(units)
+
+    def settle(self, estimated_units: float, actual_units: float) -> None:
+        """Correct the unit budget once a request's real usage is known"""
+        if self.coordinator is not None:
+            if actual_units != estimated_units:
+                asyncio.get_running_loop().run_in_executor(
+                    None, self.coordinator.settle, self.name, self.settings, estimated_units, actual_units
+                )
+            return
+        if self.units is None:
+            return
+        if actual_units < estimated_units:
+            self.units.refund(estimated_units - actual_units)
+        elif actual_units > estimated_units:
+            self.units.consume(actual_units - estimated_units)
+
+    def reserve(self, units: float = 0) -> float:
+        """Take budget for one request now and return the seconds to wait
+
+        Non-blocking counterpart of acquire, used by the coordinator.
+        """
+        wait = 0.0
+        if self.requests is not None:
+            wait = max(wait, self.requests.reserve(1))
+        if self.units is not None and units:
+            wait = max(wait, self.units.reserve(units))
+        if wait > 0:
+            self.waits += 1
+            self.wait_seconds += wait
+        return wait
+
+    def snapshot(self) -> Dict[str, Any]:
+        """Current budget and queueing counters, for reporting"""
+        return {
+            "requests_available": round(self.requests.available, 1) if self.requests else None,
+            "units_available": round(self.units.available, 1) if self.units else None,
+            "waits": self.waits,
+            "wait_seconds": round(self.wait_seconds, 2)
+        }
+
+
+class RateLimitCoordinator:
+    """Rate limit buckets held in one process on behalf of many
+
+    Served through a multiprocessing manager, so every worker process of a
+    sharded batch draws from the same per-minute budgets. Each request costs
+    a single round trip: the budget is reserved immediately and the worker
+    sleeps locally for the returned wait.
+
+    It also keeps the batch's estimated spend, so a budget covers every
+    process rather than each one separately.
+    """
+
+    def __init__(self):
+        """Initialize with no limiters (created on first use)"""
+        self._limiters: Dict[str, RateLimiter] = {}
+        self._spent_usd = 0.0
+        # The manager serves each worker from its own thread
+        self._spend_lock = threading.Lock()
+
+    def _get(self, name: str, settings: Dict[str, Any]) -> RateLimiter:
+        if name not in self._limiters:
+            self._limiters[name] = RateLimiter(name, **settings)
+        return self._limiters[name]
+
+    def reserve(self, name: str, settings: Dict[str, Any], units: float = 0) -> float:
+        """Reserve budget for one request and return the seconds to wait"""
+        return self._get(name, settings).reserve(units)
+
+    def settle(self, name: str, settings: Dict[str, Any], estimated_units: float, actual_units: float) -> None:
+        """Correct the unit budget once a request's real usage is known"""
+        self._get(name, settings).settle(estimated_units, actual_units)
+
+    def add_spend(self, cost_usd: float) -> float:
+        """Add the estimated cost of one provider call and return the total spent"""
+        with self._spend_lock:
+            self._spent_usd += cost_usd
+            return self._spent_usd
+
+    def spent_usd(self) -> float:
+        """Estimated spend across every process so far"""
+        return self._spent_usd
+
+    def snapshot(self) -> Dict[str, Dict[str, Any]]:
+        """Current state of every shared limiter"""
+        return {name: limiter.snapshot() for name, limiter in self._limiters.items()}
+
+
+# Limiters shared across provider instances, keyed by provider and API key
+_rate_limiters: Dict[str, RateLimiter] = {}
+
+# Coordinator of the parent process, when running as a batch worker
+_coordinator: Optional[RateLimitCoordinator] = None
+
+
+def set_rate_limit_coordinator(coordinator: Optional[RateLimitCoordinator]) -> None:
+    """Route this process's rate limiters through a shared coordinator
+
+    Args:
+        coordinator: Coordinator (or manager proxy to one), or None for local limits
+    """
+    global _coordinator
+    _coordinator = coordinator
+    for limiter in _rate_limiters.values():
+        limiter.coordinator = coordinator
+
+
+def get_rate_limiter(
+    kind: str,
+    provider_type: str,
+    api_key: Optional[str],
+    settings: Dict[str, Any],
+    base_url: Optional[str] = None,
+    organization: Optional[str] = None
+) -> RateLimiter:
+    """Get the shared rate limiter for a provider, endpoint and API key
+
+    Args:
+        kind: 'llm' or 'tts'
+        provider_type: Provider type from config (e.g. 'openai', 'cartesia')
+        api_key: API key the provider uses (only a hash is kept)
+        settings: requests_per_minute plus tokens_per_minute or
+            characters_per_minute, and optional burst_seconds (only used
+            when the limiter is first created)
+        base_url: API base URL override; a self-hosted server has its own
+            quota even without a key
+        organization: Organization the key bills to; each one has its own quota
+
+    Returns:
+        RateLimiter shared by every provider with the same key, endpoint
+        and organization
+    """
+    identity = api_key or ""
+    if base_url or organization:
+        identity += f"\0{base_url or ''}\0{organization or ''}"
+    key_hash = hashlib.sha256(identity.encode()).hexdigest()[:8]
+    name = f"{kind}:{provider_type}:{key_hash}"
+
+    if name not in _rate_limiters:
+        _rate_limiters[name] = RateLimiter(
+            name,
+            requests_per_minute=settings.get('requests_per_minute'),
+            units_per_minute=settings.get('tokens_per_minute') or settings.get('characters_per_minute'),
+            burst_seconds=settings.get('burst_seconds')
+        )
+        _rate_limiters[name].coordinator = _coordinator
+    return _rate_limiters[name]
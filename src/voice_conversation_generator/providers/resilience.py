@@ -0,0 +1,426 @@
+"""
+Resilience - Retries with backoff and circuit breakers around any provider
+"""
+import asyncio
+import random
+import time
+from typing import Dict, Any, Optional, List, AsyncIterator, Awaitable, Callable
+
+from ..models import VoiceConfig
+from .base import LLMProvider, TTSProvider
+from .errors import ProviderError
+
+
+class CircuitOpenError(ProviderError):
+    """Raised without calling the provider while its circuit breaker is open"""
+
+
+class RetryPolicy:
+    """Jittered exponential backoff for transient provider failures"""
+
+    # Client errors that are worth retrying (timeouts, conflicts, rate limits)
+    RETRYABLE_STATUS = {408, 409, 429}
+
+    def __init__(
+        self,
+        max_attempts: int = 4,
+        base_delay: float = 0.5,
+        max_delay: float = 20.0,
+        max_retry_after: float = 60.0,
+        attempt_timeout: Optional[float] = None
+    ):
+        """Initialize the policy
+
+        Args:
+            max_attempts: Total attempts per request, including the first
+            base_delay: Backoff ceiling for the first retry in seconds
+            max_delay: Upper bound of the backoff ceiling in seconds
+            max_retry_after: Longest Retry-After header we honour in seconds
+            attempt_timeout: Seconds after which a stalled attempt is
+                abandoned and retried (None = wait indefinitely)
+        """
+        self.max_attempts = max(1, max_attempts)
+        self.base_delay = base_delay
+        self.max_delay = max_delay
+        self.max_retry_after = max_retry_after
+        self.attempt_timeout = attempt_timeout
+
+    def is_retryable(self, error: BaseException) -> bool:
+        """Whether a failed request may succeed if sent again"""
+        if not isinstance(error, ProviderError) or isinstance(error, CircuitOpenError):
+            return False
+        if error.is_timeout or error.status_code in self.RETRYABLE_STATUS:
+            return True
+        # No status code means the request never got a response (connection error)
+        return error.status_code is None or error.status_code >= 500
+
+    def delay(self, attempt: int, error: BaseException) -> float:
+        """Seconds to wait before the given retry (1 = first retry)
+
+        Honours Retry-After when the provider sent one, otherwise uses full
+        jitter so concurrent conversations don't retry in lockstep.
+        """
+        retry_after = getattr(error, 'retry_after', None)
+        if retry_after is not None:
+            return min(retry_after, self.max_retry_after)
+        return random.uniform(0, min(self.max_delay, self.base_delay * 2 ** (attempt - 1)))
+
+
+class CircuitBreaker:
+    """Stops calling a provider after repeated failures, then probes it
+
+    closed: requests flow normally
+    open: requests fail immediately until reset_timeout has passed
+    half_open: one probe request is let through; success closes the circuit
+    """
+
+    def __init__(self, name: str, failure_threshold: int = 5, reset_timeout: float = 30.0):
+        """Initialize the breaker
+
+        Args:
+            name: Provider key (for reporting)
+            failure_threshold: Consecutive failures that open the circuit
+            reset_timeout: Seconds to wait before probing an open circuit
+        """
+        self.name = name
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+
+        self.state = "closed"
+        self.consecutive_failures = 0
+        self.times_opened = 0
+        self._opened_at = 0.0
+        self._probe_in_flight = False
+
+    def before_request(self) -> None:
+        """Raise CircuitOpenError if the request must not be sent"""
+        if self.state == "open":
+            if time.monotonic() - self._opened_at < self.reset_timeout:
+                raise CircuitOpenError(
+                    f"Circuit open for {self.name} after {self.consecutive_failures} consecutive failures",
+                    provider=self.name
+                )
+            self.state = "half_open"
+            self._probe_in_flight = False
+
+        if self.state == "half_open":
+            if self._probe_in_flight:
+                raise CircuitOpenError(f"Circuit half-open for {self.name}, probe in progress", provider=self.name)
+            self._probe_in_flight = True
+
+    def allows_request(self) -> bool:
+        """Whether before_request would let a request through (without side effects)"""
+        if self.state == "open":
+            return time.monotonic() - self._opened_at >= self.reset_timeout
+        if self.state == "half_open":
+            return not self._probe_in_flight
+        return True
+
+    def record_client_error(self) -> None:
+        """Leave the circuit as it is after an error that isn't the provider's fault
+
+        Frees a half-open probe so the next request can probe instead.
+        """
+        self._probe_in_flight = False
+
+    def record_success(self) -> None:
+        """Close the circuit after a successful request"""
+        self.state = "closed"
+        self.consecutive_failures = 0
+        self._probe_in_flight = False
+
+    def record_failure(self) -> None:
+        """Count a provider failure, opening the circuit at the threshold"""
+        self.consecutive_failures += 1
+        self._probe_in_flight = False
+        if self.state == "half_open" or self.consecutive_failures >= self.failure_threshold:
+            if self.state != "open":
+                self.times_opened += 1
+            self.state = "open"
+            self._opened_at = time.monotonic()
+
+    def snapshot(self) -> Dict[str, Any]:
+        """Current state and counters, for metrics"""
+        return {
+            "state": self.state,
+            "consecutive_failures": self.consecutive_failures,
+            "times_opened": self.times_opened
+        }
+
+
+# Breakers shared across provider instances, keyed by provider
+_circuit_breakers: Dict[str, CircuitBreaker] = {}
+
+
+def get_circuit_breaker(name: str, **settings) -> CircuitBreaker:
+    """Get the shared circuit breaker for a provider key
+
+    Args:
+        name: Provider key (e.g. 'tts:cartesia')
+        **settings: CircuitBreaker settings (only used on creation)
+
+    Returns:
+        Shared CircuitBreaker
+    """
+    if name not in _circuit_breakers:
+        _circuit_breakers[name] = CircuitBreaker(name, **settings)
+    return _circuit_breakers[name]
+
+
+def retry_hook_kwargs(provider: Any, on_retry: Optional[Callable[[BaseException], None]]) -> Dict[str, Any]:
+    """Keyword arguments passing on_retry to a provider, if it retries
+
+    Only the resilient wrappers accept on_retry, so it is left out for a
+    provider with retries disabled rather than leaking into its API call.
+
+    Args:
+        provider: LLM or TTS provider (possibly wrapped)
+        on_retry: Callback for ResilientLLMProvider / ResilientTTSProvider
+
+    Returns:
+        {'on_retry': on_retry} or an empty dict
+    """
+    if on_retry is None or getattr(provider, 'retry_policy', None) is None:
+        return {}
+    return {'on_retry': on_retry}
+
+
+async def _attempt(request: Callable[[], Awaitable[Any]], timeout: Optional[float], provider: str) -> Any:
+    """Run one attempt, turning a stall past timeout into a retryable timeout error"""
+    if not timeout:
+        return await request()
+    try:
+        return await asyncio.wait_for(request(), timeout)
+    except asyncio.TimeoutError:
+        raise ProviderError(
+            f"Attempt timed out after {timeout:g}s", provider=provider, is_timeout=True
+        ) from None
+
+
+async def call_with_retry(
+    request: Callable[[], Awaitable[Any]],
+    retry_policy: RetryPolicy,
+    circuit_breaker: CircuitBreaker,
+    stats: Optional[Dict[str, Any]] = None,
+    on_retry: Optional[Callable[[BaseException], None]] = None
+) -> Any:
+    """Run a provider request with retries and circuit breaking
+
+    Args:
+        request: Coroutine factory performing one attempt
+        retry_policy: Backoff policy
+        circuit_breaker: Breaker guarding the provider
+        stats: Optional stats dict; 'retries' is incremented per retry
+        on_retry: Called with the error of every attempt that is retried
+            (e.g. AdaptiveLimiter.record_retry)
+
+    Returns:
+        The request's result
+    """
+    attempt = 1
+    while True:
+        circuit_breaker.before_request()
+        try:
+            result = await _attempt(request, retry_policy.attempt_timeout, circuit_breaker.name)
+        except Exception as e:
+            if retry_policy.is_retryable(e):
+                circuit_breaker.record_failure()
+            else:
+                # Not the provider's fault (e.g. a bad request); leave the breaker alone
+                circuit_breaker.record_client_error()
+            if attempt >= retry_policy.max_attempts or not retry_policy.is_retryable(e):
+                raise
+
+            if on_retry is not None:
+                on_retry(e)
+            await asyncio.sleep(retry_policy.delay(attempt, e))
+            attempt += 1
+            if stats is not None:
+                stats['retries'] = stats.get('retries', 0) + 1
+            continue
+
+        circuit_breaker.record_success()
+        return result
+
+
+class ResilientLLMProvider(LLMProvider):
+    """Wraps an LLM provider with retries and a circuit breaker"""
+
+    def __init__(self, provider: LLMProvider, retry_policy: RetryPolicy, circuit_breaker: CircuitBreaker):
+        """Initialize the wrapper
+
+        Args:
+            provider: Provider to wrap
+            retry_policy: Backoff policy for transient failures
+            circuit_breaker: Breaker shared by every instance of the provider
+        """
+        super().__init__(provider.config)
+        self.provider = provider
+        self.retry_policy = retry_policy
+        self.circuit_breaker = circuit_breaker
+        self.rate_limiter = provider.rate_limiter
+
+    def __getattr__(self, name: str) -> Any:
+        # Only called for attributes the wrapper lacks (client, model, ...)
+        if name == 'provider':
+            raise AttributeError(name)
+        return getattr(self.provider, name)
+
+    async def generate_completion(
+        self,
+        prompt: str,
+        system_prompt: Optional[str] = None,
+        temperature: float = 0.8,
+        max_tokens: int = 150,
+        **kwargs
+    ) -> str:
+        """Generate text completion, retrying transient failures"""
+        on_retry = kwargs.pop('on_retry', None)
+        return await call_with_retry(
+            lambda: self.provider.generate_completion(
+                prompt=prompt,
+                system_prompt=system_prompt,
+                temperature=temperature,
+                max_tokens=max_tokens,
+                **kwargs
+            ),
+            self.retry_policy,
+            self.circuit_breaker,
+            stats=kwargs.get('stats'),
+            on_retry=on_retry
+        )
+
+    async def generate_chat_completion(
+        self,
+        messages: List[Dict[str, str]],
+        temperature: float = 0.8,
+        max_tokens: int = 150,
+        **kwargs
+    ) -> str:
+        """Generate chat completion, retrying transient failures"""
+        on_retry = kwargs.pop('on_retry', None)
+        return await call_with_retry(
+            lambda: self.provider.generate_chat_completion(
+                messages=messages,
+                temperature=temperature,
+                max_tokens=max_tokens,
+                **kwargs
+            ),
+            self.retry_policy,
+            self.circuit_breaker,
+            stats=kwargs.get('stats'),
+            on_retry=on_retry
+        )
+
+    async def generate_chat_completion_stream(
+        self,
+        messages: List[Dict[str, str]],
+        temperature: float = 0.8,
+        max_tokens: int = 150,
+        **kwargs
+    ) -> AsyncIterator[str]:
+        """Stream a chat completion, retrying only until the first token arrives"""
+        stats = kwargs.get('stats')
+        on_retry = kwargs.pop('on_retry', None)
+        attempt = 1
+        while True:
+            self.circuit_breaker.before_request()
+            started = False
+            try:
+                async for token in self.provider.generate_chat_completion_stream(
+                    messages=messages,
+                    temperature=temperature,
+                    max_tokens=max_tokens,
+                    **kwargs
+                ):
+                    started = True
+                    yield token
+            except Exception as e:
+                retryable = self.retry_policy.is_retryable(e)
+                if retryable:
+                    self.circuit_breaker.record_failure()
+                else:
+                    self.circuit_breaker.record_client_error()
+                # Tokens already yielded can't be taken back
+                if started or not retryable or attempt >= self.retry_policy.max_attempts:
+                    raise
+
+                if on_retry is not None:
+                    on_retry(e)
+                await asyncio.sleep(self.retry_policy.delay(attempt, e))
+                attempt += 1
+                if stats is not None:
+                    stats['retries'] = stats.get('retries', 0) + 1
+                continue
+
+            self.circuit_breaker.record_success()
+            return
+
+    async def warm_up(self, connections: int = 1) -> None:
+        """Open connections of the wrapped provider"""
+        await self.provider.warm_up(connections)
+
+    def get_model_name(self) -> str:
+        """Get the name of the model being used"""
+        return self.provider.get_model_name()
+
+    def get_pricing(self, model: Optional[str] = None) -> Dict[str, float]:
+        """Get token prices of the wrapped provider"""
+        return self.provider.get_pricing(model)
+
+
+class ResilientTTSProvider(TTSProvider):
+    """Wraps a TTS provider with retries and a circuit breaker"""
+
+    def __init__(self, provider: TTSProvider, retry_policy: RetryPolicy, circuit_breaker: CircuitBreaker):
+        """Initialize the wrapper
+
+        Args:
+            provider: Provider to wrap
+            retry_policy: Backoff policy for transient failures
+            circuit_breaker: Breaker shared by every instance of the provider
+        """
+        super().__init__(provider.config)
+        self.provider = provider
+        self.retry_policy = retry_policy
+        self.circuit_breaker = circuit_breaker
+        self.rate_limiter = provider.rate_limiter
+
+    def __getattr__(self, name: str) -> Any:
+        # Only called for attributes the wrapper lacks (client, model, ...)
+        if name == 'provider':
+            raise AttributeError(name)
+        return getattr(self.provider, name)
+
+    async def generate_speech(
+        self,
+        text: str,
+        voice_config: VoiceConfig,
+        **kwargs
+    ) -> bytes:
+        """Generate speech audio, retrying transient failures"""
+        on_retry = kwargs.pop('on_retry', None)
+        return await call_with_retry(
+            # Providers pop keys from kwargs, so each attempt gets a fresh copy
+            lambda: self.provider.generate_speech(text=text, voice_config=voice_config, **dict(kwargs)),
+            self.retry_policy,
+            self.circuit_breaker,
+            stats=kwargs.get('stats'),
+            on_retry=on_retry
+        )
+
+    async def warm_up(self, connections: int = 1) -> None:
+        """Open connections of the wrapped provider"""
+        await self.provider.warm_up(connections)
+
+    def get_supported_voices(self) -> List[str]:
+        """Get list of supported voice IDs"""
+        return self.provider.get_supported_voices()
+
+    def get_provider_name(self) -> str:
+        """Get the name of the TTS provider"""
+        return self.provider.get_provider_name()
+
+    def get_pricing(self, model: Optional[str] = None) -> Dict[str, float]:
+        """Get speech prices of the wrapped provider"""
+        return self.provider.get_pricing(model)
@@ -0,0 +1,404 @@
+"""
+Response Cache - Persistent LLM responses for free, deterministic reruns
+Responses are keyed on everything that determines them (model, messages,
+temperature, max_tokens, seed) and stored in SQLite or a content-addressed
+directory, evicting the least recently used entries past a size limit
+"""
+import hashlib
+import json
+import os
+import re
+import sqlite3
+import threading
+import time
+from pathlib import Path
+from typing import Dict, Any, Optional, List, AsyncIterator
+
+from .base import LLMProvider
+
+
+# Cache modes
+READ_THROUGH = "read_through"  # Serve hits, call and store on a miss
+RECORD = "record"  # Always call the provider and store (refreshes entries)
+REPLAY = "replay"  # Serve hits, fail on a miss (no provider calls)
+BYPASS = "bypass"  # Neither read nor write
+
+CACHE_MODES = [READ_THROUGH, RECORD, REPLAY, BYPASS]
+
+
+class CacheMissError(RuntimeError):
+    """Raised in replay mode for a request that was never recorded"""
+
+
+def cache_key(
+    model: str,
+    messages: List[Dict[str, str]],
+    temperature: float,
+    max_tokens: int,
+    seed: Optional[int] = None
+) -> str:
+    """Content address of an LLM request"""
+    payload = json.dumps(
+        {"model": model, "messages": messages, "temperature": temperature, "max_tokens": max_tokens, "seed": seed},
+        sort_keys=True,
+        ensure_ascii=False
+    )
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+class SQLiteResponseCache:
+    """Responses in one SQLite file, evicted least recently used first"""
+
+    def __init__(self, path: str, max_bytes: int = 512 * 1024 * 1024):
+        """Open (and create if needed) the cache database
+
+        Args:
+            path: SQLite database file
+            max_bytes: Total response size kept before evicting
+        """
+        self.path = path
+        self.max_bytes = max_bytes
+        self.evictions = 0
+
+        Path(path).parent.mkdir(parents=True, exist_ok=True)
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(path, timeout=30, isolation_level=None, check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS responses ("
+            "key TEXT PRIMARY KEY, value TEXT NOT NULL, size INTEGER NOT NULL, last_used REAL NOT NULL)"
+        )
+        self._conn.execute("CREATE INDEX IF NOT EXISTS responses_lru ON responses (last_used)")
+
+    def get(self, key: str) -> Optional[Dict[str, Any]]:
+        """Get an entry, marking it as recently used"""
+        with self._lock:
+            row = self._conn.execute("SELECT value FROM responses WHERE key = ?", (key,)).fetchone()
+            if row is None:
+                return None
+            self._conn.execute("UPDATE responses SET last_used = ? WHERE key = ?", (time.time(), key))
+        return json.loads(row[0])
+
+    def put(self, key: str, entry: Dict[str, Any]) -> None:
+        """Store an entry, evicting old ones past max_bytes"""
+        value = json.dumps(entry, ensure_ascii=False)
+        with self._lock:
+            self._conn.execute("BEGIN IMMEDIATE")
+            try:
+                self._conn.execute(
+                    "INSERT OR REPLACE INTO responses (key, value, size, last_used) VALUES (?, ?, ?, ?)",
+                    (key, value, len(value.encode("utf-8")), time.time())
+                )
+                total = self._conn.execute("SELECT COALESCE(SUM(size), 0) FROM responses").fetchone()[0]
+                while total > self.max_bytes:
+                    oldest = self._conn.execute(
+                        "SELECT key, size FROM responses ORDER BY last_used LIMIT 1"
+                    ).fetchone()
+                    if oldest is None or oldest[0] == key:
+                        break
+                    self._conn.execute("DELETE FROM responses WHERE key = ?", (oldest[0],))
+                    total -= oldest[1]
+                    self.evictions += 1
+            except BaseException:
+                self._conn.execute("ROLLBACK")
+                raise
+            self._conn.execute("COMMIT")
+
+    def snapshot(self) -> Dict[str, Any]:
+        """Entry count, size and evictions, for metrics"""
+        with self._lock:
+            entries, size = self._conn.execute("SELECT COUNT(*), COALESCE(SUM(size), 0) FROM responses").fetchone()
+        return {"backend": "sqlite", "entries": entries, "bytes": size, "evictions": self.evictions}
+
+
+class DirectoryResponseCache:
+    """Responses as content-addressed JSON files, evicted by access time
+
+    Files live at <path>/<key[:2]>/<key>.json, so a cache directory can be
+    shared, diffed or checked into test fixtures.
+    """
+
+    def __init__(self, path: str, max_bytes: int = 512 * 1024 * 1024):
+        """Open (and create if needed) the cache directory
+
+        Args:
+            path: Cache directory
+            max_bytes: Total response size kept before evicting
+        """
+        self.path = Path(path)
+        self.max_bytes = max_bytes
+        self.evictions = 0
+
+        self.path.mkdir(parents=True, exist_ok=True)
+        self._lock = threading.Lock()
+        self._size = sum(f.stat().st_size for f in self.path.glob("*/*.json"))
+
+    def _file(self, key: str) -> Path:
+        return self.path / key[:2] / f"{key}.json"
+
+    def get(self, key: str) -> Optional[Dict[str, Any]]:
+        """Get an entry, marking it as recently used"""
+        file = self._file(key)
+        try:
+            entry = json.loads(file.read_text(encoding="utf-8"))
+            os.utime(file)
+        except (FileNotFoundError, json.JSONDecodeError):
+            return None
+        return entry
+
+    def put(self, key: str, entry: Dict[str, Any]) -> None:
+        """Store an entry, evicting old ones past max_bytes"""
+        file = self._file(key)
+        file.parent.mkdir(exist_ok=True)
+        data = json.dumps(entry, ensure_ascii=False, indent=2).encode("utf-8")
+
+        with self._lock:
+            previous = file.stat().st_size if file.exists() else 0
+            # Write then rename, so concurrent readers never see half a file
+            temp = file.with_suffix(f".{os.getpid()}.tmp")
+            temp.write_bytes(data)
+            os.replace(temp, file)
+            self._size += len(data) - previous
+
+            if self._size > self.max_bytes:
+                files = sorted(self.path.glob("*/*.json"), key=lambda f: f.stat().st_mtime)
+                for old in files:
+                    if self._size <= self.max_bytes:
+                        break
+                    if old == file:
+                        continue
+                    self._size -= old.stat().st_size
+                    old.unlink(missing_ok=True)
+                    self.evictions += 1
+
+    def snapshot(self) -> Dict[str, Any]:
+        """Entry count, size and evictions, for metrics"""
+        return {
+            "backend": "directory",
+            "entries": sum(1 for _ in self.path.glob("*/*.json")),
+            "bytes": self._size,
+            "evictions": self.evictions
+        }
+
+
+# Caches shared by every provider instance, keyed by path
+_response_caches: Dict[str, Any] = {}
+
+
+def get_response_cache(path: str, backend: str = "sqlite", max_mb: float = 512) -> Any:
+    """Get the shared response cache stored at path
+
+    Args:
+        path: SQLite file or directory
+        backend: 'sqlite' or 'directory'
+        max_mb: Size limit in MB (only used on creation)
+
+    Returns:
+        Shared SQLiteResponseCache or DirectoryResponseCache
+
+    Raises:
+        ValueError: If the backend is not supported
+    """
+    if path not in _response_caches:
+        if backend == "sqlite":
+            _response_caches[path] = SQLiteResponseCache(path, max_bytes=int(max_mb * 1024 * 1024))
+        elif backend == "directory":
+            _response_caches[path] = DirectoryResponseCache(path, max_bytes=int(max_mb * 1024 * 1024))
+        else:
+            raise ValueError(f"Unsupported response cache backend: {backend}")
+    return _response_caches[path]
+
+
+class CachingLLMProvider(LLMProvider):
+    """Wraps an LLM provider with a persistent response cache
+
+    Hits cost nothing: they report no token usage and never reach the
+    provider (or its rate limiter and retries). Every call reports
+    'cache_hit' in its stats dict.
+    """
+
+    def __init__(self, provider: LLMProvider, cache: Any, mode: str = READ_THROUGH, seed: Optional[int] = None):
+        """Initialize the wrapper
+
+        Args:
+            provider: Provider to wrap
+            cache: SQLiteResponseCache or DirectoryResponseCache
+            mode: read_through, record, replay or bypass
+            seed: Sampling seed forwarded to the provider and keyed on
+
+        Raises:
+            ValueError: If the mode is not supported
+        """
+        if mode not in CACHE_MODES:
+            raise ValueError(f"Unsupported cache mode: {mode}")
+        super().__init__(provider.config)
+        self.provider = provider
+        self.cache = cache
+        self.mode = mode
+        self.seed = seed
+        self.rate_limiter = provider.rate_limiter
+
+        self.hits = 0
+        self.misses = 0
+
+    def __getattr__(self, name: str) -> Any:
+        # Only called for attributes the wrapper lacks (client, circuit_breaker, ...)
+        if name == 'provider':
+            raise AttributeError(name)
+        return getattr(self.provider, name)
+
+    def _key(self, messages: List[Dict[str, str]], temperature: float, max_tokens: int, kwargs: Dict[str, Any]) -> str:
+        seed = kwargs.get('seed', self.seed)
+        return cache_key(kwargs.get('model') or self.get_model_name(), messages, temperature, max_tokens, seed)
+
+    def _provider_kwargs(self, kwargs: Dict[str, Any]) -> Dict[str, Any]:
+        if self.seed is not None and 'seed' not in kwargs:
+            return {**kwargs, 'seed': self.seed}
+        return kwargs
+
+    def _lookup(self, key: str, stats: Optional[Dict[str, Any]]) -> Optional[str]:
+        """Cached text for a key (None on a miss), per the cache mode
+
+        Raises:
+            CacheMissError: On a miss in replay mode
+        """
+        if self.mode == BYPASS:
+            return None
+
+        entry = self.cache.get(key) if self.mode != RECORD else None
+        if entry is None:
+            if self.mode == REPLAY:
+                raise CacheMissError(f"No recorded response for request {key[:12]} (replay mode)")
+            self.misses += 1
+            if stats is not None:
+                stats['cache_hit'] = False
+            return None
+
+        self.hits += 1
+        if stats is not None:
+            stats['cache_hit'] = True
+            stats['model'] = entry.get('model')
+        return entry['text']
+
+    def _store(self, key: str, text: str, stats: Dict[str, Any]) -> None:
+        if self.mode == BYPASS:
+            return
+        self.cache.put(key, {
+            "text": text,
+            "model": stats.get('model') or self.get_model_name(),
+            # Usage of the original request, for reference
+            "usage": {k: stats[k] for k in ('prompt_tokens', 'completion_tokens', 'cached_tokens') if k in stats},
+            "created_at": time.time()
+        })
+
+    async def generate_completion(
+        self,
+        prompt: str,
+        system_prompt: Optional[str] = None,
+        temperature: float = 0.8,
+        max_tokens: int = 150,
+        **kwargs
+    ) -> str:
+        """Generate text completion, served from the cache when possible"""
+        messages = []
+        if system_prompt:
+            messages.append({"role": "system", "content": system_prompt})
+        messages.append({"role": "user", "content": prompt})
+        return await self.generate_chat_completion(messages, temperature=temperature, max_tokens=max_tokens, **kwargs)
+
+    async def generate_chat_completion(
+        self,
+        messages: List[Dict[str, str]],
+        temperature: float = 0.8,
+        max_tokens: int = 150,
+        **kwargs
+    ) -> str:
+        """Generate chat completion, served from the cache when possible"""
+        stats = kwargs.get('stats')
+        key = self._key(messages, temperature, max_tokens, kwargs)
+        cached = self._lookup(key, stats)
+        if cached is not None:
+            return cached
+
+        usage = stats if stats is not None else {}
+        text = await self.provider.generate_chat_completion(
+            messages=messages,
+            temperature=temperature,
+            max_tokens=max_tokens,
+            **{**self._provider_kwargs(kwargs), 'stats': usage}
+        )
+        self._store(key, text, usage)
+        return text
+
+    async def generate_completion_stream(
+        self,
+        prompt: str,
+        system_prompt: Optional[str] = None,
+        temperature: float = 0.8,
+        max_tokens: int = 150,
+        **kwargs
+    ) -> AsyncIterator[str]:
+        """Stream a text completion, replaying cached responses word by word"""
+        messages = []
+        if system_prompt:
+            messages.append({"role": "system", "content": system_prompt})
+        messages.append({"role": "user", "content": prompt})
+        async for token in self.generate_chat_completion_stream(
+            messages, temperature=temperature, max_tokens=max_tokens, **kwargs
+        ):
+            yield token
+
+    async def generate_chat_completion_stream(
+        self,
+        messages: List[Dict[str, str]],
+        temperature: float = 0.8,
+        max_tokens: int = 150,
+        **kwargs
+    ) -> AsyncIterator[str]:
+        """Stream a chat completion, replaying cached responses word by word
+
+        A streamed response is only stored once it has completed.
+        """
+        stats = kwargs.get('stats')
+        key = self._key(messages, temperature, max_tokens, kwargs)
+        cached = self._lookup(key, stats)
+        if cached is not None:
+            for token in re.findall(r'\S+\s*', cached):
+                yield token
+            return
+
+        usage = stats if stats is not None else {}
+        text = ""
+        async for token in self.provider.generate_chat_completion_stream(
+            messages=messages,
+            temperature=temperature,
+            max_tokens=max_tokens,
+            **{**self._provider_kwargs(kwargs), 'stats': usage}
+        ):
+            text += token
+            yield token
+        self._store(key, text, usage)
+
+    async def warm_up(self, connections: int = 1) -> None:
+        """Open connections of the wrapped provider (unless replaying)"""
+        if self.mode != REPLAY:
+            await self.provider.warm_up(connections)
+
+    def get_model_name(self) -> str:
+        """Get the name of the model being used"""
+        return self.provider.get_model_name()
+
+    def get_pricing(self, model: Optional[str] = None) -> Dict[str, float]:
+        """Get token prices of the wrapped provider"""
+        return self.provider.get_pricing(model)
+
+    def cache_snapshot(self) -> Dict[str, Any]:
+        """Hit counters and cache size, for metrics"""
+        lookups = self.hits + self.misses
+        return {
+            "mode": self.mode,
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": round(self.hits / lookups, 4) if lookups else 0.0,
+            **self.cache.snapshot()
+        }
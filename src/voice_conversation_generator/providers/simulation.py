@@ -0,0 +1,176 @@
+"""
+Simulation helpers - Latency and failure models shared by the mock providers
+"""
+import asyncio
+import json
+import random
+from pathlib import Path
+from typing import Dict, Any, Optional, List
+
+from .errors import ProviderError
+
+
+def load_recorded_latencies(path: str, metrics_key: Optional[str] = None, stage: Optional[str] = None) -> List[float]:
+    """Collect recorded latencies (ms) from saved metrics or transcript JSON
+
+    Args:
+        path: JSON file or directory searched recursively
+        metrics_key: Per-turn list of the metrics (e.g. 'turn_ttft_ms'),
+            read from metrics files and the metrics embedded in transcripts
+        stage: Key of the transcript turns' stage_timings_ms (e.g. 'tts')
+
+    Returns:
+        All recorded values
+
+    Raises:
+        ValueError: If nothing was recorded
+    """
+    root = Path(path)
+    files = sorted(root.rglob('*.json')) if root.is_dir() else [root]
+
+    samples: List[float] = []
+    for file in files:
+        try:
+            data = json.loads(file.read_text())
+        except (OSError, json.JSONDecodeError):
+            continue
+        if not isinstance(data, dict):
+            continue
+
+        if metrics_key:
+            metrics = data['metrics'] if isinstance(data.get('metrics'), dict) else data
+            samples.extend(float(ms) for ms in metrics.get(metrics_key) or [])
+        if stage and isinstance(data.get('turns'), list):
+            samples.extend(
+                float(turn['stage_timings_ms'][stage]) for turn in data['turns']
+                if stage in (turn.get('stage_timings_ms') or {})
+            )
+
+    if not samples:
+        raise ValueError(f"No recorded {metrics_key or stage} latencies found in {path}")
+    return samples
+
+
+class LatencyModel:
+    """Samples request latencies from a distribution or recorded values"""
+
+    DISTRIBUTIONS = ['lognormal', 'normal', 'uniform', 'constant']
+
+    def __init__(
+        self,
+        rng: random.Random,
+        median_ms: float,
+        distribution: str = 'lognormal',
+        sigma: float = 0.5,
+        stddev_ms: Optional[float] = None,
+        min_ms: float = 0,
+        max_ms: Optional[float] = None,
+        recorded_ms: Optional[List[float]] = None
+    ):
+        """Initialize the model
+
+        Args:
+            rng: Random source (seeded for reproducible runs)
+            median_ms: Median (lognormal) or mean of the latency
+            distribution: 'lognormal', 'normal', 'uniform' or 'constant'
+            sigma: Shape of the lognormal (larger means a longer tail)
+            stddev_ms: Standard deviation of the normal (default median / 4)
+            min_ms: Lower bound of the uniform
+            max_ms: Upper bound of the uniform (default 2 x median)
+            recorded_ms: Recorded latencies sampled instead, when given
+
+        Raises:
+            ValueError: If the distribution is not supported
+        """
+        if distribution not in self.DISTRIBUTIONS:
+            raise ValueError(f"Unsupported latency distribution: {distribution}")
+        self.rng = rng
+        self.median_ms = median_ms
+        self.distribution = distribution
+        self.sigma = sigma
+        self.stddev_ms = stddev_ms if stddev_ms is not None else median_ms / 4
+        self.min_ms = min_ms
+        self.max_ms = max_ms if max_ms is not None else 2 * median_ms
+        self.recorded_ms = recorded_ms or []
+
+    def sample(self) -> float:
+        """Sample one latency in seconds"""
+        if self.recorded_ms:
+            return self.rng.choice(self.recorded_ms) / 1000
+
+        if self.distribution == 'lognormal':
+            ms = self.rng.lognormvariate(0, self.sigma) * self.median_ms
+        elif self.distribution == 'normal':
+            ms = self.rng.gauss(self.median_ms, self.stddev_ms)
+        elif self.distribution == 'uniform':
+            ms = self.rng.uniform(self.min_ms, self.max_ms)
+        else:
+            ms = self.median_ms
+        return max(ms, 0) / 1000
+
+
+class FaultInjector:
+    """Fails a configured share of requests the way real providers do"""
+
+    def __init__(
+        self,
+        rng: random.Random,
+        provider: str,
+        rate_limit_rate: float = 0.0,
+        timeout_rate: float = 0.0,
+        server_error_rate: float = 0.0,
+        retry_after: float = 1.0,
+        timeout_seconds: float = 5.0
+    ):
+        """Initialize the injector
+
+        Args:
+            rng: Random source (seeded for reproducible runs)
+            provider: Provider name reported in errors
+            rate_limit_rate: Share of requests rejected with a 429
+            timeout_rate: Share of requests that hang, then time out
+            server_error_rate: Share of requests failing with a 503
+            retry_after: Seconds sent with each 429
+            timeout_seconds: How long a timed out request hangs
+        """
+        self.rng = rng
+        self.provider = provider
+        self.rate_limit_rate = rate_limit_rate
+        self.timeout_rate = timeout_rate
+        self.server_error_rate = server_error_rate
+        self.retry_after = retry_after
+        self.timeout_seconds = timeout_seconds
+
+    async def maybe_fail(self) -> None:
+        """Raise an injected failure for the configured share of requests
+
+        Raises:
+            ProviderError: A 429, a 503, or a timeout (after hanging)
+        """
+        roll = self.rng.random()
+
+        if roll < self.rate_limit_rate:
+            raise ProviderError(
+                f"{self.provider} request failed: rate limit exceeded",
+                provider=self.provider,
+                status_code=429,
+                retry_after=self.retry_after
+            )
+        roll -= self.rate_limit_rate
+
+        if roll < self.timeout_rate:
+            await asyncio.sleep(self.timeout_seconds)
+            raise ProviderError(f"{self.provider} request timed out", provider=self.provider, is_timeout=True)
+        roll -= self.timeout_rate
+
+        if roll < self.server_error_rate:
+            raise ProviderError(
+                f"{self.provider} request failed: service unavailable",
+                provider=self.provider,
+                status_code=503
+            )
+
+    @classmethod
+    def from_config(cls, rng: random.Random, provider: str, settings: Optional[Dict[str, Any]]) -> 'FaultInjector':
+        """Build an injector from a provider config's 'errors' section"""
+        return cls(rng, provider, **(settings or {}))
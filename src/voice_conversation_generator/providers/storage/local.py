@@ -3,6 +3,7 @@ Local Storage Provider Implementation
 """
 import json
 import os
+import time
 from pathlib import Path
 from typing import Dict, Any, Optional, List
 from datetime import datetime
@@ -31,6 +32,7 @@ class LocalStorageProvider(StorageGateway):
             (self.base_path / 'audio').mkdir(exist_ok=True)
             (self.base_path / 'transcripts').mkdir(exist_ok=True)
             (self.base_path / 'metrics').mkdir(exist_ok=True)
+            (self.base_path / 'checkpoints').mkdir(exist_ok=True)
 
     def _generate_filename(self, prefix: str, extension: str) -> str:
         """Generate a unique filename with timestamp"""
@@ -124,9 +126,12 @@ class LocalStorageProvider(StorageGateway):
         Returns:
             Dictionary with paths to stored files
         """
-        # Generate base filename
+        # Generate base filename (include the conversation ID so concurrent
+        # conversations of the same scenario never overwrite each other)
         timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
         base_name = f"{timestamp}_{conversation.scenario_name}"
+        if conversation.id:
+            base_name = f"{base_name}_{conversation.id}"
 
         result = {}
 
@@ -144,6 +149,16 @@ class LocalStorageProvider(StorageGateway):
         if audio_data:
             conversation.audio_url = audio_path
 
+        # Save audio first, so the time it took reaches the metrics below
+        storage_start = time.time()
+        if audio_data:
+            result['audio'] = await self.save_audio(
+                audio_data,
+                audio_key,
+                metadata={'conversation_id': conversation.id, 'scenario': conversation.scenario_name}
+            )
+        metrics.storage_write_ms = (time.time() - storage_start) * 1000
+
         # Save transcript
         transcript_data = conversation.to_dict(include_turns=True)
         transcript_data['metrics'] = metrics.to_dict()
@@ -154,14 +169,6 @@ class LocalStorageProvider(StorageGateway):
         Path(metrics_path).write_text(json.dumps(metrics.to_dict(), indent=2, default=str))
         result['metrics'] = metrics_path
 
-        # Save audio if provided
-        if audio_data:
-            result['audio'] = await self.save_audio(
-                audio_data,
-                audio_key,
-                metadata={'conversation_id': conversation.id, 'scenario': conversation.scenario_name}
-            )
-
         return result
 
     async def load_audio(self, key: str) -> bytes:
@@ -268,6 +275,170 @@ class LocalStorageProvider(StorageGateway):
 
         return deleted_any
 
+    def _checkpoint_dir(self, conversation_id: str) -> Path:
+        """Directory holding per-turn audio for a checkpoint"""
+        return self.base_path / 'checkpoints' / conversation_id
+
+    async def save_checkpoint(
+        self,
+        conversation: Conversation,
+        metrics: ConversationMetrics,
+        status: str = "in_progress",
+        extra: Optional[Dict[str, Any]] = None
+    ) -> str:
+        """Save an in-progress conversation to the checkpoints directory
+
+        Turn audio is written once per turn as checkpoints/<id>/turn_NNN.mp3.
+        The checkpoint JSON is written to a temporary file and renamed, so a
+        crash mid-write never leaves a corrupt checkpoint behind.
+
+        Args:
+            conversation: Conversation generated so far
+            metrics: Metrics collected so far
+            status: Checkpoint status
+            extra: Optional additional data to store
+
+        Returns:
+            Path to the checkpoint file
+        """
+        audio_dir = self._checkpoint_dir(conversation.id)
+
+        if status == "saved":
+            # The conversation is in permanent storage; keep only the marker
+            if audio_dir.exists():
+                for file_path in audio_dir.glob('*'):
+                    file_path.unlink()
+                audio_dir.rmdir()
+        else:
+            for turn in conversation.turns:
+                if not turn.audio_data:
+                    continue
+                audio_path = audio_dir / f"turn_{turn.turn_number:03d}.mp3"
+                if not audio_path.exists():
+                    audio_dir.mkdir(parents=True, exist_ok=True)
+                    audio_path.write_bytes(turn.audio_data)
+
+        data = {
+            'status': status,
+            'updated_at': datetime.now().isoformat(),
+            'conversation': conversation.to_dict(include_turns=True),
+            'metrics': metrics.to_dict()
+        }
+        if extra:
+            data.update(extra)
+
+        file_path = self.base_path / 'checkpoints' / f"{conversation.id}.json"
+        file_path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = file_path.with_suffix('.json.tmp')
+        tmp_path.write_text(json.dumps(data, indent=2, default=str))
+        os.replace(tmp_path, file_path)
+
+        return str(file_path)
+
+    async def load_checkpoint(self, conversation_id: str) -> Optional[Dict[str, Any]]:
+        """Load a conversation checkpoint, restoring turn audio
+
+        Args:
+            conversation_id: ID of the checkpointed conversation
+
+        Returns:
+            Checkpoint dictionary or None if not found
+        """
+        file_path = self.base_path / 'checkpoints' / f"{conversation_id}.json"
+        if not file_path.exists():
+            return None
+
+        data = json.loads(file_path.read_text())
+        conversation = Conversation.from_dict(data['conversation'])
+
+        audio_dir = self._checkpoint_dir(conversation_id)
+        for turn in conversation.turns:
+            audio_path = audio_dir / f"turn_{turn.turn_number:03d}.mp3"
+            if audio_path.exists():
+                turn.audio_data = audio_path.read_bytes()
+
+        data['conversation'] = conversation
+        data['metrics'] = ConversationMetrics.from_dict(data.get('metrics', {}))
+        return data
+
+    async def delete_checkpoint(self, conversation_id: str) -> bool:
+        """Delete a conversation checkpoint and its turn audio
+
+        Args:
+            conversation_id: ID of the checkpointed conversation
+
+        Returns:
+            True if a checkpoint was deleted
+        """
+        deleted = False
+
+        file_path = self.base_path / 'checkpoints' / f"{conversation_id}.json"
+        if file_path.exists():
+            file_path.unlink()
+            deleted = True
+
+        audio_dir = self._checkpoint_dir(conversation_id)
+        if audio_dir.exists():
+            for audio_path in audio_dir.glob('*'):
+                audio_path.unlink()
+            audio_dir.rmdir()
+            deleted = True
+
+        return deleted
+
+    async def list_checkpoints(self, status: Optional[str] = None) -> List[Dict[str, Any]]:
+        """List conversation checkpoints
+
+        Args:
+            status: Optional status to filter by
+
+        Returns:
+            List of checkpoint summaries
+        """
+        checkpoints = []
+        checkpoint_dir = self.base_path / 'checkpoints'
+
+        if not checkpoint_dir.exists():
+            return checkpoints
+
+        for file_path in sorted(checkpoint_dir.glob('*.json')):
+            try:
+                data = json.loads(file_path.read_text())
+            except json.JSONDecodeError:
+                continue
+
+            if status and data.get('status') != status:
+                continue
+
+            checkpoints.append({
+                'conversation_id': data['conversation'].get('id'),
+                'scenario_name': data['conversation'].get('scenario_name'),
+                'status': data.get('status'),
+                'total_turns': data['conversation'].get('total_turns', 0),
+                'updated_at': data.get('updated_at'),
+                'error': data.get('error')
+            })
+
+        return checkpoints
+
+    async def save_run_report(self, run_id: str, report: Dict[str, Any]) -> str:
+        """Save the run-level report of a batch
+
+        Args:
+            run_id: Batch run ID
+            report: Report data as dictionary
+
+        Returns:
+            Path to the stored report
+        """
+        file_path = self.base_path / 'runs' / f"{run_id}.json"
+        file_path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = file_path.with_suffix('.json.tmp')
+        tmp_path.write_text(json.dumps(report, indent=2, default=str))
+        os.replace(tmp_path, file_path)
+
+        return str(file_path)
+
     def get_storage_type(self) -> str:
         """Get the type of storage"""
         return "local"
\ No newline at end of file
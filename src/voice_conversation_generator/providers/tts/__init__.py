@@ -5,9 +5,11 @@ TTS Provider implementations
 from .openai import OpenAITTSProvider
 from .elevenlabs import ElevenLabsTTSProvider
 from .cartesia import CartesiaTTSProvider
+from .mock import MockTTSProvider
 
 __all__ = [
     "OpenAITTSProvider",
     "ElevenLabsTTSProvider",
     "CartesiaTTSProvider",
+    "MockTTSProvider",
 ]
\ No newline at end of file
@@ -2,15 +2,21 @@
 Cartesia TTS Provider Implementation
 """
 import os
+import time
 from typing import Dict, Any, List
 from cartesia import AsyncCartesia
 from ...models import VoiceConfig
 from ..base import TTSProvider
+from ..errors import ProviderError
+from ..http_pool import get_http_pool
 
 
 class CartesiaTTSProvider(TTSProvider):
     """Cartesia Text-to-Speech provider using Sonic models"""
 
+    # Default API host (a config base_url overrides it)
+    API_URL = "https://api.cartesia.ai"
+
     # Default voice IDs for different personas
     DEFAULT_VOICES = {
         # English voices
@@ -46,6 +52,7 @@ class CartesiaTTSProvider(TTSProvider):
         - default_voice: Default voice ID to use
         - language: Default language code (default: 'en')
         - output_format: Output audio format configuration
+        - base_url: API base URL override (e.g. a local StandInServer)
         """
         super().__init__(config)
 
@@ -54,8 +61,13 @@ class CartesiaTTSProvider(TTSProvider):
         if not api_key:
             raise ValueError("Cartesia API key not found in config or environment")
 
-        # Initialize async client
-        self.client = AsyncCartesia(api_key=api_key)
+        # Initialize async client on the connection pool shared by all providers
+        self.api_url = config.get('base_url') or self.API_URL
+        self.client = AsyncCartesia(
+            api_key=api_key,
+            base_url=self.api_url,
+            httpx_client=get_http_pool().async_client()
+        )
 
         # Set defaults - validate model is a Cartesia model, not from another provider
         config_model = config.get('model', 'sonic-3')
@@ -97,6 +109,7 @@ class CartesiaTTSProvider(TTSProvider):
         model = self.default_model
         voice_id = voice_config.voice_id or voice_config.voice_name or self.default_voice
         language = kwargs.pop('language', self.default_language)  # Use pop() to remove from kwargs
+        stats = kwargs.pop('stats', None)
 
         # Validate model
         if model not in self.SUPPORTED_MODELS:
@@ -112,6 +125,9 @@ class CartesiaTTSProvider(TTSProvider):
         if voice_id in self.DEFAULT_VOICES:
             voice_id = self.DEFAULT_VOICES[voice_id]
 
+        # Queue locally rather than exceed the account's per-minute limits
+        await self._throttle(text)
+
         try:
             # Generate audio using bytes streaming method
             bytes_iter = self.client.tts.bytes(
@@ -133,15 +149,21 @@ class CartesiaTTSProvider(TTSProvider):
 
             # Combine all chunks into single bytes object
             audio_data = b''.join(audio_chunks)
+            if stats is not None:
+                stats['model'] = model
+                stats['characters'] = len(text)
 
             # Convert PCM to MP3 if needed (for consistency with other providers)
             if self.output_format.get('container') == 'raw':
+                encode_start = time.time()
                 audio_data = self._convert_pcm_to_mp3(audio_data)
+                if stats is not None:
+                    stats['audio_encode_ms'] = (time.time() - encode_start) * 1000
 
             return audio_data
 
         except Exception as e:
-            raise RuntimeError(f"Cartesia TTS generation failed: {e}")
+            raise ProviderError.from_exception("cartesia", "Cartesia TTS generation failed", e) from e
 
     def _convert_pcm_to_mp3(self, pcm_data: bytes) -> bytes:
         """Convert PCM audio data to MP3 format
@@ -179,6 +201,10 @@ class CartesiaTTSProvider(TTSProvider):
             print(f"Warning: PCM to MP3 conversion failed: {e}. Returning raw PCM.")
             return pcm_data
 
+    async def warm_up(self, connections: int = 1) -> None:
+        """Open pooled connections to the API ahead of the first request"""
+        await get_http_pool().warm_up(self.api_url, connections)
+
     def get_supported_voices(self) -> List[str]:
         """Get list of default voice IDs"""
         return list(self.DEFAULT_VOICES.keys())
@@ -6,11 +6,16 @@ import asyncio
 from typing import Dict, Any, List, Optional
 from ...models import VoiceConfig
 from ..base import TTSProvider
+from ..errors import ProviderError
+from ..http_pool import get_http_pool
 
 
 class ElevenLabsTTSProvider(TTSProvider):
     """ElevenLabs Text-to-Speech provider"""
 
+    # Default API host (a config base_url overrides it)
+    API_URL = "https://api.elevenlabs.io"
+
     # Default voice IDs for different personas
     DEFAULT_VOICES = {
         'support': '2EiwWnXFnvU5JabPnv8n',  # Clyde - mature male
@@ -25,6 +30,7 @@ class ElevenLabsTTSProvider(TTSProvider):
         - api_key: ElevenLabs API key (or from env ELEVENLABS_API_KEY)
         - model: TTS model (default: 'eleven_turbo_v2_5')
         - default_voice_id: Default voice ID
+        - base_url: API base URL override (e.g. a local StandInServer)
         """
         super().__init__(config)
 
@@ -36,7 +42,13 @@ class ElevenLabsTTSProvider(TTSProvider):
         # Try to import ElevenLabs
         try:
             from elevenlabs import ElevenLabs
-            self.client = ElevenLabs(api_key=api_key)
+            # The sync SDK runs in executor threads, so it gets the pool's sync client
+            self.api_url = config.get('base_url') or self.API_URL
+            self.client = ElevenLabs(
+                api_key=api_key,
+                base_url=self.api_url,
+                httpx_client=get_http_pool().sync_client()
+            )
             self.available = True
         except ImportError:
             self.available = False
@@ -68,6 +80,7 @@ class ElevenLabsTTSProvider(TTSProvider):
         # Voice selection is handled by PersonaService via VoiceCatalog
         # The voice_id should already be a valid ElevenLabs voice ID
         voice_id = voice_config.voice_id or self.default_voice_id
+        stats = kwargs.pop('stats', None)
 
         # Build voice settings
         voice_settings = {
@@ -81,6 +94,9 @@ class ElevenLabsTTSProvider(TTSProvider):
         if hasattr(voice_config, 'use_speaker_boost'):
             voice_settings["use_speaker_boost"] = voice_config.use_speaker_boost
 
+        # Queue locally rather than exceed the account's per-minute limits
+        await self._throttle(text)
+
         try:
             # Run synchronous ElevenLabs in executor to avoid blocking
             loop = asyncio.get_event_loop()
@@ -103,10 +119,17 @@ class ElevenLabsTTSProvider(TTSProvider):
 
             # Run in executor
             audio_bytes = await loop.run_in_executor(None, _generate)
+            if stats is not None:
+                stats['model'] = self.default_model
+                stats['characters'] = len(text)
             return audio_bytes
 
         except Exception as e:
-            raise RuntimeError(f"ElevenLabs TTS generation failed: {e}")
+            raise ProviderError.from_exception("elevenlabs", "ElevenLabs TTS generation failed", e) from e
+
+    async def warm_up(self, connections: int = 1) -> None:
+        """Open pooled connections to the API ahead of the first request"""
+        await get_http_pool().warm_up_sync(self.api_url, connections)
 
     def get_supported_voices(self) -> List[str]:
         """Get list of supported voice IDs"""
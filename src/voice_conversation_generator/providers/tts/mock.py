@@ -0,0 +1,248 @@
+"""
+Mock TTS Provider Implementation
+Synthetic audio of realistic length and latency, for benchmarking the
+audio pipeline (combining, encoding, storage) without API calls
+"""
+import array
+import asyncio
+import math
+import random
+import re
+import sys
+import time
+from functools import lru_cache
+from typing import Dict, Any, List
+
+from ..base import TTSProvider
+from ..simulation import LatencyModel, FaultInjector, load_recorded_latencies
+from ...models import VoiceConfig
+
+
+# MPEG-1 Layer III bitrates (kbps) and sample rates, by header index
+MP3_BITRATES = [None, 32, 40, 48, 56, 64, 80, 96, 112, 128, 160, 192, 224, 256, 320]
+MP3_SAMPLE_RATES = [44100, 48000, 32000]
+MP3_SAMPLES_PER_FRAME = 1152
+
+SENTENCE_END = re.compile(r'[.!?।]+')
+
+
+def silent_mp3(duration_seconds: float, bitrate_kbps: int = 128, sample_rate: int = 44100) -> bytes:
+    """Build a valid mono MP3 of digital silence, without an encoder
+
+    Every frame has zeroed side information and main data, which decoders
+    play back as silence. Frames are padded as a real encoder would, so the
+    file has the exact size of a constant-bitrate MP3 of that duration.
+
+    Args:
+        duration_seconds: Length of the audio
+        bitrate_kbps: Constant bitrate (a standard MPEG-1 Layer III rate)
+        sample_rate: 44100, 48000 or 32000
+
+    Returns:
+        MP3 bytes
+
+    Raises:
+        ValueError: If the bitrate or sample rate is not valid for MPEG-1
+    """
+    if bitrate_kbps not in MP3_BITRATES or sample_rate not in MP3_SAMPLE_RATES:
+        raise ValueError(f"Unsupported MP3 bitrate/sample rate: {bitrate_kbps}kbps at {sample_rate}Hz")
+
+    # Sync word, MPEG-1, Layer III, no CRC; then bitrate, sample rate,
+    # padding bit; then mono, original
+    header = bytes([
+        0xFF,
+        0xFB,
+        (MP3_BITRATES.index(bitrate_kbps) << 4) | (MP3_SAMPLE_RATES.index(sample_rate) << 2),
+        0xC4
+    ])
+    frame_bytes = 144000 * bitrate_kbps / sample_rate
+    base = int(frame_bytes)
+    frames = [
+        header + bytes(base - 4),
+        header[:2] + bytes([header[2] | 0x02]) + header[3:] + bytes(base - 3)
+    ]
+
+    count = max(1, math.ceil(duration_seconds * sample_rate / MP3_SAMPLES_PER_FRAME))
+    fraction = frame_bytes - base
+    return b''.join(
+        frames[int((i + 1) * fraction) > int(i * fraction)]
+        for i in range(count)
+    )
+
+
+@lru_cache(maxsize=16)
+def _syllable(sample_rate: int, pitch_hz: float) -> array.array:
+    """One 200ms syllable: a harmonic tone under a smooth envelope"""
+    samples = int(sample_rate * 0.2)
+    return array.array('h', (
+        int(
+            6000 * math.sin(math.pi * n / samples) ** 2
+            * sum(math.sin(2 * math.pi * pitch_hz * h * n / sample_rate) / h for h in (1, 2, 3))
+        )
+        for n in range(samples)
+    ))
+
+
+def speech_like_pcm(duration_seconds: float, sample_rate: int = 24000, pitch_hz: float = 140.0) -> bytes:
+    """Build 16-bit mono PCM that sounds like syllables of voiced speech
+
+    One syllable is synthesized (once per sample rate and pitch) and
+    repeated about five times a second, so this costs almost nothing.
+
+    Args:
+        duration_seconds: Length of the audio
+        sample_rate: Samples per second
+        pitch_hz: Fundamental frequency of the voice
+
+    Returns:
+        Little-endian signed 16-bit PCM bytes
+    """
+    syllable = _syllable(sample_rate, pitch_hz)
+    total = max(1, int(duration_seconds * sample_rate))
+    pcm = syllable * (total // len(syllable) + 1)
+    del pcm[total:]
+    if sys.byteorder == 'big':
+        pcm.byteswap()
+    return pcm.tobytes()
+
+
+class MockTTSProvider(TTSProvider):
+    """Offline TTS provider for benchmarks and tests
+
+    Audio length follows the text at a configurable speech rate, and each
+    request takes a sampled time to first byte plus the time to generate
+    that much audio. Audio is a valid MP3 (silence) or speech-like PCM.
+    """
+
+    def __init__(self, config: Dict[str, Any]):
+        """Initialize the mock
+
+        Config may include:
+        - model: Model name reported in stats (default 'mock')
+        - seed: Makes latencies and failures reproducible
+        - output_format: 'mp3' (default) or 'pcm' (16-bit mono)
+        - sample_rate: Default 44100 for mp3 (44100, 48000 or 32000)
+          and 24000 for pcm
+        - bitrate_kbps: MP3 bitrate (default 128)
+        - encode_mp3: Encode the PCM to MP3 with pydub (needs ffmpeg),
+          like Cartesia's raw output, to benchmark encoding
+        - words_per_minute: Speech rate at voice speed 1.0 (default 150)
+        - sentence_pause_ms: Silence added per sentence (default 250)
+        - latency: distribution ('lognormal', 'normal', 'uniform' or
+          'constant'), ttfb_ms (median or mean, default 300), sigma,
+          stddev_ms, min_ms, max_ms (see LatencyModel),
+          realtime_factor (seconds of audio generated per second after
+          the first byte, default 10), and replay (transcript JSON file
+          or directory whose recorded 'tts' stage timings are sampled as
+          the whole request time instead)
+        - errors: rate_limit_rate, timeout_rate, server_error_rate,
+          retry_after and timeout_seconds (see FaultInjector)
+        - pricing: USD per 1M characters, to exercise budgets (default free)
+        """
+        super().__init__(config)
+        self.model = config.get('model', 'mock')
+        self.output_format = config.get('output_format', 'mp3')
+        if self.output_format not in ('mp3', 'pcm'):
+            raise ValueError(f"Unsupported mock output format: {self.output_format}")
+        self.sample_rate = config.get('sample_rate', 44100 if self.output_format == 'mp3' else 24000)
+        self.bitrate_kbps = config.get('bitrate_kbps', 128)
+        self.encode_mp3 = config.get('encode_mp3', False)
+        self.words_per_minute = config.get('words_per_minute', 150)
+        self.sentence_pause_ms = config.get('sentence_pause_ms', 250)
+
+        latency = dict(config.get('latency') or {})
+        self.realtime_factor = latency.pop('realtime_factor', 10.0)
+        replay = latency.pop('replay', None)
+
+        rng = random.Random(config.get('seed'))
+        self.latency = LatencyModel(
+            rng,
+            median_ms=latency.pop('ttfb_ms', 300.0),
+            recorded_ms=load_recorded_latencies(replay, stage='tts') if replay else None,
+            **latency
+        )
+        self.faults = FaultInjector.from_config(rng, "mock_tts", config.get('errors'))
+
+    def speech_duration(self, text: str, speed: float = 1.0) -> float:
+        """Seconds it takes to speak text at the configured rate
+
+        Args:
+            text: Text to speak
+            speed: Voice speed multiplier
+
+        Returns:
+            Duration in seconds
+        """
+        words = len(text.split())
+        sentences = max(1, len(SENTENCE_END.findall(text)))
+        speaking = words / (self.words_per_minute * (speed or 1.0)) * 60
+        return speaking + sentences * self.sentence_pause_ms / 1000
+
+    def _render(self, duration: float, stats: Dict[str, Any]) -> bytes:
+        """Produce audio of the given duration in the configured format"""
+        if self.output_format == 'mp3':
+            return silent_mp3(duration, self.bitrate_kbps, self.sample_rate)
+
+        audio_data = speech_like_pcm(duration, self.sample_rate)
+        if not self.encode_mp3:
+            return audio_data
+
+        encode_start = time.time()
+        try:
+            from pydub import AudioSegment
+            import io
+
+            audio = AudioSegment(data=audio_data, sample_width=2, frame_rate=self.sample_rate, channels=1)
+            mp3_buffer = io.BytesIO()
+            audio.export(mp3_buffer, format='mp3', bitrate=f'{self.bitrate_kbps}k')
+            audio_data = mp3_buffer.getvalue()
+        except ImportError:
+            print("Warning: pydub not installed. Returning raw PCM audio. Install with: pip install pydub")
+        except Exception as e:
+            print(f"Warning: PCM to MP3 conversion failed: {e}. Returning raw PCM.")
+        stats['audio_encode_ms'] = (time.time() - encode_start) * 1000
+        return audio_data
+
+    async def generate_speech(
+        self,
+        text: str,
+        voice_config: VoiceConfig,
+        **kwargs
+    ) -> bytes:
+        """Generate synthetic speech after the modelled latency
+
+        Args:
+            text: Text to convert to speech
+            voice_config: Voice configuration (only speed is used)
+            **kwargs: A 'stats' dict is filled like a real provider's
+
+        Returns:
+            Audio data as bytes (MP3, or PCM unless encode_mp3 is set)
+
+        Raises:
+            ProviderError: For injected failures
+        """
+        stats = kwargs.pop('stats', None)
+        usage = stats if stats is not None else {}
+
+        await self._throttle(text)
+        await self.faults.maybe_fail()
+
+        duration = self.speech_duration(text, voice_config.speed)
+        if self.latency.recorded_ms:
+            await asyncio.sleep(self.latency.sample())
+        else:
+            await asyncio.sleep(self.latency.sample() + duration / self.realtime_factor)
+
+        audio_data = self._render(duration, usage)
+        usage['model'] = self.model
+        usage['characters'] = len(text)
+        return audio_data
+
+    def get_supported_voices(self) -> List[str]:
+        """Get list of supported voice IDs (any voice is accepted)"""
+        return ['mock']
+
+    def get_provider_name(self) -> str:
+        """Get the name of the TTS provider"""
+        return "mock"
@@ -2,10 +2,12 @@
 OpenAI TTS Provider Implementation
 """
 import os
-from typing import Dict, Any, List
+from typing import Dict, Any, List, Optional
 from openai import AsyncOpenAI
 from ...models import VoiceConfig
 from ..base import TTSProvider
+from ..errors import ProviderError
+from ..http_pool import get_http_pool
 
 
 class OpenAITTSProvider(TTSProvider):
@@ -14,6 +16,12 @@ class OpenAITTSProvider(TTSProvider):
     SUPPORTED_VOICES = ['alloy', 'echo', 'fable', 'onyx', 'nova', 'shimmer']
     SUPPORTED_MODELS = ['tts-1', 'tts-1-hd']
 
+    # List prices in USD per 1M characters
+    MODEL_PRICING = {
+        'tts-1': {'characters': 15.00},
+        'tts-1-hd': {'characters': 30.00}
+    }
+
     def __init__(self, config: Dict[str, Any]):
         """Initialize OpenAI TTS client
 
@@ -21,6 +29,7 @@ class OpenAITTSProvider(TTSProvider):
         - api_key: OpenAI API key (or from env OPENAI_API_KEY)
         - model: TTS model ('tts-1' or 'tts-1-hd')
         - default_voice: Default voice to use
+        - base_url: API base URL override (e.g. a local StandInServer)
         """
         super().__init__(config)
 
@@ -29,8 +38,12 @@ class OpenAITTSProvider(TTSProvider):
         if not api_key:
             raise ValueError("OpenAI API key not found in config or environment")
 
-        # Initialize client
-        self.client = AsyncOpenAI(api_key=api_key)
+        # Initialize client on the connection pool shared by all providers
+        self.client = AsyncOpenAI(
+            api_key=api_key,
+            base_url=config.get('base_url'),
+            http_client=get_http_pool().async_client()
+        )
 
         # Set defaults
         self.default_model = config.get('model', 'tts-1')
@@ -62,6 +75,7 @@ class OpenAITTSProvider(TTSProvider):
         # OpenAI TTS doesn't support language parameter - it auto-detects
         # Remove it from kwargs if present
         kwargs.pop('language', None)
+        stats = kwargs.pop('stats', None)
 
         # Validate voice
         if voice not in self.SUPPORTED_VOICES:
@@ -74,6 +88,9 @@ class OpenAITTSProvider(TTSProvider):
         # Clamp speed to valid range (0.25 to 4.0)
         speed = max(0.25, min(4.0, speed))
 
+        # Queue locally rather than exceed the account's per-minute limits
+        await self._throttle(text)
+
         try:
             # Generate audio
             response = await self.client.audio.speech.create(
@@ -84,11 +101,19 @@ class OpenAITTSProvider(TTSProvider):
                 **kwargs
             )
 
+            if stats is not None:
+                stats['model'] = model
+                stats['characters'] = len(text)
+
             # Return audio bytes
             return response.content
 
         except Exception as e:
-            raise RuntimeError(f"OpenAI TTS generation failed: {e}")
+            raise ProviderError.from_exception("openai", "OpenAI TTS generation failed", e) from e
+
+    async def warm_up(self, connections: int = 1) -> None:
+        """Open pooled connections to the API ahead of the first request"""
+        await get_http_pool().warm_up(str(self.client.base_url), connections)
 
     def get_supported_voices(self) -> List[str]:
         """Get list of supported voice IDs"""
@@ -96,4 +121,8 @@ class OpenAITTSProvider(TTSProvider):
 
     def get_provider_name(self) -> str:
         """Get the name of the TTS provider"""
-        return "OpenAI TTS"
\ No newline at end of file
+        return "OpenAI TTS"
+
+    def get_pricing(self, model: Optional[str] = None) -> Dict[str, float]:
+        """Get speech prices for a model (configured pricing takes precedence)"""
+        return self.config.get('pricing') or self.MODEL_PRICING.get(model or self.default_model, {})
\ No newline at end of file
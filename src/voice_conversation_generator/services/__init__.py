@@ -1,15 +1,25 @@
 """
 Core services for voice conversation generator
 """
-from .local_orchestrator import ConversationOrchestrator
+from .local_orchestrator import ConversationOrchestrator, GenerationInterrupted
+from .concurrency import AdaptiveConcurrencyController, get_concurrency_controller
+from .hedging import HedgedTTSProvider
 from .persona_service import PersonaService
+from .phrase_matcher import PhraseMatcher
 from .provider_factory import ProviderFactory
+from .sharded_batch import ShardedBatchRunner
 from .voice_catalog import VoiceCatalog, VoiceEntry, get_voice_catalog
 
 __all__ = [
     "ConversationOrchestrator",
+    "GenerationInterrupted",
+    "AdaptiveConcurrencyController",
+    "get_concurrency_controller",
+    "HedgedTTSProvider",
     "PersonaService",
+    "PhraseMatcher",
     "ProviderFactory",
+    "ShardedBatchRunner",
     "VoiceCatalog",
     "VoiceEntry",
     "get_voice_catalog"
@@ -0,0 +1,209 @@
+"""
+Adaptive Concurrency Service - AIMD limits on parallel provider requests
+Shared by every orchestrator in the process so concurrent conversations
+back off together when a provider starts rate limiting
+"""
+import asyncio
+import time
+from contextlib import asynccontextmanager
+from typing import Dict, Any, Optional, AsyncIterator
+
+from ..providers.errors import ProviderError
+
+
+class AdaptiveLimiter:
+    """Additive-increase / multiplicative-decrease limit for one provider
+
+    The limit grows by roughly one slot per window of successful requests
+    while it is fully used and latency stays near the best latency seen,
+    and is cut by backoff_factor on a rate limit, overload or timeout.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        initial_limit: float = 4,
+        min_limit: float = 1,
+        max_limit: float = 64,
+        backoff_factor: float = 0.5,
+        latency_tolerance: float = 2.0
+    ):
+        """Initialize the limiter
+
+        Args:
+            name: Provider key (e.g. 'llm:gpt-4.1', 'tts:Cartesia')
+            initial_limit: Starting number of parallel requests
+            min_limit: Lowest limit backoff can reach
+            max_limit: Highest limit growth can reach
+            backoff_factor: Multiplier applied to the limit on overload
+            latency_tolerance: Latency (relative to the best seen) above
+                which the limit stops growing
+        """
+        self.name = name
+        self.limit = float(initial_limit)
+        self.min_limit = float(min_limit)
+        self.max_limit = float(max_limit)
+        self.backoff_factor = backoff_factor
+        self.latency_tolerance = latency_tolerance
+
+        self.in_flight = 0
+        self.successes = 0
+        self.overloads = 0
+        self.errors = 0
+
+        # Smoothed latency and the best smoothed latency seen (slowly drifting up)
+        self._latency_ms: Optional[float] = None
+        self._baseline_ms: Optional[float] = None
+        self._last_backoff = 0.0
+
+        self._condition: Optional[asyncio.Condition] = None
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+
+    def _get_condition(self) -> asyncio.Condition:
+        """Get the wait condition for the running event loop"""
+        loop = asyncio.get_running_loop()
+        if self._condition is None or self._loop is not loop:
+            self._condition = asyncio.Condition()
+            self._loop = loop
+            self.in_flight = 0
+        return self._condition
+
+    async def acquire(self) -> None:
+        """Wait for a free slot under the current limit"""
+        condition = self._get_condition()
+        async with condition:
+            await condition.wait_for(lambda: self.in_flight < int(self.limit))
+            self.in_flight += 1
+
+    async def release(self, latency_ms: Optional[float] = None, overloaded: bool = False) -> None:
+        """Free a slot and adjust the limit from the request's outcome
+
+        Args:
+            latency_ms: Latency of a successful request (None if it failed)
+            overloaded: Whether the request failed with a rate limit,
+                overload or timeout
+        """
+        condition = self._get_condition()
+        async with condition:
+            saturated = self.in_flight >= int(self.limit)
+            self.in_flight = max(0, self.in_flight - 1)
+
+            if overloaded:
+                self._on_overload()
+            elif latency_ms is not None:
+                self._on_success(latency_ms, saturated)
+            else:
+                self.errors += 1
+
+            condition.notify_all()
+
+    def _on_success(self, latency_ms: float, saturated: bool) -> None:
+        """Grow the limit additively while latency stays healthy"""
+        self.successes += 1
+
+        if self._latency_ms is None:
+            self._latency_ms = latency_ms
+        else:
+            self._latency_ms = 0.8 * self._latency_ms + 0.2 * latency_ms
+
+        if self._baseline_ms is None or self._latency_ms < self._baseline_ms:
+            self._baseline_ms = self._latency_ms
+        else:
+            self._baseline_ms += (self._latency_ms - self._baseline_ms) * 0.01
+
+        # Only grow a limit that is actually being used
+        if saturated and self._latency_ms <= self._baseline_ms * self.latency_tolerance:
+            self.limit = min(self.max_limit, self.limit + 1 / self.limit)
+
+    def _on_overload(self) -> None:
+        """Cut the limit multiplicatively, at most once per latency window"""
+        self.overloads += 1
+
+        # Requests already in flight when we backed off will fail too;
+        # count them but don't keep cutting for the same burst
+        now = time.monotonic()
+        if now - self._last_backoff < (self._latency_ms or 0) / 1000:
+            return
+
+        self.limit = max(self.min_limit, self.limit * self.backoff_factor)
+        self._last_backoff = now
+
+    def record_retry(self, error: BaseException) -> None:
+        """Count a failed attempt that is retried while its slot is still held
+
+        Retry wrappers call this for every attempt they retry, so rate
+        limits that never reach the slot's final outcome still back off.
+        """
+        if isinstance(error, ProviderError) and error.is_overload:
+            self._on_overload()
+        else:
+            self.errors += 1
+
+    @asynccontextmanager
+    async def slot(self) -> AsyncIterator[None]:
+        """Hold a slot for one provider request, recording its outcome"""
+        await self.acquire()
+        start_time = time.time()
+        try:
+            yield
+        except ProviderError as e:
+            await self.release(overloaded=e.is_overload)
+            raise
+        except BaseException:
+            await self.release()
+            raise
+        await self.release(latency_ms=(time.time() - start_time) * 1000)
+
+    def snapshot(self) -> Dict[str, Any]:
+        """Current limit and counters, for metrics"""
+        return {
+            "limit": round(self.limit, 2),
+            "in_flight": self.in_flight,
+            "successes": self.successes,
+            "overloads": self.overloads,
+            "errors": self.errors,
+            "latency_ms": round(self._latency_ms, 1) if self._latency_ms is not None else None
+        }
+
+
+class AdaptiveConcurrencyController:
+    """Registry of adaptive limiters, one per provider key"""
+
+    def __init__(self, defaults: Optional[Dict[str, Any]] = None):
+        """Initialize the controller
+
+        Args:
+            defaults: Default AdaptiveLimiter settings for new limiters
+        """
+        self.defaults = defaults or {}
+        self._limiters: Dict[str, AdaptiveLimiter] = {}
+
+    def get_limiter(self, name: str, **settings) -> AdaptiveLimiter:
+        """Get the limiter for a provider key, creating it on first use
+
+        Args:
+            name: Provider key
+            **settings: AdaptiveLimiter settings (only used on creation)
+
+        Returns:
+            Shared AdaptiveLimiter for the key
+        """
+        if name not in self._limiters:
+            self._limiters[name] = AdaptiveLimiter(name, **{**self.defaults, **settings})
+        return self._limiters[name]
+
+    def snapshot(self) -> Dict[str, Dict[str, Any]]:
+        """Current state of every limiter"""
+        return {name: limiter.snapshot() for name, limiter in self._limiters.items()}
+
+
+# Global controller instance
+_controller_instance: Optional[AdaptiveConcurrencyController] = None
+
+
+def get_concurrency_controller() -> AdaptiveConcurrencyController:
+    """Get the global concurrency controller instance (singleton)"""
+    global _controller_instance
+    if _controller_instance is None:
+        _controller_instance = AdaptiveConcurrencyController()
+    return _controller_instance
@@ -2,8 +2,10 @@
 Context Manager Service - Centralized conversation context management
 This ensures consistent context formatting across all implementations
 """
-from typing import List, Optional, Dict, Any
+from functools import lru_cache
+from typing import List, Optional, Dict, Any, Tuple
 from ..models import Turn, TurnType
+from .phrase_matcher import PhraseMatcher, get_phrase_matcher
 
 
 class ContextManager:
@@ -34,6 +36,26 @@ class ContextManager:
         # Format as "Speaker: Text" on separate lines
         return "\n".join([f"{turn.speaker.value}: {turn.text}" for turn in recent_turns])
 
+    @staticmethod
+    def format_chat_messages(turns: List[Turn], speaker: TurnType) -> List[Dict[str, str]]:
+        """
+        Format the full conversation history as chat messages from one side's view.
+        The speaker's own turns become 'assistant' messages and the other
+        side's become 'user' messages. Earlier messages never change as the
+        conversation grows, so providers can cache the whole prefix.
+
+        Args:
+            turns: List of conversation turns
+            speaker: The side the LLM is speaking for
+
+        Returns:
+            List of message dicts with 'role' and 'content' keys
+        """
+        return [
+            {"role": "assistant" if turn.speaker == speaker else "user", "content": turn.text}
+            for turn in turns
+        ]
+
     @staticmethod
     def format_context_from_messages(messages: List[Dict[str, Any]], last_n: int = 6) -> str:
         """
@@ -160,6 +182,7 @@ class ContextManager:
     def is_conversation_ending(context: str, keywords: List[str] = None) -> bool:
         """
         Check if the conversation appears to be ending based on context.
+        English, Hindi and Hinglish ending phrases are recognised by default.
 
         Args:
             context: Formatted conversation context
@@ -171,16 +194,16 @@ class ContextManager:
         if not context:
             return False
 
-        default_keywords = [
-            'thank you', 'thanks', 'goodbye', 'bye', 'have a nice day',
-            'take care', 'appreciate your help', 'that\'s all', 'all set',
-            'problem solved', 'issue resolved', 'satisfied'
-        ]
-
-        keywords = keywords or default_keywords
+        matcher = _keyword_matcher(tuple(keywords)) if keywords else get_phrase_matcher('context_ending')
 
         # Check last few messages for ending indicators
-        last_lines = context.lower().split('\n')[-3:]  # Last 3 messages
+        last_lines = context.split('\n')[-3:]  # Last 3 messages
         combined_text = ' '.join(last_lines)
 
-        return any(keyword in combined_text for keyword in keywords)
\ No newline at end of file
+        return matcher.matches(combined_text)
+
+
+@lru_cache(maxsize=32)
+def _keyword_matcher(keywords: Tuple[str, ...]) -> PhraseMatcher:
+    """Compile (once) a matcher for caller-supplied ending keywords"""
+    return PhraseMatcher(keywords)
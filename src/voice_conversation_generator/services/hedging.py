@@ -0,0 +1,260 @@
+"""
+Hedging Service - Duplicate slow TTS requests to cut tail latency
+A request still running past the recent latency percentile is sent again,
+to the same provider or an equivalent voice on a secondary provider, and
+the first response wins
+"""
+import asyncio
+import time
+from collections import deque
+from typing import Dict, Any, Optional, List, Tuple
+
+from ..models import VoiceConfig
+from ..providers import TTSProvider
+from ..providers.resilience import retry_hook_kwargs
+from .voice_catalog import VoiceCatalog, get_voice_catalog
+
+
+class HedgedTTSProvider(TTSProvider):
+    """Wraps a TTS provider with hedged requests
+
+    The hedge deadline is the given percentile of recent primary latencies,
+    so only the slowest requests (about 1 - percentile of them) are
+    duplicated. Hedging is disabled until min_samples latencies are known,
+    and capped at max_hedge_rate of all requests.
+    """
+
+    def __init__(
+        self,
+        primary: TTSProvider,
+        secondary: Optional[TTSProvider] = None,
+        percentile: float = 0.95,
+        min_samples: int = 20,
+        window: int = 200,
+        min_delay_ms: float = 50,
+        max_hedge_rate: float = 0.1,
+        voice_catalog: Optional[VoiceCatalog] = None
+    ):
+        """Initialize the wrapper
+
+        Args:
+            primary: Provider every request goes to first
+            secondary: Provider for hedges (default: the primary)
+            percentile: Latency percentile after which a request is hedged
+            min_samples: Latencies to observe before hedging starts
+            window: Number of recent latencies the percentile is taken over
+            min_delay_ms: Shortest hedge deadline
+            max_hedge_rate: Highest fraction of requests that may be hedged
+            voice_catalog: Catalog used to find equivalent secondary voices
+        """
+        super().__init__(primary.config)
+        self.primary = primary
+        self.secondary = secondary
+        self.percentile = percentile
+        self.min_samples = min_samples
+        self.min_delay_ms = min_delay_ms
+        self.max_hedge_rate = max_hedge_rate
+        self.voice_catalog = voice_catalog or get_voice_catalog()
+        self.rate_limiter = primary.rate_limiter
+
+        self._latencies_ms: deque = deque(maxlen=window)
+        self.requests = 0
+        self.hedges = 0
+        self.hedge_wins = 0
+        self.hedge_extra_characters = 0
+
+    def __getattr__(self, name: str) -> Any:
+        # Only called for attributes the wrapper lacks (client, circuit_breaker, ...)
+        if name == 'primary':
+            raise AttributeError(name)
+        return getattr(self.primary, name)
+
+    def hedge_delay_ms(self) -> Optional[float]:
+        """Current hedge deadline in ms, or None while hedging is off"""
+        if len(self._latencies_ms) < self.min_samples:
+            return None
+        if self.requests and self.hedges / self.requests >= self.max_hedge_rate:
+            return None
+        latencies = sorted(self._latencies_ms)
+        index = min(int(len(latencies) * self.percentile), len(latencies) - 1)
+        return max(self.min_delay_ms, latencies[index])
+
+    @staticmethod
+    def _catalog_provider(provider: TTSProvider) -> str:
+        """Catalog key of a provider (its config 'type', e.g. 'openai')"""
+        return provider.config.get('type') or provider.get_provider_name().split()[0].lower()
+
+    def _hedge_target(self, voice_config: VoiceConfig) -> Tuple[TTSProvider, VoiceConfig]:
+        """Provider and voice for the duplicate request
+
+        Uses the equivalent catalog voice (same gender, accent, languages
+        and persona type) on the secondary provider, falling back to the
+        primary provider and voice if the catalog has no equivalent.
+        """
+        if self.secondary is None:
+            return self.primary, voice_config
+
+        entry = self.voice_catalog.get_voice_by_id(
+            voice_config.provider, voice_config.voice_id or voice_config.voice_name or ""
+        )
+        if entry is None:
+            return self.primary, voice_config
+
+        equivalent = self.voice_catalog.get_voice(
+            provider=self._catalog_provider(self.secondary),
+            languages=sorted(entry.languages),
+            accent=next(iter(entry.accents), 'us'),
+            gender=entry.gender,
+            persona_type=next(iter(entry.persona_types), 'customer')
+        )
+        # The catalog falls back to any default voice; a different gender
+        # would be audible mid-conversation, so hedge on the primary instead
+        if equivalent is None or equivalent.gender != entry.gender:
+            return self.primary, voice_config
+
+        return self.secondary, VoiceConfig(
+            provider=equivalent.provider,
+            voice_id=equivalent.voice_id,
+            speed=voice_config.speed
+        )
+
+    async def generate_speech(
+        self,
+        text: str,
+        voice_config: VoiceConfig,
+        **kwargs
+    ) -> bytes:
+        """Generate speech, hedging the request if it runs past the deadline
+
+        Reports 'hedged' and 'hedge_won' in the stats dict when one is passed,
+        plus 'hedge_extra_characters' and 'hedge_extra_cost_usd' for the
+        losing request of a hedge race. A loser cancelled mid-flight was
+        already sent, so it counts as billed; one that failed does not.
+        """
+        stats = kwargs.pop('stats', None)
+        on_retry = kwargs.pop('on_retry', None)
+        self.requests += 1
+        start_time = time.time()
+
+        primary_stats: Dict[str, Any] = {}
+        primary_task = asyncio.create_task(
+            self.primary.generate_speech(
+                text=text,
+                voice_config=voice_config,
+                stats=primary_stats,
+                **retry_hook_kwargs(self.primary, on_retry),
+                **kwargs
+            )
+        )
+        tasks = {primary_task: (self.primary, primary_stats)}
+
+        try:
+            delay_ms = self.hedge_delay_ms()
+            if delay_ms is not None:
+                await asyncio.wait({primary_task}, timeout=delay_ms / 1000)
+                if not primary_task.done():
+                    self.hedges += 1
+                    provider, hedge_voice = self._hedge_target(voice_config)
+                    hedge_stats: Dict[str, Any] = {}
+                    hedge_task = asyncio.create_task(
+                        provider.generate_speech(
+                            text=text,
+                            voice_config=hedge_voice,
+                            stats=hedge_stats,
+                            **retry_hook_kwargs(provider, on_retry),
+                            **kwargs
+                        )
+                    )
+                    tasks[hedge_task] = (provider, hedge_stats)
+
+            # First successful response wins; a failed one leaves the other running
+            pending = set(tasks)
+            while True:
+                done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                winner = next((t for t in done if not t.exception()), None)
+                if winner is not None or not pending:
+                    break
+        finally:
+            for task in tasks:
+                if not task.done():
+                    task.cancel()
+
+        # A primary that lost the race took at least this long, so it counts too
+        primary_failed = primary_task.done() and primary_task.exception() is not None
+        if not primary_failed:
+            self._latencies_ms.append((time.time() - start_time) * 1000)
+
+        if winner is None:
+            # Every attempt failed; surface the primary's error
+            raise primary_task.exception()
+
+        provider, winner_stats = tasks[winner]
+        extra_characters, extra_cost = self._loser_usage(text, tasks, winner)
+        self.hedge_extra_characters += extra_characters
+        if stats is not None:
+            stats.update(winner_stats)
+            stats['hedged'] = len(tasks) > 1
+            stats['hedge_won'] = winner is not primary_task
+            stats['hedge_provider'] = provider.get_provider_name()
+            if extra_characters:
+                stats['hedge_extra_characters'] = extra_characters
+                stats['hedge_extra_cost_usd'] = extra_cost
+        if winner is not primary_task:
+            self.hedge_wins += 1
+
+        return winner.result()
+
+    @staticmethod
+    def _loser_usage(
+        text: str,
+        tasks: Dict[asyncio.Task, Tuple[TTSProvider, Dict[str, Any]]],
+        winner: asyncio.Task
+    ) -> Tuple[int, float]:
+        """Characters and estimated cost of the requests that lost the race"""
+        characters = 0
+        cost = 0.0
+        for task, (provider, task_stats) in tasks.items():
+            # Losers still being cancelled were sent; ones that failed aren't billed
+            failed = task.done() and not task.cancelled() and task.exception() is not None
+            if task is winner or failed:
+                continue
+            usage = {**task_stats, 'characters': task_stats.get('characters', len(text))}
+            characters += usage['characters']
+            cost += provider.estimate_cost(usage)
+        return characters, cost
+
+    async def warm_up(self, connections: int = 1) -> None:
+        """Open connections of the primary and the secondary provider"""
+        providers = [self.primary] + ([self.secondary] if self.secondary is not None else [])
+        await asyncio.gather(*(provider.warm_up(connections) for provider in providers))
+
+    def get_supported_voices(self) -> List[str]:
+        """Get list of supported voice IDs"""
+        return self.primary.get_supported_voices()
+
+    def get_provider_name(self) -> str:
+        """Get the name of the TTS provider"""
+        return self.primary.get_provider_name()
+
+    def get_pricing(self, model: Optional[str] = None) -> Dict[str, float]:
+        """Get speech prices of the primary provider"""
+        return self.primary.get_pricing(model)
+
+    def estimate_cost(self, usage: Dict[str, Any]) -> float:
+        """Estimate cost with the prices of whichever provider served the request"""
+        if self.secondary is not None and usage.get('hedge_provider') == self.secondary.get_provider_name():
+            return self.secondary.estimate_cost(usage)
+        return self.primary.estimate_cost(usage)
+
+    def hedge_snapshot(self) -> Dict[str, Any]:
+        """Hedge counters and current deadline, for tuning"""
+        delay_ms = self.hedge_delay_ms()
+        return {
+            "requests": self.requests,
+            "hedges": self.hedges,
+            "hedge_wins": self.hedge_wins,
+            "hedge_rate": round(self.hedges / self.requests, 4) if self.requests else 0.0,
+            "win_rate": round(self.hedge_wins / self.hedges, 4) if self.hedges else 0.0,
+            "extra_characters": self.hedge_extra_characters,
+            "hedge_delay_ms": round(delay_ms, 1) if delay_ms is not None else None
+        }
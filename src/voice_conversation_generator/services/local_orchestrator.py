@@ -2,8 +2,12 @@
 Conversation Orchestrator Service - Core business logic for conversation generation
 """
 import asyncio
+import re
+import signal
 import time
-from typing import Dict, Any, Optional, List
+import uuid
+from typing import Dict, Any, Optional, List, Callable, Awaitable, AsyncIterator, Tuple
+from dataclasses import dataclass
 from datetime import datetime
 from pathlib import Path
 
@@ -12,26 +16,110 @@ from ..models import (
     ConversationConfig,
     CustomerPersona,
     SupportPersona,
+    Turn,
     TurnType,
-    ConversationMetrics
+    ConversationMetrics,
+    BatchJob,
+    BatchResult,
+    BatchBudget,
+    ConversationEvent,
+    TurnTextReady,
+    TurnAudioReady,
+    MetricsUpdated,
+    ConversationFinished
 )
 from ..providers import (
     LLMProvider,
     TTSProvider,
-    StorageGateway
+    StorageGateway,
+    ProviderError
 )
+from ..providers.resilience import retry_hook_kwargs
 from .prompt_builder import PromptBuilder
 from .context_manager import ContextManager
+from .phrase_matcher import PhraseMatcher, get_phrase_matcher, merge_phrase_sets
+from .concurrency import AdaptiveConcurrencyController, AdaptiveLimiter, get_concurrency_controller
+
+
+class GenerationInterrupted(Exception):
+    """Raised when generation stops early at a turn boundary on request
+
+    The conversation's checkpoint (if enabled) holds every finished turn, so
+    generation can be resumed later with the same conversation ID.
+    """
+
+
+class _EarlyStop(Exception):
+    """Ends a conversation early, keeping the turns generated so far"""
+
+    icon = "⏹️"
+
+    def __init__(self, reason: str, message: str):
+        super().__init__(message)
+        self.reason = reason
+
+
+class _BudgetExhausted(_EarlyStop):
+    """Raised at a turn boundary once a spending cap has been reached"""
+
+    icon = "💸"
+
+
+class _DeadlineExceeded(_EarlyStop):
+    """Raised when a turn or the whole conversation runs past its deadline"""
+
+    icon = "⏱️"
+
+
+@dataclass
+class _ConversationRun:
+    """Mutable state shared by the steps of one conversation's generation"""
+    conversation: Conversation
+    metrics: ConversationMetrics
+    customer_persona: CustomerPersona
+    support_persona: SupportPersona
+
+    # Background audio tasks (None when audio is not rendered turn by turn)
+    audio_tasks: Optional[List[asyncio.Task]] = None
+    stop_event: Optional[asyncio.Event] = None
+    batch_budget: Optional[BatchBudget] = None
+    on_event: Optional[Callable[[ConversationEvent], None]] = None
+
+    # time.monotonic() by which the conversation must finish (None = no limit)
+    deadline: Optional[float] = None
+
+    def emit(self, event: ConversationEvent) -> None:
+        """Pass a progress event to the listener, if any"""
+        if self.on_event is not None:
+            self.on_event(event)
+
+    def persona_for(self, speaker: TurnType) -> Any:
+        """Return the persona speaking for the given turn type"""
+        return self.customer_persona if speaker == TurnType.CUSTOMER else self.support_persona
 
 
 class ConversationOrchestrator:
     """Orchestrates conversation generation between customer and support personas"""
 
+    AUDIO_MODES = ['pipelined', 'streaming', 'script_first', 'text_only']
+    PROMPT_MODES = ['text', 'messages']
+
+    # Streaming mode sends text to TTS at sentence boundaries (including the
+    # Devanagari danda), merging fragments shorter than MIN_SENTENCE_CHARS
+    SENTENCE_BOUNDARY = re.compile(r'[.!?।]+(?=\s)')
+    MIN_SENTENCE_CHARS = 20
+
+    PHRASE_CATEGORIES = ['satisfied', 'ending', 'positive', 'solution']
+
     def __init__(
         self,
         llm_provider: LLMProvider,
         tts_provider: TTSProvider,
-        storage_gateway: StorageGateway
+        storage_gateway: StorageGateway,
+        verbose: bool = True,
+        phrase_sets: Optional[Dict[str, Dict[str, List[str]]]] = None,
+        concurrency_controller: Optional[AdaptiveConcurrencyController] = None,
+        llm_providers: Optional[Dict[str, LLMProvider]] = None
     ):
         """Initialize orchestrator with providers
 
@@ -39,16 +127,86 @@ class ConversationOrchestrator:
             llm_provider: Provider for text generation
             tts_provider: Provider for speech generation
             storage_gateway: Provider for storage operations
+            verbose: Whether to print per-turn progress to the console
+            phrase_sets: Optional phrase lists (by category, then language)
+                replacing the defaults used to detect the end of a conversation
+            concurrency_controller: Adaptive limits on parallel provider
+                requests (defaults to the process-wide controller)
+            llm_providers: Extra LLM providers by name, for conversations
+                that route a role to one (ConversationConfig's
+                customer_llm_provider and support_llm_provider)
         """
         self.llm = llm_provider
+        self.llm_providers = llm_providers or {}
         self.tts = tts_provider
         self.storage = storage_gateway
+        self.verbose = verbose
+
+        # Precompiled matchers for the conversation-ending heuristics
+        if phrase_sets:
+            merged = merge_phrase_sets(phrase_sets)
+            self._matchers = {
+                category: PhraseMatcher.from_phrase_sets(category, phrase_sets=merged)
+                for category in self.PHRASE_CATEGORIES
+            }
+        else:
+            self._matchers = {category: get_phrase_matcher(category) for category in self.PHRASE_CATEGORIES}
+
+        # Per-provider limits on parallel TTS requests when rendering scripts
+        self._tts_semaphores: Dict[Tuple[str, int], asyncio.Semaphore] = {}
+
+        # Adaptive limits shared with every other orchestrator using the same
+        # providers; tuned via the 'concurrency' key of each provider config
+        self.concurrency = concurrency_controller or get_concurrency_controller()
+        self._llm_limiter = self.concurrency.get_limiter(
+            f"llm:{self.llm.get_model_name()}",
+            **self.llm.config.get('concurrency', {})
+        )
+        # Limiters of the other models roles are routed to, by model
+        self._llm_limiters = {self.llm.get_model_name(): self._llm_limiter}
+        self._tts_limiter = self.concurrency.get_limiter(
+            f"tts:{self.tts.get_provider_name()}",
+            **self.tts.config.get('concurrency', {})
+        )
+
+    def _log(self, message: str) -> None:
+        """Print progress output when running in verbose mode"""
+        if self.verbose:
+            print(message)
+
+    async def warm_up(self, connections: int = 1) -> None:
+        """Open provider connections before the first conversation
+
+        Best effort: a provider that can't be reached is reported, and its
+        first real request sets up the connection as usual.
+
+        Args:
+            connections: Connections to open per provider (about the
+                number of requests expected in flight)
+        """
+        start_time = time.time()
+        providers = [self.llm, *self.llm_providers.values()]
+        outcomes = await asyncio.gather(
+            *(provider.warm_up(connections) for provider in providers),
+            self.tts.warm_up(connections),
+            return_exceptions=True
+        )
+        names = [provider.get_model_name() for provider in providers] + [self.tts.get_provider_name()]
+        for name, outcome in zip(names, outcomes):
+            if isinstance(outcome, Exception):
+                self._log(f"⚠️  Warm-up failed for {name}: {outcome}")
+        self._log(f"🔥 Connections warmed up in {(time.time() - start_time) * 1000:.0f}ms")
 
     async def generate_conversation(
         self,
         customer_persona: CustomerPersona,
         support_persona: SupportPersona,
-        config: Optional[ConversationConfig] = None
+        config: Optional[ConversationConfig] = None,
+        conversation_id: Optional[str] = None,
+        resume: bool = False,
+        stop_event: Optional[asyncio.Event] = None,
+        batch_budget: Optional[BatchBudget] = None,
+        on_event: Optional[Callable[[ConversationEvent], None]] = None
     ) -> tuple[Conversation, ConversationMetrics]:
         """Generate a complete conversation between customer and support
 
@@ -56,234 +214,1004 @@ class ConversationOrchestrator:
             customer_persona: Customer persona with personality and scenario
             support_persona: Support agent persona with policies
             config: Configuration for the conversation
+            conversation_id: Optional conversation ID (generated if omitted)
+            resume: Continue from the stored checkpoint for conversation_id,
+                reusing every turn (and its audio) generated before
+            stop_event: When set, generation stops at the next turn boundary,
+                flushes a checkpoint and raises GenerationInterrupted
+            batch_budget: Spending cap shared with other conversations; like
+                config.budget_usd, reaching it ends the conversation early
+            on_event: Optional callback receiving progress events as turns
+                and audio become ready (see stream_conversation)
 
         Returns:
             Tuple of (Conversation object, ConversationMetrics)
         """
-        # Use default config if not provided
-        if config is None:
-            config = ConversationConfig()
-
-        # Initialize conversation
-        conversation = Conversation(
-            customer_persona_id=customer_persona.id,
-            support_persona_id=support_persona.id,
-            scenario_name=customer_persona.name or "unnamed_scenario",
-            config=config,
-            created_at=datetime.now()
-        )
+        checkpoint = None
+        if resume and conversation_id:
+            checkpoint = await self.storage.load_checkpoint(conversation_id)
+            # A saved checkpoint only marks a finished conversation
+            if checkpoint and checkpoint['status'] == 'saved':
+                checkpoint = None
 
-        # Initialize metrics
-        metrics = ConversationMetrics(
-            conversation_id=conversation.id,
-            llm_provider=self.llm.get_model_name(),
-            tts_provider=self.tts.get_provider_name(),
-            started_at=datetime.now()
-        )
+        if checkpoint:
+            conversation = checkpoint['conversation']
+            metrics = checkpoint['metrics']
+            if config is not None:
+                conversation.config = config
+            config = conversation.config
 
-        print(f"\n🎭 Generating conversation: {conversation.scenario_name}")
-        print("=" * 50)
+            # Audio size is re-accumulated as missing audio is rendered
+            metrics.total_audio_size_bytes = sum(len(t.audio_data) for t in conversation.turns if t.audio_data)
+            conversation.metadata['resumed_from_turn'] = len(conversation.turns)
+        else:
+            # Use default config if not provided
+            if config is None:
+                config = ConversationConfig()
 
-        # Generate opening greeting from support
-        support_greeting = await self._generate_support_message(
-            support_persona,
-            conversation,
-            is_opening=True
-        )
-        await self._add_turn(
-            conversation,
-            metrics,
-            TurnType.SUPPORT,
-            support_greeting,
-            support_persona
+            # Initialize conversation
+            conversation = Conversation(
+                id=conversation_id or str(uuid.uuid4()),
+                customer_persona_id=customer_persona.id,
+                support_persona_id=support_persona.id,
+                scenario_name=customer_persona.name or "unnamed_scenario",
+                config=config,
+                created_at=datetime.now()
+            )
+
+            # Initialize metrics
+            metrics = ConversationMetrics(
+                conversation_id=conversation.id,
+                llm_provider=self.llm.get_model_name(),
+                tts_provider=self.tts.get_provider_name(),
+                started_at=datetime.now()
+            )
+
+        if config.audio_mode not in self.AUDIO_MODES:
+            raise ValueError(f"Unsupported audio mode: {config.audio_mode}")
+        if config.prompt_mode not in self.PROMPT_MODES:
+            raise ValueError(f"Unsupported prompt mode: {config.prompt_mode}")
+        for role in (TurnType.CUSTOMER.value, TurnType.SUPPORT.value):
+            self._llm_for(config, role)
+
+        # In pipelined and streaming modes audio for each turn renders in the
+        # background while the next turn's text is generated. Script-first and
+        # text-only modes produce the whole script before any audio is requested.
+        run = _ConversationRun(
+            conversation=conversation,
+            metrics=metrics,
+            customer_persona=customer_persona,
+            support_persona=support_persona,
+            audio_tasks=[] if config.audio_mode in ("pipelined", "streaming") else None,
+            stop_event=stop_event,
+            batch_budget=batch_budget,
+            on_event=on_event,
+            deadline=time.monotonic() + config.conversation_timeout if config.conversation_timeout else None
         )
 
+        if checkpoint:
+            self._log(f"\n♻️  Resuming conversation {conversation.id} from turn {len(conversation.turns)}")
+
+            # Listeners see the restored turns first, as if just generated
+            for turn in conversation.turns:
+                run.emit(TurnTextReady(conversation.id, turn))
+                if turn.audio_data:
+                    run.emit(TurnAudioReady(conversation.id, turn))
+
+            # Restored turns that never got their audio only need TTS
+            if run.audio_tasks is not None:
+                for turn in conversation.turns:
+                    if not turn.audio_data:
+                        run.audio_tasks.append(asyncio.create_task(
+                            self._generate_turn_audio(run, turn)
+                        ))
+        else:
+            self._log(f"\n🎭 Generating conversation: {conversation.scenario_name}")
+            self._log("=" * 50)
+
+        text_complete = checkpoint is not None and checkpoint['status'] in ('text_complete', 'completed')
+
+        try:
+            if not text_complete:
+                try:
+                    await self._within_deadline(run, self._run_turns(run))
+                except _EarlyStop as e:
+                    self._stop_early(run, e)
+                await self._checkpoint(conversation, metrics, "text_complete")
+
+            try:
+                if run.audio_tasks:
+                    await self._within_deadline(run, asyncio.gather(*run.audio_tasks))
+
+                if config.audio_mode == "script_first":
+                    await self._within_deadline(run, self.render_audio(
+                        conversation, customer_persona, support_persona, metrics, on_event=on_event
+                    ))
+            except _DeadlineExceeded as e:
+                # Audio still rendering was cancelled; its turns stay silent
+                self._stop_early(run, e)
+                for turn in conversation.turns:
+                    if not turn.audio_data:
+                        turn.metadata['audio_error'] = str(e)
+
+        except GenerationInterrupted:
+            # Drain: let audio already requested finish, then flush a checkpoint
+            if run.audio_tasks:
+                await asyncio.gather(*run.audio_tasks, return_exceptions=True)
+            await self._checkpoint(conversation, metrics, "interrupted")
+            raise
+        except BaseException as e:
+            for task in run.audio_tasks or []:
+                task.cancel()
+            if isinstance(e, asyncio.CancelledError):
+                await self._checkpoint(conversation, metrics, "interrupted")
+            else:
+                await self._checkpoint(conversation, metrics, "failed", extra={'error': f"{type(e).__name__}: {e}"})
+            raise
+
+        # Finalize metrics
+        conversation.completed_at = datetime.now()
+        self._finalize_metrics(conversation, metrics)
+        await self._checkpoint(conversation, metrics, "completed")
+        run.emit(ConversationFinished(conversation.id, conversation, metrics))
+
+        # Print summary
+        self._log(f"\n{'=' * 50}")
+        self._log("📊 Conversation Summary:")
+        self._log(f"  Total turns: {metrics.total_turns}")
+        self._log(f"  Resolution achieved: {'Yes' if metrics.resolution_achieved else 'No'}")
+        self._log(f"{'=' * 50}\n")
+
+        return conversation, metrics
+
+    async def stream_conversation(
+        self,
+        customer_persona: CustomerPersona,
+        support_persona: SupportPersona,
+        config: Optional[ConversationConfig] = None,
+        conversation_id: Optional[str] = None,
+        resume: bool = False,
+        stop_event: Optional[asyncio.Event] = None
+    ) -> AsyncIterator[ConversationEvent]:
+        """Generate a conversation, yielding events as it progresses
+
+        Yields TurnTextReady as soon as a turn's text is final,
+        TurnAudioReady once its audio is rendered (in pipelined and
+        streaming modes that is while later turns are still being
+        generated), MetricsUpdated after each, and ConversationFinished
+        last. Closing the generator early cancels generation (a checkpoint,
+        if enabled, keeps the finished turns).
+
+        Args:
+            customer_persona: Customer persona with personality and scenario
+            support_persona: Support agent persona with policies
+            config: Configuration for the conversation
+            conversation_id: Optional conversation ID (generated if omitted)
+            resume: Continue from the stored checkpoint for conversation_id
+            stop_event: When set, generation stops at the next turn boundary
+
+        Yields:
+            ConversationEvent objects
+
+        Raises:
+            GenerationInterrupted: If stop_event was set (after yielding the
+                events of every finished turn)
+        """
+        events: asyncio.Queue = asyncio.Queue()
+
+        async def produce() -> None:
+            try:
+                await self.generate_conversation(
+                    customer_persona,
+                    support_persona,
+                    config=config,
+                    conversation_id=conversation_id,
+                    resume=resume,
+                    stop_event=stop_event,
+                    on_event=events.put_nowait
+                )
+            finally:
+                # Marks the end of the stream, whether finished or failed
+                events.put_nowait(None)
+
+        task = asyncio.create_task(produce())
+        try:
+            while (event := await events.get()) is not None:
+                yield event
+            await task
+        finally:
+            if not task.done():
+                task.cancel()
+                await asyncio.gather(task, return_exceptions=True)
+
+    async def _within_deadline(self, run: "_ConversationRun", awaitable: Awaitable[Any]) -> Any:
+        """Await within the conversation deadline, cancelling on expiry
+
+        Raises:
+            _DeadlineExceeded: If the deadline passes first
+        """
+        if run.deadline is None:
+            return await awaitable
+
+        try:
+            return await asyncio.wait_for(awaitable, max(0.0, run.deadline - time.monotonic()))
+        except asyncio.TimeoutError:
+            raise _DeadlineExceeded(
+                'conversation_timeout',
+                f"Conversation deadline of {run.conversation.config.conversation_timeout:g}s exceeded"
+            ) from None
+
+    def _stop_early(self, run: "_ConversationRun", stop: _EarlyStop) -> None:
+        """Record why a conversation ended early
+
+        Conversations cut off by a deadline are also marked partial: they
+        may end mid-exchange and have turns without audio.
+        """
+        run.conversation.metadata['stop_reason'] = stop.reason
+        if isinstance(stop, _DeadlineExceeded):
+            run.conversation.metadata['partial'] = True
+        self._log(f"\n{stop.icon} {stop}, ending conversation early")
+
+    async def _with_request_timeout(self, awaitable: Awaitable[Any], timeout: Optional[float], provider: str) -> Any:
+        """Await a provider request, failing it as a timeout after timeout seconds
+
+        Raises:
+            ProviderError: With is_timeout set, if the request took too long
+        """
+        if not timeout:
+            return await awaitable
+
+        try:
+            return await asyncio.wait_for(awaitable, timeout)
+        except asyncio.TimeoutError:
+            raise ProviderError(
+                f"{provider} request timed out after {timeout:g}s", provider=provider, is_timeout=True
+            ) from None
+
+    async def _run_turns(self, run: "_ConversationRun") -> None:
+        """Run the turn loop, scheduling audio for each turn as it is added
+
+        Turns already present on the conversation (from a checkpoint) are
+        kept, and the loop picks up where they left off.
+        """
+        conversation = run.conversation
+
+        if not conversation.turns:
+            # Generate opening greeting from support
+            await self._take_turn(run, TurnType.SUPPORT, is_opening=True)
+        elif self._is_finished(conversation):
+            return
+
+        # Each round after the greeting is a customer turn then a support turn
+        completed_rounds = (len(conversation.turns) - 1) // 2
+
         # Continue conversation
-        for turn_num in range(config.max_turns - 1):
-            # Customer responds
-            customer_response = await self._generate_customer_message(
-                customer_persona,
-                conversation
-            )
-            await self._add_turn(
-                conversation,
-                metrics,
-                TurnType.CUSTOMER,
-                customer_response,
-                customer_persona
-            )
+        for turn_num in range(completed_rounds, conversation.config.max_turns - 1):
+            if conversation.turns[-1].speaker == TurnType.SUPPORT:
+                # Customer responds
+                customer_response = await self._take_turn(run, TurnType.CUSTOMER)
+            else:
+                # Resumed right after a customer turn
+                customer_response = conversation.turns[-1].text
 
             # Check if customer is satisfied
             if self._is_customer_satisfied(customer_response):
                 # Add final thank you from support
-                final_message = await self._generate_support_message(
-                    support_persona,
-                    conversation,
-                    is_closing=True
-                )
-                await self._add_turn(
-                    conversation,
-                    metrics,
-                    TurnType.SUPPORT,
-                    final_message,
-                    support_persona
-                )
-                metrics.resolution_achieved = True
+                await self._take_turn(run, TurnType.SUPPORT, is_closing=True)
+                run.metrics.resolution_achieved = True
                 break
 
             # Support responds
-            support_response = await self._generate_support_message(
-                support_persona,
-                conversation
-            )
-            await self._add_turn(
-                conversation,
-                metrics,
-                TurnType.SUPPORT,
-                support_response,
-                support_persona
-            )
+            support_response = await self._take_turn(run, TurnType.SUPPORT)
 
             # Check if conversation should end
             if self._should_end_conversation(support_response):
                 break
 
             # Check if we've reached minimum turns and resolution is likely
-            if turn_num >= config.min_turns - 2 and self._is_resolution_likely(conversation):
+            if turn_num >= conversation.config.min_turns - 2 and self._is_resolution_likely(conversation):
                 break
 
-        # Finalize metrics
-        conversation.completed_at = datetime.now()
-        metrics.completed_at = datetime.now()
-        metrics.total_turns = len(conversation.turns)
-        metrics.customer_turns = sum(1 for t in conversation.turns if t.speaker == TurnType.CUSTOMER)
-        metrics.support_turns = sum(1 for t in conversation.turns if t.speaker == TurnType.SUPPORT)
-        metrics.calculate_aggregates()
+    def _is_finished(self, conversation: Conversation) -> bool:
+        """Check whether restored turns already reached an end condition"""
+        turns = conversation.turns
+        if len(turns) < 3 or turns[-1].speaker != TurnType.SUPPORT:
+            return False
 
-        # Print summary
-        print(f"\n{'=' * 50}")
-        print("📊 Conversation Summary:")
-        print(f"  Total turns: {metrics.total_turns}")
-        print(f"  Resolution achieved: {'Yes' if metrics.resolution_achieved else 'No'}")
-        print(f"{'=' * 50}\n")
+        last_round = (len(turns) - 1) // 2 - 1
+        return (
+            self._is_customer_satisfied(turns[-2].text)
+            or self._should_end_conversation(turns[-1].text)
+            or (last_round >= conversation.config.min_turns - 2 and self._is_resolution_likely(conversation))
+        )
 
-        return conversation, metrics
+    async def _take_turn(
+        self,
+        run: "_ConversationRun",
+        speaker: TurnType,
+        is_opening: bool = False,
+        is_closing: bool = False
+    ) -> str:
+        """Generate the next message for a speaker and add it as a turn
+
+        In streaming mode each sentence is sent to TTS as soon as the LLM
+        finishes it, instead of waiting for the full reply.
+
+        Returns:
+            The generated message text
+        """
+        if run.stop_event is not None and run.stop_event.is_set():
+            raise GenerationInterrupted(
+                f"Stopped after turn {len(run.conversation.turns)} of {run.conversation.id}"
+            )
+        self._check_budget(run)
+
+        conversation = run.conversation
+        persona = run.persona_for(speaker)
+        timings: Dict[str, Any] = {'turn_start': time.time()}
+        chunk_tasks: Optional[List[asyncio.Task]] = None
+        on_sentence = None
+
+        if run.audio_tasks is not None and conversation.config.audio_mode == "streaming":
+            chunk_tasks = []
+
+            def on_sentence(sentence: str) -> None:
+                chunk_tasks.append(asyncio.create_task(
+                    self._synthesize(sentence, persona, timeout=conversation.config.request_timeout)
+                ))
+
+        if speaker == TurnType.CUSTOMER:
+            message = self._generate_customer_message(
+                persona,
+                conversation,
+                on_sentence=on_sentence,
+                timings=timings
+            )
+        else:
+            message = self._generate_support_message(
+                persona,
+                conversation,
+                is_opening=is_opening,
+                is_closing=is_closing,
+                on_sentence=on_sentence,
+                timings=timings
+            )
+
+        turn_timeout = conversation.config.turn_timeout
+        try:
+            text = await (asyncio.wait_for(message, turn_timeout) if turn_timeout else message)
+        except asyncio.TimeoutError:
+            for task in chunk_tasks or []:
+                task.cancel()
+            raise _DeadlineExceeded(
+                'turn_timeout',
+                f"Turn {len(conversation.turns) + 1} took longer than {turn_timeout:g}s"
+            ) from None
+        except BaseException:
+            for task in chunk_tasks or []:
+                task.cancel()
+            raise
+
+        await self._add_turn(run, speaker, text, timings=timings, chunk_tasks=chunk_tasks)
+        return text
 
     async def _generate_customer_message(
         self,
         persona: CustomerPersona,
-        conversation: Conversation
+        conversation: Conversation,
+        on_sentence: Optional[Callable[[str], None]] = None,
+        timings: Optional[Dict[str, Any]] = None
     ) -> str:
         """Generate a customer message based on persona and context"""
+        prompt_start = time.time()
+
+        if conversation.config.prompt_mode == "messages":
+            messages = PromptBuilder.build_customer_messages(persona, conversation.turns)
+            system_prompt, user_prompt = None, ""
+        else:
+            # Use ContextManager to format context
+            context = ContextManager.format_context(conversation.turns)
 
-        # Use ContextManager to format context
-        context = ContextManager.format_context(conversation.turns)
+            # Use PromptBuilder to build prompts
+            system_prompt, user_prompt = PromptBuilder.build_customer_prompt(persona, context)
+            messages = None
 
-        # Use PromptBuilder to build prompts
-        system_prompt, user_prompt = PromptBuilder.build_customer_prompt(persona, context)
+        if timings is not None:
+            timings['prompt_build_ms'] = (time.time() - prompt_start) * 1000
 
         # Generate response
-        response = await self.llm.generate_completion(
-            prompt=user_prompt,
-            system_prompt=system_prompt,
-            temperature=conversation.config.temperature,
-            max_tokens=conversation.config.max_tokens
+        return await self._complete(
+            system_prompt,
+            user_prompt,
+            conversation.config,
+            on_sentence=on_sentence,
+            timings=timings,
+            messages=messages,
+            role=TurnType.CUSTOMER.value
         )
 
-        return response.strip()
-
     async def _generate_support_message(
         self,
         persona: SupportPersona,
         conversation: Conversation,
         is_opening: bool = False,
-        is_closing: bool = False
+        is_closing: bool = False,
+        on_sentence: Optional[Callable[[str], None]] = None,
+        timings: Optional[Dict[str, Any]] = None
     ) -> str:
         """Generate a support agent message based on persona and context"""
+        prompt_start = time.time()
 
-        # Use ContextManager to format context
-        context = ContextManager.format_context(conversation.turns)
+        if conversation.config.prompt_mode == "messages":
+            # The opening is simply the reply to the history's first message
+            messages = PromptBuilder.build_support_messages(persona, conversation.turns, is_closing)
+            system_prompt, user_prompt = None, ""
+        else:
+            # Use ContextManager to format context
+            context = ContextManager.format_context(conversation.turns)
 
-        # Use PromptBuilder to build prompts
-        system_prompt, user_prompt = PromptBuilder.build_support_prompt(
-            persona, context, is_opening, is_closing
-        )
+            # Use PromptBuilder to build prompts
+            system_prompt, user_prompt = PromptBuilder.build_support_prompt(
+                persona, context, is_opening, is_closing
+            )
+            messages = None
+
+        if timings is not None:
+            timings['prompt_build_ms'] = (time.time() - prompt_start) * 1000
 
         # Generate response
-        response = await self.llm.generate_completion(
-            prompt=user_prompt,
-            system_prompt=system_prompt,
-            temperature=conversation.config.temperature,
-            max_tokens=conversation.config.max_tokens
+        return await self._complete(
+            system_prompt,
+            user_prompt,
+            conversation.config,
+            on_sentence=on_sentence,
+            timings=timings,
+            messages=messages,
+            role=TurnType.SUPPORT.value
         )
 
-        return response.strip()
+    def _llm_for(self, config: ConversationConfig, role: str) -> LLMProvider:
+        """Get the LLM provider a role of the conversation is routed to
+
+        Raises:
+            ValueError: If the role names a provider that wasn't given
+        """
+        name = config.llm_settings(role)['provider']
+        if name is None or (name == config.llm_provider and name not in self.llm_providers):
+            return self.llm
+        if name not in self.llm_providers:
+            raise ValueError(f"No LLM provider named '{name}' for the {role} role")
+        return self.llm_providers[name]
+
+    def _get_llm_limiter(self, llm: LLMProvider, model: Optional[str]) -> AdaptiveLimiter:
+        """Get the adaptive concurrency limiter for requests to a model"""
+        model = model or llm.get_model_name()
+        if model not in self._llm_limiters:
+            self._llm_limiters[model] = self.concurrency.get_limiter(
+                f"llm:{model}",
+                **llm.config.get('concurrency', {})
+            )
+        return self._llm_limiters[model]
+
+    async def _complete(
+        self,
+        system_prompt: Optional[str],
+        user_prompt: str,
+        config: ConversationConfig,
+        on_sentence: Optional[Callable[[str], None]] = None,
+        timings: Optional[Dict[str, Any]] = None,
+        messages: Optional[List[Dict[str, str]]] = None,
+        role: str = "support"
+    ) -> str:
+        """Run the LLM request, streaming sentences to on_sentence if given
+
+        Sends messages as a chat completion when given, otherwise the system
+        and user prompts, to the provider, model and sampling settings the
+        role is routed to. Records 'llm_start' (epoch seconds), 'ttft_ms',
+        'llm_ms' and the provider's token usage ('llm_usage') into timings.
+        """
+        timings = timings if timings is not None else {}
+        usage: Dict[str, Any] = {}
+        timings['llm_usage'] = usage
+
+        settings = config.llm_settings(role)
+        llm = self._llm_for(config, role)
+        limiter = self._get_llm_limiter(llm, settings['model'])
+        request_kwargs = {'model': settings['model']} if settings['model'] else {}
+        # Retries happen inside the slot; each one still tells the limiter
+        request_kwargs.update(retry_hook_kwargs(llm, limiter.record_retry))
+
+        # Time spent waiting for a slot counts towards the turn, not the LLM
+        async with limiter.slot():
+            timings['llm_start'] = time.time()
+
+            if on_sentence is None:
+                if messages is not None:
+                    request = llm.generate_chat_completion(
+                        messages=messages,
+                        temperature=settings['temperature'],
+                        max_tokens=settings['max_tokens'],
+                        stats=usage,
+                        **request_kwargs
+                    )
+                else:
+                    request = llm.generate_completion(
+                        prompt=user_prompt,
+                        system_prompt=system_prompt,
+                        temperature=settings['temperature'],
+                        max_tokens=settings['max_tokens'],
+                        stats=usage,
+                        **request_kwargs
+                    )
+                response = await self._with_request_timeout(
+                    request,
+                    config.request_timeout,
+                    llm.get_model_name()
+                )
+                # Without streaming the first token arrives with the full reply
+                timings['ttft_ms'] = (time.time() - timings['llm_start']) * 1000
+                timings['llm_ms'] = timings['ttft_ms']
+                return response.strip()
+
+            if messages is not None:
+                tokens = llm.generate_chat_completion_stream(
+                    messages=messages,
+                    temperature=settings['temperature'],
+                    max_tokens=settings['max_tokens'],
+                    stats=usage,
+                    **request_kwargs
+                )
+            else:
+                tokens = llm.generate_completion_stream(
+                    prompt=user_prompt,
+                    system_prompt=system_prompt,
+                    temperature=settings['temperature'],
+                    max_tokens=settings['max_tokens'],
+                    stats=usage,
+                    **request_kwargs
+                )
+
+            async def stream() -> str:
+                text = ""
+                pending = ""
+                async for token in tokens:
+                    if 'ttft_ms' not in timings:
+                        timings['ttft_ms'] = (time.time() - timings['llm_start']) * 1000
+                    text += token
+                    pending += token
+
+                    # Flush every complete sentence that is long enough to voice well
+                    sentences, pending = self._split_sentences(pending)
+                    for sentence in sentences:
+                        on_sentence(sentence)
+
+                if pending.strip():
+                    on_sentence(pending.strip())
+                return text
+
+            # The timeout covers the whole stream, not just the first token
+            text = await self._with_request_timeout(stream(), config.request_timeout, llm.get_model_name())
+
+        timings['llm_ms'] = (time.time() - timings['llm_start']) * 1000
+        return text.strip()
+
+    def _split_sentences(self, text: str) -> tuple[List[str], str]:
+        """Split complete sentences off the front of streamed text
+
+        Returns:
+            Tuple of (complete sentences, remaining text)
+        """
+        sentences = []
+        start = 0
+        for match in self.SENTENCE_BOUNDARY.finditer(text):
+            candidate = text[start:match.end()].strip()
+            if len(candidate) >= self.MIN_SENTENCE_CHARS:
+                sentences.append(candidate)
+                start = match.end()
+        return sentences, text[start:]
 
     async def _add_turn(
         self,
-        conversation: Conversation,
-        metrics: ConversationMetrics,
+        run: "_ConversationRun",
         speaker: TurnType,
         text: str,
-        persona: Any  # CustomerPersona or SupportPersona
+        timings: Optional[Dict[str, Any]] = None,
+        chunk_tasks: Optional[List[asyncio.Task]] = None
     ) -> None:
-        """Add a turn to the conversation with audio generation"""
+        """Add a turn to the conversation and schedule its audio generation"""
 
-        # Record start time for latency measurement
-        start_time = time.time()
+        timings = timings or {}
 
         # Add turn to conversation
-        turn = conversation.add_turn(speaker, text)
+        turn = run.conversation.add_turn(speaker, text)
+        turn.time_to_first_token_ms = timings.get('ttft_ms')
+        if 'prompt_build_ms' in timings:
+            turn.stage_timings_ms['prompt_build'] = timings['prompt_build_ms']
+        if 'llm_ms' in timings:
+            turn.stage_timings_ms['llm'] = timings['llm_ms']
+        if 'llm_usage' in timings:
+            self._record_llm_usage(run, timings['llm_usage'], role=speaker.value)
+            usage = timings['llm_usage']
+            if 'prompt_tokens' in usage:
+                # Per turn, to compare latency against prompt cache hits
+                turn.metadata['prompt_tokens'] = usage['prompt_tokens']
+                turn.metadata['cached_tokens'] = usage.get('cached_tokens', 0)
 
         # Print to console
         icon = "👤" if speaker == TurnType.CUSTOMER else "🎧"
-        print(f"\n{icon} {speaker.value.upper()}: {text}")
-        print(f"   [Generating audio with {self.tts.get_provider_name()}...]")
+        self._log(f"\n{icon} {speaker.value.upper()}: {text}")
+        run.emit(TurnTextReady(run.conversation.id, turn))
+        run.emit(MetricsUpdated(run.conversation.id, run.metrics))
+
+        if run.audio_tasks is None:
+            # Text-only for now; latency covers prompt build and LLM only
+            if 'turn_start' in timings:
+                turn.latency_ms = (time.time() - timings['turn_start']) * 1000
+            turn.stage_timings_ms['storage_write'] = await self._checkpoint(run.conversation, run.metrics)
+            return
+
+        self._log(f"   [Generating audio with {self.tts.get_provider_name()}...]")
+
+        # Render audio in the background so the next LLM call can start now
+        run.audio_tasks.append(asyncio.create_task(
+            self._generate_turn_audio(
+                run,
+                turn,
+                llm_start=timings.get('llm_start'),
+                turn_start=timings.get('turn_start'),
+                chunk_tasks=chunk_tasks
+            )
+        ))
+
+    async def _generate_turn_audio(
+        self,
+        run: "_ConversationRun",
+        turn: Turn,
+        llm_start: Optional[float] = None,
+        turn_start: Optional[float] = None,
+        chunk_tasks: Optional[List[asyncio.Task]] = None
+    ) -> None:
+        """Generate audio for a single turn, record its latency and checkpoint it
+
+        Turn latency runs from turn_start (before the prompt was built) until
+        the audio is ready. When the audio is rendered separately from the
+        text, it is the text stages plus the time spent rendering.
+
+        Args:
+            run: Generation state of the conversation the turn belongs to
+            turn: Turn to generate audio for
+            llm_start: When the LLM request for this turn started, for time-to-first-audio
+            turn_start: When work on this turn started, for end-to-end latency
+            chunk_tasks: Already-running per-sentence TTS tasks (streaming mode)
+        """
+
+        # Record start time for latency measurement
+        start_time = time.time()
+        persona = run.persona_for(turn.speaker)
+
+        if chunk_tasks is None:
+            chunk_tasks = [asyncio.create_task(
+                self._synthesize(turn.text, persona, timeout=run.conversation.config.request_timeout)
+            )]
+
+        chunks = []
+        errors = []
+        tts_ms = 0.0
+        audio_encode_ms = 0.0
+        try:
+            for index, task in enumerate(chunk_tasks):
+                audio_data, finished_at, stats = await task
+                # A failed first chunk has no audio, so it isn't first audio
+                if index == 0 and audio_data and llm_start is not None:
+                    turn.time_to_first_audio_ms = (finished_at - llm_start) * 1000
+                run.metrics.tts_retries += stats.get('retries', 0)
+                run.metrics.tts_hedged_requests += int(stats.get('hedged', False))
+                run.metrics.tts_hedge_wins += int(stats.get('hedge_won', False))
+                if audio_data:
+                    chunks.append(audio_data)
+                    self._record_tts_usage(run, stats)
+                elif 'error' in stats:
+                    run.metrics.failed_tts_requests += 1
+                    errors.append(stats['error'])
+                audio_encode_ms += stats.get('audio_encode_ms', 0.0)
+                tts_ms += stats['tts_ms'] - stats.get('audio_encode_ms', 0.0)
+        except BaseException:
+            for task in chunk_tasks:
+                task.cancel()
+            raise
+
+        turn.stage_timings_ms['tts'] = tts_ms
+        turn.stage_timings_ms['audio_encode'] = audio_encode_ms
+
+        # A turn with a missing sentence is left without audio (rather than
+        # saved with a gap) so it is reported and re-rendered on resume
+        if errors:
+            turn.metadata['audio_error'] = errors[0]
+            chunks = []
+        else:
+            turn.metadata.pop('audio_error', None)
+
+        # Sentence chunks are independent MP3 streams, which concatenate cleanly
+        if chunks:
+            turn.audio_data = b"".join(chunks)
+            run.metrics.total_audio_size_bytes += len(turn.audio_data)
+
+        # Calculate latency
+        if turn_start is not None:
+            turn.latency_ms = (time.time() - turn_start) * 1000
+        else:
+            text_ms = turn.stage_timings_ms.get('prompt_build', 0.0) + turn.stage_timings_ms.get('llm', 0.0)
+            turn.latency_ms = text_ms + (time.time() - start_time) * 1000
+
+        turn.stage_timings_ms['storage_write'] = await self._checkpoint(run.conversation, run.metrics)
+
+        if turn.audio_data:
+            run.emit(TurnAudioReady(run.conversation.id, turn))
+        run.emit(MetricsUpdated(run.conversation.id, run.metrics))
+
+    async def _synthesize(
+        self,
+        text: str,
+        persona: Any,
+        timeout: Optional[float] = None
+    ) -> tuple[Optional[bytes], float, Dict[str, Any]]:
+        """Generate speech for a piece of text, failing it after timeout seconds
 
-        # Generate audio
+        Returns:
+            Tuple of (audio bytes or None on failure, completion time in epoch
+            seconds, provider stats including 'tts_ms' and 'characters')
+        """
+        stats: Dict[str, Any] = {}
+
+        # Detect if text contains Hindi characters or is Hinglish
+        # If so, pass language='hi' to TTS provider
+        has_hindi = any('\u0900' <= char <= '\u097F' for char in text)
+        language = 'hi' if has_hindi else 'en'
+
+        start_time = time.time()
         try:
-            # Detect if text contains Hindi characters or is Hinglish
-            # If so, pass language='hi' to TTS provider
-            has_hindi = any('\u0900' <= char <= '\u097F' for char in text)
-            language = 'hi' if has_hindi else 'en'
-
-            audio_data = await self.tts.generate_speech(
-                text=text,
-                voice_config=persona.voice_config,
-                language=language
+            async with self._tts_limiter.slot():
+                start_time = time.time()
+                audio_data = await self._with_request_timeout(
+                    self.tts.generate_speech(
+                        text=text,
+                        voice_config=persona.voice_config,
+                        language=language,
+                        stats=stats,
+                        **retry_hook_kwargs(self.tts, self._tts_limiter.record_retry)
+                    ),
+                    timeout,
+                    self.tts.get_provider_name()
+                )
+            # Providers that bill by something else report their own count
+            stats.setdefault('characters', len(text))
+        except Exception as e:
+            self._log(f"   [Warning: Audio generation failed: {e}]")
+            stats['error'] = str(e)
+            audio_data = None
+
+        finished_at = time.time()
+        stats['tts_ms'] = (finished_at - start_time) * 1000
+        return audio_data, finished_at, stats
+
+    def _record_llm_usage(self, run: "_ConversationRun", usage: Dict[str, Any], role: Optional[str] = None) -> None:
+        """Add one LLM call's tokens and estimated cost to the run's totals"""
+        llm = self._llm_for(run.conversation.config, role) if role else self.llm
+        cost = llm.estimate_cost(usage)
+        run.metrics.llm_retries += usage.get('retries', 0)
+        if 'cache_hit' in usage:
+            if usage['cache_hit']:
+                run.metrics.llm_cache_hits += 1
+            else:
+                run.metrics.llm_cache_misses += 1
+        run.metrics.add_llm_usage(
+            prompt_tokens=usage.get('prompt_tokens', 0),
+            completion_tokens=usage.get('completion_tokens', 0),
+            cached_tokens=usage.get('cached_tokens', 0),
+            cost_usd=cost,
+            role=role,
+            model=usage.get('model') or llm.get_model_name()
+        )
+        if run.batch_budget is not None:
+            run.batch_budget.add(cost)
+
+    def _record_tts_usage(self, run: "_ConversationRun", usage: Dict[str, Any]) -> None:
+        """Add one TTS call's characters and estimated cost to the run's totals"""
+        cost = self.tts.estimate_cost(usage)
+        run.metrics.add_tts_usage(characters=usage.get('characters', 0), cost_usd=cost)
+        if usage.get('hedge_extra_characters'):
+            # The losing request of a hedge race is billed too
+            run.metrics.add_hedge_overhead(usage['hedge_extra_characters'], usage.get('hedge_extra_cost_usd', 0.0))
+            cost += usage.get('hedge_extra_cost_usd', 0.0)
+        if run.batch_budget is not None:
+            run.batch_budget.add(cost)
+
+    def _check_budget(self, run: "_ConversationRun") -> None:
+        """Raise _BudgetExhausted if the conversation or batch cap is reached
+
+        Audio still rendering in the background is not yet counted, so a cap
+        can be overshot by the cost of the turns in flight.
+        """
+        budget_usd = run.conversation.config.budget_usd
+        if budget_usd is not None and run.metrics.total_cost_usd >= budget_usd:
+            raise _BudgetExhausted(
+                'conversation_budget',
+                f"Conversation budget of ${budget_usd:.4f} reached (${run.metrics.total_cost_usd:.4f} spent)"
+            )
+
+        if run.batch_budget is not None and run.batch_budget.exhausted:
+            raise _BudgetExhausted(
+                'batch_budget',
+                f"Batch budget of ${run.batch_budget.limit_usd:.4f} reached"
             )
 
-            if audio_data:
-                turn.audio_data = audio_data
-                metrics.total_audio_size_bytes += len(audio_data)
+    async def _checkpoint(
+        self,
+        conversation: Conversation,
+        metrics: ConversationMetrics,
+        status: str = "in_progress",
+        extra: Optional[Dict[str, Any]] = None
+    ) -> float:
+        """Write a checkpoint if enabled for this conversation
 
+        Checkpoint failures never abort generation; they are only reported.
+
+        Returns:
+            Time spent writing in milliseconds (0 when checkpointing is off)
+        """
+        if not conversation.config.checkpoint:
+            return 0.0
+
+        start_time = time.time()
+        try:
+            await self.storage.save_checkpoint(conversation, metrics, status=status, extra=extra)
         except Exception as e:
-            print(f"   [Warning: Audio generation failed: {e}]")
+            self._log(f"   [Warning: Checkpoint failed for {conversation.id}: {e}]")
+        return (time.time() - start_time) * 1000
 
-        # Calculate latency
-        latency_ms = (time.time() - start_time) * 1000
-        turn.latency_ms = latency_ms
-        metrics.add_turn_metrics(latency_ms=latency_ms)
+    def _get_tts_semaphore(self, limit: int) -> asyncio.Semaphore:
+        """Get the semaphore bounding parallel requests to the TTS provider
+
+        Conversations rendering with the same limit share one semaphore; a
+        different limit gets its own rather than inheriting the first one.
+        """
+        key = (self.tts.get_provider_name(), max(1, limit))
+        if key not in self._tts_semaphores:
+            self._tts_semaphores[key] = asyncio.Semaphore(key[1])
+        return self._tts_semaphores[key]
+
+    async def render_audio(
+        self,
+        conversation: Conversation,
+        customer_persona: CustomerPersona,
+        support_persona: SupportPersona,
+        metrics: ConversationMetrics,
+        max_concurrency: Optional[int] = None,
+        on_event: Optional[Callable[[ConversationEvent], None]] = None
+    ) -> None:
+        """Generate audio for every turn of a finished script in parallel
+
+        Turns that already have audio are skipped. Requests are bounded per
+        TTS provider and limit, so concurrent conversations with the same
+        limit share it.
+
+        Args:
+            conversation: Conversation whose turns need audio
+            customer_persona: Persona providing the customer voice
+            support_persona: Persona providing the support voice
+            metrics: Metrics to record audio sizes into
+            max_concurrency: Max parallel TTS requests (defaults to config.tts_concurrency)
+            on_event: Optional callback receiving TurnAudioReady events
+        """
+        limit = max_concurrency or conversation.config.tts_concurrency
+        semaphore = self._get_tts_semaphore(limit)
+        run = _ConversationRun(conversation, metrics, customer_persona, support_persona, on_event=on_event)
+
+        async def render(turn: Turn) -> None:
+            async with semaphore:
+                await self._generate_turn_audio(run, turn)
+
+        pending = [turn for turn in conversation.turns if not turn.audio_data]
+        self._log(f"\n🔊 Rendering audio for {len(pending)} turns with {self.tts.get_provider_name()}...")
+        await asyncio.gather(*(render(turn) for turn in pending))
+
+    async def render_transcript(
+        self,
+        transcript_key: str,
+        customer_persona: CustomerPersona,
+        support_persona: SupportPersona,
+        max_concurrency: Optional[int] = None
+    ) -> tuple[Conversation, ConversationMetrics]:
+        """Render audio for a transcript previously saved to storage
+
+        Args:
+            transcript_key: Storage key or path of the transcript
+            customer_persona: Persona providing the customer voice
+            support_persona: Persona providing the support voice
+            max_concurrency: Max parallel TTS requests
+
+        Returns:
+            Tuple of (Conversation with audio, ConversationMetrics)
+        """
+        data = await self.storage.load_transcript(transcript_key)
+        conversation = Conversation.from_dict(data)
+        conversation.metadata['rendered_from'] = transcript_key
+
+        # Keep the text-generation metrics but recompute everything audio related
+        metrics = ConversationMetrics.from_dict(data['metrics']) if data.get('metrics') else ConversationMetrics()
+        metrics.conversation_id = conversation.id
+        metrics.tts_provider = self.tts.get_provider_name()
+        metrics.started_at = datetime.now()
+        metrics.total_audio_size_bytes = 0
+        metrics.turn_latencies = []
+        metrics.turn_ttft_ms = []
+        metrics.turn_ttfa_ms = []
+        metrics.stage_latencies = {}
+        metrics.tts_requests = 0
+        metrics.tts_characters = 0
+        metrics.tts_cost_usd = 0
+        metrics.failed_tts_requests = 0
+        metrics.tts_retries = 0
+        metrics.tts_hedged_requests = 0
+        metrics.tts_hedge_wins = 0
+        metrics.tts_hedge_extra_characters = 0
+        metrics.tts_hedge_extra_cost_usd = 0
+
+        await self.render_audio(
+            conversation,
+            customer_persona,
+            support_persona,
+            metrics,
+            max_concurrency=max_concurrency
+        )
+        self._finalize_metrics(conversation, metrics)
+
+        return conversation, metrics
+
+    def _finalize_metrics(self, conversation: Conversation, metrics: ConversationMetrics) -> None:
+        """Fill in per-turn and aggregate metrics once all turns are done
+
+        Safe to call again on metrics that were already finalized (a resumed
+        completed checkpoint, re-rendered audio); per-turn samples are rebuilt.
+        """
+        metrics.reset_turn_metrics()
+        for turn in conversation.turns:
+            metrics.add_turn_metrics(
+                latency_ms=turn.latency_ms,
+                ttft_ms=turn.time_to_first_token_ms,
+                ttfa_ms=turn.time_to_first_audio_ms,
+                stage_timings_ms=turn.stage_timings_ms
+            )
+
+        metrics.completed_at = datetime.now()
+        metrics.total_turns = len(conversation.turns)
+        metrics.customer_turns = sum(1 for t in conversation.turns if t.speaker == TurnType.CUSTOMER)
+        metrics.support_turns = sum(1 for t in conversation.turns if t.speaker == TurnType.SUPPORT)
+
+        # Adaptive limits as they stood when this conversation finished
+        metrics.provider_limits[self._llm_limiter.name] = self._llm_limiter.snapshot()
+        for usage in metrics.llm_usage_by_role.values():
+            limiter = self._llm_limiters.get(usage['model'])
+            if limiter is not None:
+                metrics.provider_limits[limiter.name] = limiter.snapshot()
+        if metrics.tts_requests or metrics.failed_tts_requests:
+            metrics.provider_limits[self._tts_limiter.name] = self._tts_limiter.snapshot()
+
+        metrics.turns_missing_audio = sum(1 for t in conversation.turns if 'audio_error' in t.metadata)
+        for provider in (self.llm, *self.llm_providers.values(), self.tts):
+            circuit_breaker = getattr(provider, 'circuit_breaker', None)
+            if circuit_breaker is not None:
+                metrics.circuit_breakers[circuit_breaker.name] = circuit_breaker.snapshot()
+
+        metrics.calculate_aggregates()
 
     def _is_customer_satisfied(self, message: str) -> bool:
         """Check if customer seems satisfied based on their message"""
-        satisfied_phrases = [
-            "thank you", "thanks", "perfect", "great", "that works",
-            "appreciate", "helpful", "solved", "fixed", "awesome",
-            "wonderful", "excellent", "that's fine", "okay then"
-        ]
-        message_lower = message.lower()
-        return any(phrase in message_lower for phrase in satisfied_phrases)
+        return self._matchers['satisfied'].matches(message)
 
     def _should_end_conversation(self, message: str) -> bool:
         """Check if support agent is trying to end the conversation"""
-        ending_phrases = [
-            "anything else", "have a great day", "thank you for calling",
-            "goodbye", "take care", "resolved", "have a nice day",
-            "is there anything else", "glad I could help"
-        ]
-        message_lower = message.lower()
-        return any(phrase in message_lower for phrase in ending_phrases)
+        return self._matchers['ending'].matches(message)
 
     def _is_resolution_likely(self, conversation: Conversation) -> bool:
         """Check if the conversation is likely moving toward resolution"""
@@ -295,12 +1223,11 @@ class ConversationOrchestrator:
         positive_indicators = 0
 
         for turn in recent_turns:
-            text_lower = turn.text.lower()
             # Look for positive phrases
-            if any(word in text_lower for word in ["understand", "help", "sure", "definitely", "absolutely"]):
+            if self._matchers['positive'].matches(turn.text):
                 positive_indicators += 1
             # Look for solution-oriented language
-            if any(word in text_lower for word in ["will", "can", "let me", "I'll"]):
+            if self._matchers['solution'].matches(turn.text):
                 positive_indicators += 1
 
         return positive_indicators >= 2
@@ -322,6 +1249,7 @@ class ConversationOrchestrator:
             Dictionary with storage paths
         """
         # Combine audio if requested
+        combine_start = time.time()
         combined_audio = None
         if combine_audio and any(t.audio_data for t in conversation.turns):
             # Combine all audio segments using pydub
@@ -358,15 +1286,217 @@ class ConversationOrchestrator:
                     print(f"Warning: Audio combination failed: {e}. Using fallback.")
                     combined_audio = b"".join(audio_segments)  # Fallback
 
-        # Save to storage
+        if combined_audio:
+            metrics.audio_combine_ms = (time.time() - combine_start) * 1000
+
+        # Save to storage (which records storage_write_ms in the saved metrics)
         storage_paths = await self.storage.save_conversation(
             conversation,
             metrics,
             audio_data=combined_audio
         )
 
-        print(f"\n✅ Conversation saved:")
+        # Turn audio now lives in the saved files; keep only a completion marker
+        await self._checkpoint(conversation, metrics, "saved", extra={'storage_paths': storage_paths})
+
+        self._log(f"\n✅ Conversation saved:")
         for key, path in storage_paths.items():
-            print(f"  {key}: {path}")
+            self._log(f"  {key}: {path}")
+
+        return storage_paths
+
+    async def generate_batch(
+        self,
+        jobs: List[BatchJob],
+        max_concurrency: int = 4,
+        save: bool = True,
+        on_result: Optional[Callable[[BatchResult], Optional[Awaitable[None]]]] = None,
+        resume: bool = False,
+        budget_usd: Optional[float] = None,
+        batch_budget: Optional[BatchBudget] = None
+    ) -> List[BatchResult]:
+        """Generate many conversations concurrently on the current event loop
+
+        All jobs share this orchestrator's provider clients. At most
+        max_concurrency conversations are in flight at once, and each one is
+        saved to storage as soon as it finishes rather than at the end.
+
+        The first Ctrl-C stops new jobs from starting and lets in-flight
+        conversations stop at their next turn boundary and flush a
+        checkpoint; a second Ctrl-C cancels them outright.
+
+        Args:
+            jobs: Conversations to generate
+            max_concurrency: Maximum number of conversations in flight
+            save: Whether to save each conversation to storage
+            on_result: Optional callback (sync or async) invoked per finished job
+            resume: Skip jobs already saved and continue checkpointed ones
+                (requires the same job IDs as the interrupted run)
+            budget_usd: Optional estimated-cost cap for the whole batch. Once
+                reached no new jobs start and in-flight conversations end at
+                their next turn boundary.
+            batch_budget: Budget to draw from instead of one built from
+                budget_usd (e.g. shared with other processes)
+
+        Returns:
+            List of BatchResult objects in the same order as jobs
+        """
+        if max_concurrency < 1:
+            raise ValueError("max_concurrency must be at least 1")
+
+        await self.warm_up(min(max_concurrency, len(jobs)))
+
+        results: List[Optional[BatchResult]] = [None] * len(jobs)
+        queue: asyncio.Queue = asyncio.Queue()
+        for index, job in enumerate(jobs):
+            queue.put_nowait((index, job))
+
+        stop_event = asyncio.Event()
+        budget = batch_budget
+        if budget is None and budget_usd is not None:
+            budget = BatchBudget(limit_usd=budget_usd)
+
+        async def worker():
+            while not stop_event.is_set():
+                if budget is not None and budget.exhausted:
+                    return
+                try:
+                    index, job = queue.get_nowait()
+                except asyncio.QueueEmpty:
+                    return
+
+                result = await self._run_batch_job(
+                    job,
+                    save,
+                    resume=resume,
+                    stop_event=stop_event,
+                    batch_budget=budget
+                )
+                results[index] = result
+
+                if on_result is not None:
+                    callback_result = on_result(result)
+                    if asyncio.iscoroutine(callback_result):
+                        await callback_result
+
+        workers = [
+            asyncio.create_task(worker())
+            for _ in range(min(max_concurrency, len(jobs)))
+        ]
+
+        def on_interrupt():
+            if stop_event.is_set():
+                print("\n⛔ Interrupted again, cancelling in-flight conversations...")
+                for task in workers:
+                    task.cancel()
+            else:
+                print("\n⏸️  Interrupted, finishing current turns (Ctrl-C again to abort)...")
+                stop_event.set()
+
+        loop = asyncio.get_running_loop()
+        try:
+            loop.add_signal_handler(signal.SIGINT, on_interrupt)
+            handles_signal = True
+        except (NotImplementedError, RuntimeError):
+            # Not supported on this platform or outside the main thread
+            handles_signal = False
+
+        try:
+            await asyncio.gather(*workers, return_exceptions=True)
+        finally:
+            if handles_signal:
+                loop.remove_signal_handler(signal.SIGINT)
+
+        # Jobs that never started (or were cancelled) are reported, not dropped
+        not_started = "Interrupted: not started"
+        if budget is not None and budget.exhausted and not stop_event.is_set():
+            not_started = f"Batch budget of ${budget.limit_usd:.4f} reached: not started"
+        for index, job in enumerate(jobs):
+            if results[index] is None:
+                results[index] = BatchResult(job=job, error=not_started)
+
+        return results
+
+    async def run_job(
+        self,
+        job: BatchJob,
+        save: bool = True,
+        resume: bool = False,
+        stop_event: Optional[asyncio.Event] = None
+    ) -> BatchResult:
+        """Generate (and optionally save) a single job outside generate_batch
+
+        Used by queue workers, which pull jobs one at a time. Errors are
+        captured in the result, as in generate_batch.
+
+        Args:
+            job: Conversation to generate
+            save: Whether to save the conversation to storage
+            resume: Skip the job if already saved, or continue its checkpoint
+            stop_event: Optional event that ends the conversation at the next
+                turn boundary (reported as an interrupted result)
+
+        Returns:
+            BatchResult of the job
+        """
+        return await self._run_batch_job(job, save, resume=resume, stop_event=stop_event)
+
+    async def _run_batch_job(
+        self,
+        job: BatchJob,
+        save: bool,
+        resume: bool = False,
+        stop_event: Optional[asyncio.Event] = None,
+        batch_budget: Optional[BatchBudget] = None
+    ) -> BatchResult:
+        """Generate (and optionally save) a single batch job, capturing errors"""
+        result = BatchResult(job=job)
+        start_time = time.time()
+
+        try:
+            if resume and job.job_id:
+                checkpoint = await self.storage.load_checkpoint(job.job_id)
+                if checkpoint and checkpoint['status'] == 'saved':
+                    # Finished in an earlier run; nothing left to generate
+                    result.storage_paths = checkpoint.get('storage_paths', {})
+                    result.conversation = checkpoint['conversation']
+                    result.metrics = checkpoint['metrics']
+                    result.duration_seconds = time.time() - start_time
+                    return result
+
+            conversation, metrics = await self.generate_conversation(
+                customer_persona=job.customer_persona,
+                support_persona=job.support_persona,
+                config=job.config,
+                conversation_id=job.job_id,
+                resume=resume,
+                stop_event=stop_event,
+                batch_budget=batch_budget
+            )
+            conversation.metadata.update(job.metadata)
+            result.conversation = conversation
+            result.metrics = metrics
+
+            missing_audio = metrics.turns_missing_audio and not conversation.metadata.get('partial')
+            if missing_audio:
+                result.error = (
+                    f"Audio failed for {metrics.turns_missing_audio} of {metrics.total_turns} turns "
+                    f"(after {metrics.tts_retries} retries)"
+                )
+                if not conversation.config.checkpoint:
+                    # Nothing to resume from, so keep the paid-for text; the
+                    # failed turns carry their audio_error
+                    conversation.metadata['partial'] = True
+
+            if save and not (missing_audio and conversation.config.checkpoint):
+                # With checkpointing, silent turns aren't saved: resuming
+                # re-renders only the missing audio
+                result.storage_paths = await self.save_conversation(conversation, metrics)
+
+        except GenerationInterrupted as e:
+            result.error = f"Interrupted: {e}"
+        except Exception as e:
+            result.error = f"{type(e).__name__}: {e}"
 
-        return storage_paths
\ No newline at end of file
+        result.duration_seconds = time.time() - start_time
+        return result
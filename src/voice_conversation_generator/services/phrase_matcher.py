@@ -0,0 +1,184 @@
+"""
+Phrase Matcher Service - Precompiled multilingual phrase detection
+Used by the conversation-ending heuristics of the orchestrator and context manager
+"""
+import re
+import unicodedata
+from functools import lru_cache
+from typing import Dict, Iterable, List, Optional
+
+
+# Phrase sets by category and language. 'hi' holds Devanagari phrases and
+# 'hinglish' romanised Hindi, since personas produce both.
+PHRASE_SETS: Dict[str, Dict[str, List[str]]] = {
+    # Customer signals that the issue is resolved
+    "satisfied": {
+        "en": [
+            "thank you", "thanks", "perfect", "great", "that works",
+            "appreciate", "appreciate it", "helpful", "solved", "fixed", "awesome",
+            "wonderful", "excellent", "that's fine", "okay then"
+        ],
+        "hi": [
+            "धन्यवाद", "शुक्रिया", "बहुत अच्छा", "बढ़िया", "समस्या हल",
+            "काम हो गया"
+        ],
+        "hinglish": [
+            "dhanyavaad", "dhanyavad", "dhanyawad", "shukriya", "bahut accha",
+            "bahut achha", "badhiya", "kaam ho gaya"
+        ]
+    },
+    # Support agent wrapping up the call
+    "ending": {
+        "en": [
+            "anything else", "have a great day", "thank you for calling",
+            "goodbye", "take care", "resolved", "have a nice day",
+            "is there anything else", "glad I could help"
+        ],
+        "hi": [
+            "और कुछ मदद चाहिए", "और कोई मदद", "आपका दिन शुभ हो", "कॉल करने के लिए धन्यवाद",
+            "अलविदा", "अपना ख्याल रखें", "अपना ख्याल रखिए", "हल हो गया",
+            "मदद करके खुशी"
+        ],
+        "hinglish": [
+            "aur kuch madad chahiye", "aur koi madad", "alvida", "apna khayal rakhiye",
+            "apna khayal rakhein", "hal ho gaya", "madad karke khushi"
+        ]
+    },
+    # Cooperative language suggesting the conversation is converging
+    "positive": {
+        "en": [
+            "understand", "understood", "help", "helping", "helpful",
+            "sure", "definitely", "absolutely"
+        ],
+        "hi": [
+            "समझ", "समझता", "समझती", "समझ गया", "मदद", "ज़रूर", "जरूर",
+            "बिल्कुल", "बिलकुल"
+        ],
+        "hinglish": ["samajh", "samajhta", "samajhti", "madad", "zaroor", "jaroor", "bilkul"]
+    },
+    # Solution-oriented commitments from either side
+    "solution": {
+        "en": ["will", "can", "let me", "i'll", "we'll"],
+        "hi": [
+            "करता हूं", "करती हूं", "कर दूंगा", "कर दूंगी", "देखता हूं",
+            "देखती हूं", "कर सकते हैं", "कर देते हैं"
+        ],
+        "hinglish": [
+            "karta hoon", "karti hoon", "kar dunga", "kar dungi",
+            "dekhta hoon", "dekhti hoon", "kar sakte hain", "kar dete hain"
+        ]
+    },
+    # Either side signalling the end, checked over recent context
+    "context_ending": {
+        "en": [
+            "thank you", "thanks", "goodbye", "bye", "have a nice day",
+            "take care", "appreciate your help", "that's all", "all set",
+            "problem solved", "issue resolved", "satisfied"
+        ],
+        "hi": ["धन्यवाद", "शुक्रिया", "अलविदा", "बस इतना ही", "हल हो गया"],
+        "hinglish": ["dhanyavaad", "dhanyavad", "shukriya", "alvida", "bas itna hi", "hal ho gaya"]
+    }
+}
+
+# Letters plus Devanagari vowel signs and virama, which \w alone does not cover
+_WORD_CHARS = r"\w\u0900-\u097F"
+
+
+def normalize_text(text: str) -> str:
+    """Normalize text so equivalent spellings compare equal
+
+    Applies NFC, folds case, maps typographic apostrophes to ASCII and
+    chandrabindu to anusvara (हूँ / हूं are used interchangeably).
+    """
+    text = unicodedata.normalize("NFC", text)
+    return text.casefold().replace("\u2019", "'").replace("\u0901", "\u0902")
+
+
+class PhraseMatcher:
+    """Matches any of a set of phrases in a single precompiled regex pass
+
+    Phrases only match on word boundaries (so "can" does not match "cancel"),
+    any run of whitespace inside a phrase matches any other, and Devanagari
+    combining marks count as part of a word.
+    """
+
+    def __init__(self, phrases: Iterable[str]):
+        """Compile the matcher
+
+        Args:
+            phrases: Phrases to detect (case-insensitive)
+        """
+        normalized = {normalize_text(phrase).strip() for phrase in phrases}
+        self.phrases = sorted((p for p in normalized if p), key=len, reverse=True)
+
+        if self.phrases:
+            # Longest first, so overlapping phrases report the most specific match
+            alternatives = "|".join(
+                r"\s+".join(re.escape(word) for word in phrase.split())
+                for phrase in self.phrases
+            )
+            self._pattern = re.compile(
+                rf"(?<![{_WORD_CHARS}])(?:{alternatives})(?![{_WORD_CHARS}])"
+            )
+        else:
+            self._pattern = None
+
+    @classmethod
+    def from_phrase_sets(
+        cls,
+        category: str,
+        languages: Optional[Iterable[str]] = None,
+        phrase_sets: Optional[Dict[str, Dict[str, List[str]]]] = None
+    ) -> 'PhraseMatcher':
+        """Build a matcher for one category of a phrase set
+
+        Args:
+            category: Category name (e.g. 'satisfied', 'ending')
+            languages: Languages to include (default: all in the category)
+            phrase_sets: Phrase sets to use (default: PHRASE_SETS)
+
+        Returns:
+            PhraseMatcher for the selected phrases
+        """
+        by_language = (phrase_sets or PHRASE_SETS).get(category)
+        if by_language is None:
+            raise ValueError(f"Unknown phrase category: {category}")
+
+        selected = by_language.keys() if languages is None else languages
+        return cls(phrase for language in selected for phrase in by_language.get(language, []))
+
+    def search(self, text: str) -> Optional[str]:
+        """Return the first matching phrase (normalized), or None"""
+        if self._pattern is None or not text:
+            return None
+        match = self._pattern.search(normalize_text(text))
+        return match.group(0) if match else None
+
+    def matches(self, text: str) -> bool:
+        """Check whether any phrase occurs in the text"""
+        return self.search(text) is not None
+
+
+@lru_cache(maxsize=None)
+def get_phrase_matcher(category: str) -> PhraseMatcher:
+    """Get the shared matcher for a default phrase category"""
+    return PhraseMatcher.from_phrase_sets(category)
+
+
+def merge_phrase_sets(
+    overrides: Optional[Dict[str, Dict[str, List[str]]]] = None
+) -> Dict[str, Dict[str, List[str]]]:
+    """Merge custom phrase sets over the defaults
+
+    Each (category, language) list in overrides replaces the default list.
+
+    Args:
+        overrides: Phrase lists keyed by category then language
+
+    Returns:
+        Complete phrase sets
+    """
+    merged = {category: dict(by_language) for category, by_language in PHRASE_SETS.items()}
+    for category, by_language in (overrides or {}).items():
+        merged.setdefault(category, {}).update(by_language)
+    return merged
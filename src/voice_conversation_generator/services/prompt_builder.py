@@ -2,8 +2,9 @@
 Prompt Builder Service - Centralized prompt generation for both local and LiveKit implementations
 This ensures consistency between all agent implementations
 """
-from typing import Optional, Tuple, List
+from typing import Optional, Tuple, List, Dict
 from ..models import CustomerPersona, SupportPersona, Turn, TurnType
+from .context_manager import ContextManager
 
 
 class PromptBuilder:
@@ -13,21 +14,28 @@ class PromptBuilder:
     for all prompt generation.
     """
 
+    SUPPORT_OPENING_PROMPT = """This is the start of a new call. Greet the customer warmly and introduce yourself.
+Follow your guidelines for the opening script. State your name, company, and the purpose of the call.
+Keep it natural and conversational. Do not use any formatting or quotation marks."""
+
     @staticmethod
     def build_customer_prompt(
         persona: CustomerPersona,
-        context: str = ""
+        context: Optional[str] = ""
     ) -> Tuple[Optional[str], str]:
         """
         Build prompt for customer agent based on persona and conversation context.
 
         Args:
             persona: Customer persona with personality, issue, goal, etc.
-            context: Formatted conversation history
+            context: Formatted conversation history (None leaves out the
+                history section, for when it is sent as chat messages)
 
         Returns:
             Tuple of (system_prompt, user_prompt)
         """
+        history = f"Conversation so far:\n{context}\n\n" if context is not None else ""
+
         # Build the customer prompt (matching local_orchestrator.py lines 180-191)
         prompt = f"""You are {persona.name} receiving a call from customer support.
 Your personality: {persona.personality}
@@ -35,10 +43,7 @@ Your issue/situation: {persona.issue}
 Your goal: {persona.goal}
 Emotional state: {persona.emotional_state.value}
 
-Conversation so far:
-{context}
-
-Respond naturally based on your personality and situation.
+{history}Respond naturally based on your personality and situation.
 {persona.special_behavior if persona.special_behavior else ''}
 Keep your response under 2 sentences. Do not use any formatting or quotation marks. Just speak naturally."""
 
@@ -70,6 +75,29 @@ Keep your response under 2 sentences. Do not use any formatting or quotation mar
         Returns:
             Tuple of (system_prompt, user_prompt)
         """
+        system_prompt = PromptBuilder._support_system_prompt(persona)
+
+        # Build user prompt based on conversation stage
+        if is_opening:
+            prompt = PromptBuilder.SUPPORT_OPENING_PROMPT
+        elif is_closing:
+            prompt = f"""Conversation so far:
+{context}
+
+The customer seems satisfied. Provide a warm closing to end the conversation.
+Keep it under 2 sentences. Do not use any formatting or quotation marks."""
+        else:
+            prompt = f"""Conversation so far:
+{context}
+
+Respond professionally to help the customer. Keep it under 2 sentences.
+Follow your guidelines and policies. Do not use any formatting or quotation marks."""
+
+        return system_prompt, prompt
+
+    @staticmethod
+    def _support_system_prompt(persona: SupportPersona) -> str:
+        """System prompt of a support persona (depends on the persona only)"""
         # Build the base system prompt (matching local_orchestrator.py lines 219-234)
         system_prompt = persona.system_prompt if persona.system_prompt else "You are a helpful customer support agent."
 
@@ -87,25 +115,76 @@ Keep your response under 2 sentences. Do not use any formatting or quotation mar
         if persona.guardrails:
             system_prompt += f"\n\nGuardrails:\n" + "\n".join(f"- {g}" for g in persona.guardrails)
 
-        # Build user prompt based on conversation stage
-        if is_opening:
-            prompt = """This is the start of a new call. Greet the customer warmly and introduce yourself.
-Follow your guidelines for the opening script. State your name, company, and the purpose of the call.
-Keep it natural and conversational. Do not use any formatting or quotation marks."""
-        elif is_closing:
-            prompt = f"""Conversation so far:
-{context}
+        return system_prompt
 
-The customer seems satisfied. Provide a warm closing to end the conversation.
-Keep it under 2 sentences. Do not use any formatting or quotation marks."""
-        else:
-            prompt = f"""Conversation so far:
-{context}
+    @staticmethod
+    def build_support_messages(
+        persona: SupportPersona,
+        turns: List[Turn],
+        is_closing: bool = False
+    ) -> List[Dict[str, str]]:
+        """
+        Build chat messages for the support agent, laid out for prompt caching.
 
-Respond professionally to help the customer. Keep it under 2 sentences.
-Follow your guidelines and policies. Do not use any formatting or quotation marks."""
+        The system message depends only on the persona and the history is
+        append-only, so every request shares its prefix with the previous
+        turn's (and the system message with every conversation of the
+        persona). Turn-specific instructions only ever go at the end.
 
-        return system_prompt, prompt
+        Args:
+            persona: Support persona with company, policies, etc.
+            turns: Conversation so far (full history)
+            is_closing: True if this is the closing statement
+
+        Returns:
+            List of message dicts with 'role' and 'content' keys
+        """
+        system_prompt = (
+            PromptBuilder._support_system_prompt(persona)
+            + "\n\nRespond professionally to help the customer. Keep it under 2 sentences.\n"
+            "Follow your guidelines and policies. Do not use any formatting or quotation marks."
+        )
+        messages = [
+            {"role": "system", "content": system_prompt},
+            # The call connecting is the first "user" message, so the
+            # greeting is an ordinary reply in the history
+            {"role": "user", "content": PromptBuilder.SUPPORT_OPENING_PROMPT}
+        ]
+        messages.extend(ContextManager.format_chat_messages(turns, TurnType.SUPPORT))
+
+        if is_closing:
+            messages.append({
+                "role": "system",
+                "content": "The customer seems satisfied. Provide a warm closing to end the conversation. "
+                           "Keep it under 2 sentences."
+            })
+
+        return messages
+
+    @staticmethod
+    def build_customer_messages(
+        persona: CustomerPersona,
+        turns: List[Turn]
+    ) -> List[Dict[str, str]]:
+        """
+        Build chat messages for the customer, laid out for prompt caching
+        (see build_support_messages).
+
+        Args:
+            persona: Customer persona with personality, issue, goal, etc.
+            turns: Conversation so far (full history)
+
+        Returns:
+            List of message dicts with 'role' and 'content' keys
+        """
+        # The persona prompt without its history section, which the
+        # messages carry instead
+        persona_system_prompt, prompt = PromptBuilder.build_customer_prompt(persona, context=None)
+        system_prompt = persona_system_prompt + "\n\n" + prompt if persona_system_prompt else prompt
+
+        messages = [{"role": "system", "content": system_prompt}]
+        messages.extend(ContextManager.format_chat_messages(turns, TurnType.CUSTOMER))
+        return messages
 
     @staticmethod
     def build_livekit_agent_instructions(
@@ -1,29 +1,187 @@
 """
 Provider Factory - Creates provider instances based on configuration
 """
-from typing import Dict, Any
+import hashlib
+import os
+from typing import Dict, Any, Optional
 from ..config.config import Config
 from ..providers import (
     LLMProvider,
     TTSProvider,
     StorageGateway,
     OpenAILLMProvider,
+    MockLLMProvider,
     OpenAITTSProvider,
     ElevenLabsTTSProvider,
     CartesiaTTSProvider,
+    MockTTSProvider,
     LocalStorageProvider
 )
+from ..providers.rate_limit import get_rate_limiter
+from ..providers.http_pool import get_http_pool
+from ..providers.response_cache import CachingLLMProvider, get_response_cache
+from ..providers.batching import BatchingLLMProvider
+from ..providers.pool import PooledLLMProvider
+from .hedging import HedgedTTSProvider
+from ..providers.resilience import (
+    RetryPolicy,
+    ResilientLLMProvider,
+    ResilientTTSProvider,
+    get_circuit_breaker
+)
 
 
 class ProviderFactory:
     """Factory class for creating provider instances"""
 
+    # Environment variables providers read their API key from
+    API_KEY_ENV = {
+        'openai': 'OPENAI_API_KEY',
+        'elevenlabs': 'ELEVENLABS_API_KEY',
+        'cartesia': 'CARTESIA_API_KEY'
+    }
+
+    @staticmethod
+    def _attach_rate_limiter(provider: Any, kind: str, provider_type: str, provider_config: Dict[str, Any]) -> None:
+        """Attach the shared rate limiter for this provider's quota, if configured
+
+        Quotas are per API key, endpoint (base_url) and organization, so
+        providers share a limiter only when all three match.
+
+        Args:
+            provider: LLM or TTS provider instance
+            kind: 'llm' or 'tts'
+            provider_type: Provider type from config
+            provider_config: Provider configuration (uses its 'rate_limit' section)
+        """
+        settings = provider_config.get('rate_limit')
+        if not settings:
+            return
+
+        env_var = ProviderFactory.API_KEY_ENV.get(provider_type)
+        api_key = provider_config.get('api_key') or (os.getenv(env_var) if env_var else None)
+        provider.rate_limiter = get_rate_limiter(
+            kind,
+            provider_type,
+            api_key,
+            settings,
+            base_url=provider_config.get('base_url'),
+            organization=provider_config.get('organization')
+        )
+
     @staticmethod
-    def create_llm_provider(config: Config) -> LLMProvider:
+    def _circuit_breaker_name(kind: str, provider_type: str, provider_config: Dict[str, Any]) -> str:
+        """Key for the circuit breaker of a provider section
+
+        Outages are per model, endpoint (base_url) and organization, so
+        sections share a breaker (and its metrics entry) only when all
+        three match, e.g. 'llm:openai:gpt-4o-mini' or
+        'llm:openai:llama-3-8b:1a2b3c4d' for a self-hosted server.
+
+        Args:
+            kind: 'llm' or 'tts'
+            provider_type: Provider type from config
+            provider_config: Provider configuration (uses 'model',
+                'base_url', 'organization' and any pool 'endpoints')
+
+        Returns:
+            Circuit breaker name
+        """
+        name = f"{kind}:{provider_type}"
+        if provider_config.get('model'):
+            name += f":{provider_config['model']}"
+
+        endpoints = [provider_config, *(provider_config.get('endpoints') or [])]
+        identity = "\0".join(
+            f"{endpoint.get('base_url') or ''}\0{endpoint.get('organization') or ''}" for endpoint in endpoints
+        )
+        if identity.strip("\0"):
+            name += f":{hashlib.sha256(identity.encode()).hexdigest()[:8]}"
+        return name
+
+    @staticmethod
+    def _make_resilient(provider: Any, kind: str, provider_type: str, provider_config: Dict[str, Any]) -> Any:
+        """Wrap a provider with retries and its shared circuit breaker
+
+        Args:
+            provider: LLM or TTS provider instance
+            kind: 'llm' or 'tts'
+            provider_type: Provider type from config
+            provider_config: Provider configuration (uses its 'retry' and
+                'circuit_breaker' sections; 'retry: false' disables the wrapper)
+
+        Returns:
+            Wrapped provider, or the provider itself if retries are disabled
+        """
+        retry_settings = provider_config.get('retry', {})
+        if retry_settings is False:
+            return provider
+
+        retry_policy = RetryPolicy(**(retry_settings or {}))
+        circuit_breaker = get_circuit_breaker(
+            ProviderFactory._circuit_breaker_name(kind, provider_type, provider_config),
+            **provider_config.get('circuit_breaker', {})
+        )
+        wrapper = ResilientLLMProvider if kind == 'llm' else ResilientTTSProvider
+        return wrapper(provider, retry_policy, circuit_breaker)
+
+    @staticmethod
+    def _make_batched(provider: LLMProvider, provider_config: Dict[str, Any]) -> LLMProvider:
+        """Route LLM requests through the provider's batch API, if configured
+
+        The batcher sits inside retries, so a request that fails within a
+        batch is resubmitted with the next one.
+
+        Args:
+            provider: LLM provider instance
+            provider_config: Provider configuration (uses its 'batch' section;
+                a section without enabled: false turns batching on)
+
+        Returns:
+            Wrapped provider, or the provider itself if batching is off
+        """
+        settings = dict(provider_config.get('batch') or {})
+        if not settings or not settings.pop('enabled', True):
+            return provider
+        return BatchingLLMProvider(provider, **settings)
+
+    @staticmethod
+    def _make_cached(provider: LLMProvider, config: Config, provider_config: Dict[str, Any]) -> LLMProvider:
+        """Wrap an LLM provider with the persistent response cache, if configured
+
+        The cache sits outside retries and rate limiting, so hits skip both.
+
+        Args:
+            provider: (Resilient) LLM provider
+            config: Application configuration (for the storage base_path)
+            provider_config: LLM configuration (uses its 'cache' section)
+
+        Returns:
+            Wrapped provider, or the provider itself if no cache is configured
+        """
+        settings = provider_config.get('cache')
+        if not settings:
+            return provider
+
+        backend = settings.get('backend', 'sqlite')
+        default_name = 'llm_cache.db' if backend == 'sqlite' else 'llm_cache'
+        path = settings.get('path') or os.path.join(config.storage.local.get('base_path', '.'), default_name)
+        cache = get_response_cache(path, backend, settings.get('max_mb', 512))
+        return CachingLLMProvider(
+            provider,
+            cache,
+            mode=settings.get('mode', 'read_through'),
+            seed=settings.get('seed')
+        )
+
+    @staticmethod
+    def create_llm_provider(config: Config, provider_config: Optional[Dict[str, Any]] = None) -> LLMProvider:
         """Create LLM provider based on configuration
 
         Args:
             config: Application configuration
+            provider_config: LLM section to build (defaults to providers.llm;
+                see providers.named_llms)
 
         Returns:
             LLMProvider instance
@@ -31,17 +189,68 @@ class ProviderFactory:
         Raises:
             ValueError: If provider type is not supported
         """
-        provider_config = config.providers.llm
+        # Size the shared connection pool before any provider takes a client
+        get_http_pool(config.providers.http)
+
+        provider_config = provider_config or config.providers.llm
+        provider_type = provider_config.get('type', 'openai').lower()
+
+        if provider_config.get('endpoints'):
+            provider = ProviderFactory._create_llm_pool(provider_config)
+        else:
+            provider = ProviderFactory._create_llm_from_config(provider_config)
+
+        provider = ProviderFactory._make_batched(provider, provider_config)
+        provider = ProviderFactory._make_resilient(provider, 'llm', provider_type, provider_config)
+        return ProviderFactory._make_cached(provider, config, provider_config)
+
+    @staticmethod
+    def _create_llm_from_config(provider_config: Dict[str, Any]) -> LLMProvider:
+        """Create a single (rate limited) LLM provider from its config section
+
+        Raises:
+            ValueError: If provider type is not supported
+        """
         provider_type = provider_config.get('type', 'openai').lower()
 
         if provider_type == 'openai':
-            return OpenAILLMProvider(provider_config)
+            provider = OpenAILLMProvider(provider_config)
+        elif provider_type == 'mock':
+            provider = MockLLMProvider(provider_config)
         # Future: Add Anthropic, etc.
         # elif provider_type == 'anthropic':
-        #     return AnthropicLLMProvider(provider_config)
+        #     provider = AnthropicLLMProvider(provider_config)
         else:
             raise ValueError(f"Unsupported LLM provider type: {provider_type}")
 
+        ProviderFactory._attach_rate_limiter(provider, 'llm', provider_type, provider_config)
+        return provider
+
+    @staticmethod
+    def _create_llm_pool(provider_config: Dict[str, Any]) -> LLMProvider:
+        """Create a pool over the endpoints listed in the llm section
+
+        Each endpoint inherits the rest of the llm section (type, model,
+        rate_limit, ...) and overrides what it sets, so each API key gets
+        its own rate limiter.
+
+        Args:
+            provider_config: LLM configuration (uses its 'endpoints' list
+                and 'pool' section)
+
+        Returns:
+            PooledLLMProvider
+        """
+        shared = {key: value for key, value in provider_config.items() if key not in ('endpoints', 'pool')}
+        providers, names, weights = [], [], []
+        for index, endpoint in enumerate(provider_config['endpoints']):
+            endpoint = dict(endpoint)
+            names.append(endpoint.pop('name', None) or f"endpoint{index}")
+            weights.append(endpoint.pop('weight', 1.0))
+            providers.append(ProviderFactory._create_llm_from_config({**shared, **endpoint}))
+
+        return PooledLLMProvider(providers, names=names, weights=weights, **(provider_config.get('pool') or {}))
+
     @staticmethod
     def create_tts_provider(config: Config) -> TTSProvider:
         """Create TTS provider based on configuration
@@ -55,18 +264,41 @@ class ProviderFactory:
         Raises:
             ValueError: If provider type is not supported
         """
-        provider_config = config.providers.tts
+        get_http_pool(config.providers.http)
+        provider = ProviderFactory._create_tts_from_config(config.providers.tts)
+
+        # Opt-in: a 'hedge' section (without enabled: false) turns hedging on
+        hedge_settings = dict(config.providers.tts.get('hedge') or {})
+        if hedge_settings and hedge_settings.pop('enabled', True):
+            secondary_config = hedge_settings.pop('secondary', None)
+            secondary = ProviderFactory._create_tts_from_config(secondary_config) if secondary_config else None
+            provider = HedgedTTSProvider(provider, secondary, **hedge_settings)
+
+        return provider
+
+    @staticmethod
+    def _create_tts_from_config(provider_config: Dict[str, Any]) -> TTSProvider:
+        """Create a single (rate limited, resilient) TTS provider from its config section
+
+        Raises:
+            ValueError: If provider type is not supported
+        """
         provider_type = provider_config.get('type', 'openai').lower()
 
         if provider_type == 'openai':
-            return OpenAITTSProvider(provider_config)
+            provider = OpenAITTSProvider(provider_config)
         elif provider_type == 'elevenlabs':
-            return ElevenLabsTTSProvider(provider_config)
+            provider = ElevenLabsTTSProvider(provider_config)
         elif provider_type == 'cartesia':
-            return CartesiaTTSProvider(provider_config)
+            provider = CartesiaTTSProvider(provider_config)
+        elif provider_type == 'mock':
+            provider = MockTTSProvider(provider_config)
         else:
             raise ValueError(f"Unsupported TTS provider type: {provider_type}")
 
+        ProviderFactory._attach_rate_limiter(provider, 'tts', provider_type, provider_config)
+        return ProviderFactory._make_resilient(provider, 'tts', provider_type, provider_config)
+
     @staticmethod
     def create_storage_gateway(config: Config) -> StorageGateway:
         """Create storage gateway based on configuration
@@ -104,6 +336,11 @@ class ProviderFactory:
         """
         return {
             'llm': ProviderFactory.create_llm_provider(config),
+            # Named extra LLMs that conversation roles can be routed to
+            'llm_providers': {
+                name: ProviderFactory.create_llm_provider(config, section)
+                for name, section in config.providers.named_llms.items()
+            },
             'tts': ProviderFactory.create_tts_provider(config),
             'storage': ProviderFactory.create_storage_gateway(config)
         }
\ No newline at end of file
@@ -0,0 +1,305 @@
+"""
+Sharded Batch Runner - Spreads a batch over worker processes
+Each worker runs its own event loop and ConversationOrchestrator, so MP3
+encoding and combining use every core instead of one event loop, while rate
+limits stay shared through a coordinator in a manager process
+"""
+import asyncio
+import multiprocessing
+import os
+import queue
+import signal
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing.managers import SyncManager
+from typing import Dict, Any, List, Optional, Callable, Awaitable, Tuple
+
+from ..config.config import Config
+from ..models import (
+    Conversation,
+    ConversationMetrics,
+    BatchJob,
+    BatchResult,
+    BatchBudget
+)
+from ..providers.rate_limit import RateLimitCoordinator, set_rate_limit_coordinator
+
+
+class _CoordinatorManager(SyncManager):
+    """Manager process hosting the shared rate limit coordinator"""
+
+
+_CoordinatorManager.register('RateLimitCoordinator', RateLimitCoordinator)
+
+
+def _ignore_sigint() -> None:
+    # Ctrl-C reaches the whole process group; the manager must outlive the
+    # workers' graceful stop
+    signal.signal(signal.SIGINT, signal.SIG_IGN)
+
+
+class _SharedBatchBudget(BatchBudget):
+    """Batch budget whose spend is pooled by the coordinator, covering every process
+
+    Spend is tallied locally and pushed to the coordinator off the event
+    loop. Each push returns the spend of every process, so exhausted never
+    makes a blocking manager call.
+    """
+
+    def __init__(self, limit_usd: float, coordinator: Any):
+        super().__init__(limit_usd, spent_usd=coordinator.spent_usd())
+        self.coordinator = coordinator
+        self._unsynced_usd = 0.0
+        self._sync_task: Optional[asyncio.Task] = None
+
+    def add(self, cost_usd: float) -> None:
+        """Count the estimated cost of one provider call"""
+        if not cost_usd:
+            return
+        self.spent_usd += cost_usd
+        self._unsynced_usd += cost_usd
+        if self._sync_task is None or self._sync_task.done():
+            self._sync_task = asyncio.get_running_loop().create_task(self._sync())
+
+    async def _sync(self) -> None:
+        """Push unsynced spend to the coordinator and pick up the other processes' spend"""
+        loop = asyncio.get_running_loop()
+        while self._unsynced_usd:
+            cost_usd, self._unsynced_usd = self._unsynced_usd, 0.0
+            total_usd = await loop.run_in_executor(None, self.coordinator.add_spend, cost_usd)
+            # The total covers everything pushed so far, not what was added meanwhile
+            self.spent_usd = total_usd + self._unsynced_usd
+
+    async def flush(self) -> None:
+        """Wait until all local spend has reached the coordinator"""
+        if self._sync_task is not None:
+            await self._sync_task
+
+
+def _result_to_dict(index: int, result: BatchResult) -> Dict[str, Any]:
+    """Serialize a result for the trip back to the parent (audio stays in storage)"""
+    return {
+        "index": index,
+        "conversation": result.conversation.to_dict() if result.conversation else None,
+        "metrics": result.metrics.to_dict() if result.metrics else None,
+        "storage_paths": result.storage_paths,
+        "error": result.error,
+        "duration_seconds": result.duration_seconds
+    }
+
+
+def _result_from_dict(job: BatchJob, data: Dict[str, Any]) -> BatchResult:
+    """Rebuild a worker's result against the parent's job"""
+    return BatchResult(
+        job=job,
+        conversation=Conversation.from_dict(data["conversation"]) if data["conversation"] else None,
+        metrics=ConversationMetrics.from_dict(data["metrics"]) if data["metrics"] else None,
+        storage_paths=data["storage_paths"],
+        error=data["error"],
+        duration_seconds=data["duration_seconds"]
+    )
+
+
+def _run_shard(
+    config: Config,
+    shard: List[Tuple[int, BatchJob]],
+    coordinator: Any,
+    progress: Any,
+    max_concurrency: int,
+    save: bool,
+    resume: bool,
+    budget_usd: Optional[float]
+) -> Dict[str, Any]:
+    """Worker process entry point: generate one shard on a fresh event loop"""
+    set_rate_limit_coordinator(coordinator)
+    budget = _SharedBatchBudget(budget_usd, coordinator) if budget_usd is not None else None
+    return asyncio.run(_run_shard_async(config, shard, progress, max_concurrency, save, resume, budget))
+
+
+async def _run_shard_async(
+    config: Config,
+    shard: List[Tuple[int, BatchJob]],
+    progress: Any,
+    max_concurrency: int,
+    save: bool,
+    resume: bool,
+    budget: Optional[_SharedBatchBudget]
+) -> Dict[str, Any]:
+    # Imported here so the parent doesn't need provider SDKs to fan out
+    from .local_orchestrator import ConversationOrchestrator
+    from .provider_factory import ProviderFactory
+
+    providers = ProviderFactory.create_all_providers(config)
+    orchestrator = ConversationOrchestrator(
+        llm_provider=providers['llm'],
+        tts_provider=providers['tts'],
+        storage_gateway=providers['storage'],
+        verbose=False,
+        llm_providers=providers['llm_providers']
+    )
+
+    indexes = {id(job): index for index, job in shard}
+
+    def report(result: BatchResult):
+        progress.put(_result_to_dict(indexes[id(result.job)], result))
+
+    results = await orchestrator.generate_batch(
+        [job for _, job in shard],
+        max_concurrency=max_concurrency,
+        save=save,
+        on_result=report,
+        resume=resume,
+        batch_budget=budget
+    )
+    if budget is not None:
+        # Processes still running must see this shard's last spend
+        await budget.flush()
+
+    return {
+        "pid": os.getpid(),
+        "jobs": len(shard),
+        "results": [_result_to_dict(index, result) for (index, _), result in zip(shard, results)],
+        "concurrency": orchestrator.concurrency.snapshot()
+    }
+
+
+class ShardedBatchRunner:
+    """Runs a batch across a pool of worker processes
+
+    Jobs are dealt round-robin to one shard per process. Every worker
+    builds its own providers and orchestrator from the same config, so all
+    conversations land in the same storage location, and draws from the
+    same rate limit budgets and spending cap via the coordinator. Adaptive
+    concurrency and circuit breakers stay per process.
+    """
+
+    def __init__(self, config: Config, processes: Optional[int] = None, verbose: bool = True):
+        """Initialize the runner
+
+        Args:
+            config: Application configuration (sent to every worker)
+            processes: Worker processes (default: CPU count)
+            verbose: Print progress output
+        """
+        self.config = config
+        self.processes = max(1, processes or os.cpu_count() or 1)
+        self.verbose = verbose
+
+        # Filled in by generate_batch, for the run report
+        self.rate_limits: Dict[str, Dict[str, Any]] = {}
+        self.shards: List[Dict[str, Any]] = []
+
+    def _log(self, message: str) -> None:
+        """Print progress output when running in verbose mode"""
+        if self.verbose:
+            print(message)
+
+    async def generate_batch(
+        self,
+        jobs: List[BatchJob],
+        max_concurrency: int = 4,
+        save: bool = True,
+        on_result: Optional[Callable[[BatchResult], Optional[Awaitable[None]]]] = None,
+        resume: bool = False,
+        budget_usd: Optional[float] = None
+    ) -> List[BatchResult]:
+        """Generate many conversations across worker processes
+
+        Ctrl-C is handled by each worker as in
+        ConversationOrchestrator.generate_batch (first press drains, second
+        cancels); this process keeps waiting for their results.
+
+        Args:
+            jobs: Conversations to generate
+            max_concurrency: Maximum conversations in flight per process
+            save: Whether to save each conversation to storage
+            on_result: Optional callback (sync or async) invoked per finished job
+            resume: Skip jobs already saved and continue checkpointed ones
+            budget_usd: Optional estimated-cost cap for the whole batch;
+                spend is tallied by the coordinator, so every process stops
+                once the batch as a whole reaches it
+
+        Returns:
+            List of BatchResult objects in the same order as jobs
+        """
+        if max_concurrency < 1:
+            raise ValueError("max_concurrency must be at least 1")
+
+        processes = min(self.processes, max(1, len(jobs)))
+        shards = [list(enumerate(jobs))[i::processes] for i in range(processes)]
+        results: List[Optional[BatchResult]] = [None] * len(jobs)
+
+        async def record(data: Dict[str, Any], notify: bool) -> None:
+            index = data["index"]
+            if results[index] is not None:
+                return
+            results[index] = _result_from_dict(jobs[index], data)
+            if notify and on_result is not None:
+                callback_result = on_result(results[index])
+                if asyncio.iscoroutine(callback_result):
+                    await callback_result
+
+        loop = asyncio.get_running_loop()
+        try:
+            loop.add_signal_handler(
+                signal.SIGINT,
+                lambda: self._log("\n⏸️  Waiting for workers to finish their current turns...")
+            )
+            handles_sigint = True
+        except (NotImplementedError, RuntimeError):
+            handles_sigint = False
+
+        # spawn: forking a process that has event loops and threads is unsafe
+        context = multiprocessing.get_context("spawn")
+        manager = _CoordinatorManager(ctx=context)
+        manager.start(_ignore_sigint)
+        try:
+            coordinator = manager.RateLimitCoordinator()
+            progress = manager.Queue()
+
+            self._log(f"🧩 Sharding {len(jobs)} jobs across {processes} processes")
+            with ProcessPoolExecutor(max_workers=processes, mp_context=context) as pool:
+                futures = [
+                    asyncio.wrap_future(pool.submit(
+                        _run_shard, self.config, shard, coordinator, progress,
+                        max_concurrency, save, resume, budget_usd
+                    ))
+                    for shard in shards
+                ]
+                gathered = asyncio.gather(*futures, return_exceptions=True)
+
+                # Report results as workers finish them
+                while not gathered.done():
+                    try:
+                        data = await loop.run_in_executor(None, progress.get, True, 0.2)
+                    except queue.Empty:
+                        continue
+                    await record(data, notify=True)
+                shard_outcomes = await gathered
+
+            while True:
+                try:
+                    data = progress.get_nowait()
+                except queue.Empty:
+                    break
+                await record(data, notify=True)
+
+            self.shards = []
+            for shard, outcome in zip(shards, shard_outcomes):
+                if isinstance(outcome, BaseException):
+                    # A crashed worker loses its unfinished jobs, not the batch
+                    for index, job in shard:
+                        if results[index] is None:
+                            results[index] = BatchResult(job=job, error=f"Worker failed: {type(outcome).__name__}: {outcome}")
+                    self.shards.append({"jobs": len(shard), "error": str(outcome)})
+                    continue
+                for data in outcome["results"]:
+                    await record(data, notify=False)
+                self.shards.append({key: value for key, value in outcome.items() if key != "results"})
+
+            self.rate_limits = coordinator.snapshot()
+        finally:
+            manager.shutdown()
+            if handles_sigint:
+                loop.remove_signal_handler(signal.SIGINT)
+
+        return results
@@ -0,0 +1,8 @@
+"""
+Local stand-ins for the provider APIs
+"""
+from .server import StandInServer
+
+__all__ = [
+    "StandInServer",
+]
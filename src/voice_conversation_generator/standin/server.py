@@ -0,0 +1,538 @@
+"""
+Stand-in Server - Local HTTP emulation of the OpenAI, Cartesia and ElevenLabs APIs
+Serves just enough of each API for the real SDK clients, so pooling,
+retries and streaming can be measured under load with no network
+"""
+import asyncio
+import io
+import json
+import random
+import re
+import time
+import uuid
+import wave
+from typing import Dict, Any, Optional, List
+
+from aiohttp import web
+
+from ..providers.errors import ProviderError
+from ..providers.llm.mock import MockLLMProvider
+from ..providers.tts.mock import MockTTSProvider, silent_mp3, speech_like_pcm, MP3_BITRATES, MP3_SAMPLE_RATES
+
+
+# Seconds of audio per streamed chunk
+AUDIO_CHUNK_SECONDS = 0.25
+
+
+class _Dropped(Exception):
+    """The connection was deliberately cut (reset or truncated stream)"""
+
+
+class StandInServer:
+    """aiohttp server emulating the provider APIs
+
+    Point providers at it with their 'base_url' setting:
+    - OpenAI (llm and tts, including the Files and Batches endpoints
+      used by the batch backend): <url>/openai/v1
+    - Cartesia: <url>/cartesia
+    - ElevenLabs: <url>/elevenlabs
+
+    Replies, audio, latency and random 429/503/timeout failures come from
+    MockLLMProvider and MockTTSProvider (configured by the 'llm' and 'tts'
+    sections). HTTP-level faults are injected on top of them.
+    """
+
+    def __init__(
+        self,
+        host: str = "127.0.0.1",
+        port: int = 8765,
+        llm: Optional[Dict[str, Any]] = None,
+        tts: Optional[Dict[str, Any]] = None,
+        faults: Optional[Dict[str, Any]] = None,
+        seed: Optional[int] = None,
+        batch_seconds: float = 2.0
+    ):
+        """Initialize the server (call start() to listen)
+
+        Args:
+            host: Interface to bind
+            port: Port to bind (0 picks a free one)
+            llm: MockLLMProvider config (replies, latency, errors)
+            tts: MockTTSProvider config (speech rate, latency, errors)
+            faults: HTTP-level faults, all off by default:
+                slow_first_byte_rate and first_byte_delay_ms (extra delay
+                before the response starts), burst_every_seconds and
+                burst_seconds (periodic windows where every request gets a
+                429, with retry-after until the window ends),
+                truncate_rate (streams cut off halfway) and reset_rate
+                (connections closed before any response)
+            seed: Makes replies, latencies and faults reproducible
+            batch_seconds: How long a submitted batch stays in progress
+                before its results are ready
+        """
+        self.host = host
+        self.port = port
+        self.faults = {
+            'slow_first_byte_rate': 0.0,
+            'first_byte_delay_ms': 2000.0,
+            'burst_every_seconds': 0.0,
+            'burst_seconds': 2.0,
+            'truncate_rate': 0.0,
+            'reset_rate': 0.0,
+            **(faults or {})
+        }
+
+        self.llm = MockLLMProvider({'seed': seed, **(llm or {})})
+        self.tts = MockTTSProvider({'seed': seed, **(tts or {})})
+        self._random = random.Random(seed)
+
+        self.stats: Dict[str, int] = {
+            'requests': 0, 'slow_first_byte': 0, 'burst_429': 0, 'truncated': 0, 'reset': 0, 'provider_errors': 0,
+            'batches': 0
+        }
+        self._started_at = time.monotonic()
+        self._runner: Optional[web.AppRunner] = None
+
+        # Batch API state: uploaded and generated files, and batch objects
+        self.batch_seconds = batch_seconds
+        self._files: Dict[str, Dict[str, Any]] = {}
+        self._batches: Dict[str, Dict[str, Any]] = {}
+        self._batch_tasks: Dict[str, asyncio.Task] = {}
+
+    @property
+    def url(self) -> str:
+        """Base URL of the running server"""
+        return f"http://{self.host}:{self.port}"
+
+    def base_urls(self) -> Dict[str, str]:
+        """The base_url to configure for each provider type"""
+        return {
+            'openai': f"{self.url}/openai/v1",
+            'cartesia': f"{self.url}/cartesia",
+            'elevenlabs': f"{self.url}/elevenlabs"
+        }
+
+    def build_app(self) -> web.Application:
+        """Create the aiohttp application with every emulated endpoint"""
+        app = web.Application(middlewares=[self._fault_middleware])
+        app.router.add_post('/openai/v1/chat/completions', self._openai_chat)
+        app.router.add_post('/openai/v1/audio/speech', self._openai_speech)
+        app.router.add_get('/openai/v1/models', self._openai_models)
+        app.router.add_post('/openai/v1/files', self._openai_upload)
+        app.router.add_get('/openai/v1/files/{file_id}/content', self._openai_file_content)
+        app.router.add_post('/openai/v1/batches', self._openai_create_batch)
+        app.router.add_get('/openai/v1/batches/{batch_id}', self._openai_get_batch)
+        app.router.add_post('/openai/v1/batches/{batch_id}/cancel', self._openai_cancel_batch)
+        app.router.add_post('/cartesia/tts/bytes', self._cartesia_bytes)
+        app.router.add_post('/elevenlabs/v1/text-to-speech/{voice_id}', self._elevenlabs_convert)
+        # Connection warm-up sends HEAD requests to the base URLs
+        app.router.add_route('HEAD', '/{tail:.*}', self._head)
+        return app
+
+    async def start(self) -> None:
+        """Start listening (resolves port 0 to the bound port)"""
+        self._runner = web.AppRunner(self.build_app(), access_log=None, handler_cancellation=True)
+        await self._runner.setup()
+        await web.TCPSite(self._runner, self.host, self.port).start()
+        self.port = self._runner.addresses[0][1]
+        self._started_at = time.monotonic()
+
+    async def stop(self) -> None:
+        """Stop listening and close open connections"""
+        for task in self._batch_tasks.values():
+            task.cancel()
+        if self._runner is not None:
+            await self._runner.cleanup()
+            self._runner = None
+
+    async def __aenter__(self) -> 'StandInServer':
+        await self.start()
+        return self
+
+    async def __aexit__(self, *exc_info) -> None:
+        await self.stop()
+
+    # Faults
+
+    def _in_burst(self) -> Optional[float]:
+        """Seconds left in the current 429 burst window, or None outside one"""
+        every = self.faults['burst_every_seconds']
+        if not every:
+            return None
+        position = (time.monotonic() - self._started_at) % every
+        # Bursts close each period, so a fresh server starts healthy
+        remaining = every - position
+        return remaining if remaining <= self.faults['burst_seconds'] else None
+
+    @web.middleware
+    async def _fault_middleware(self, request: web.Request, handler) -> web.StreamResponse:
+        """Inject connection-level faults and map mock failures to HTTP errors"""
+        if request.method == 'HEAD':
+            return await handler(request)
+        self.stats['requests'] += 1
+
+        if self._random.random() < self.faults['reset_rate']:
+            self.stats['reset'] += 1
+            request.transport.abort()
+            # Never delivered; the client sees the connection drop
+            return web.Response(status=499)
+
+        remaining = self._in_burst()
+        if remaining is not None:
+            self.stats['burst_429'] += 1
+            return self._error(request, 429, "Rate limit reached (burst)", retry_after=remaining)
+
+        if self._random.random() < self.faults['slow_first_byte_rate']:
+            self.stats['slow_first_byte'] += 1
+            await asyncio.sleep(self.faults['first_byte_delay_ms'] / 1000)
+
+        try:
+            return await handler(request)
+        except ProviderError as e:
+            self.stats['provider_errors'] += 1
+            status = e.status_code or (504 if e.is_timeout else 500)
+            return self._error(request, status, str(e), retry_after=e.retry_after)
+        except (_Dropped, ConnectionResetError):
+            # Truncated on purpose, or the client went away mid-stream
+            return web.Response(status=499)
+
+    def _error(self, request: web.Request, status: int, message: str, retry_after: Optional[float] = None) -> web.Response:
+        """JSON error shaped like the addressed API's"""
+        headers = {'retry-after': f"{retry_after:.3f}"} if retry_after is not None else {}
+        if request.path.startswith('/openai'):
+            body = {"error": {"message": message, "type": "stand_in_error", "code": status}}
+        else:
+            body = {"detail": message}
+        return web.json_response(body, status=status, headers=headers)
+
+    def _should_truncate(self) -> bool:
+        if self._random.random() < self.faults['truncate_rate']:
+            self.stats['truncated'] += 1
+            return True
+        return False
+
+    async def _cut(self, request: web.Request, response: web.StreamResponse) -> None:
+        """Drop the connection in the middle of a response"""
+        request.transport.abort()
+        raise _Dropped()
+
+    # Endpoints
+
+    async def _head(self, request: web.Request) -> web.Response:
+        return web.Response(status=200)
+
+    async def _openai_models(self, request: web.Request) -> web.Response:
+        """GET /v1/models (used for health checks)"""
+        return web.json_response({
+            "object": "list",
+            "data": [{"id": self.llm.model, "object": "model", "created": 0, "owned_by": "stand-in"}]
+        })
+
+    async def _openai_chat(self, request: web.Request) -> web.StreamResponse:
+        """POST /v1/chat/completions, plain or streamed (SSE)"""
+        body = await request.json()
+        messages: List[Dict[str, str]] = body.get('messages', [])
+        max_tokens = body.get('max_completion_tokens') or body.get('max_tokens') or 150
+        model = body.get('model', 'gpt-4.1')
+
+        await self.llm.faults.maybe_fail()
+        reply = self.llm.script_reply(messages)
+        usage_stats: Dict[str, Any] = {}
+        self.llm.record_usage(usage_stats, messages, reply, max_tokens)
+        usage = {
+            "prompt_tokens": usage_stats['prompt_tokens'],
+            "completion_tokens": usage_stats['completion_tokens'],
+            "total_tokens": usage_stats['prompt_tokens'] + usage_stats['completion_tokens'],
+            "prompt_tokens_details": {"cached_tokens": 0}
+        }
+        completion_id = f"chatcmpl-{uuid.uuid4().hex[:24]}"
+        created = int(time.time())
+
+        await asyncio.sleep(self.llm.latency.sample())
+        truncate = self._should_truncate()
+
+        if not body.get('stream'):
+            await asyncio.sleep(usage['completion_tokens'] / self.llm.tokens_per_second)
+            payload = json.dumps({
+                "id": completion_id,
+                "object": "chat.completion",
+                "created": created,
+                "model": model,
+                "choices": [{
+                    "index": 0,
+                    "message": {"role": "assistant", "content": reply},
+                    "finish_reason": "stop"
+                }],
+                "usage": usage
+            }).encode()
+            if not truncate:
+                return web.Response(body=payload, content_type='application/json')
+            response = web.StreamResponse(headers={'Content-Length': str(len(payload))})
+            response.content_type = 'application/json'
+            await response.prepare(request)
+            await response.write(payload[:len(payload) // 2])
+            await self._cut(request, response)
+
+        response = web.StreamResponse(headers={'Cache-Control': 'no-cache'})
+        response.content_type = 'text/event-stream'
+        await response.prepare(request)
+
+        def chunk(delta: Dict[str, Any], finish_reason: Optional[str] = None, **extra) -> bytes:
+            data = {
+                "id": completion_id,
+                "object": "chat.completion.chunk",
+                "created": created,
+                "model": model,
+                "choices": [{"index": 0, "delta": delta, "finish_reason": finish_reason}] if delta is not None else [],
+                **extra
+            }
+            return f"data: {json.dumps(data)}\n\n".encode()
+
+        words = re.findall(r'\S+\s*', reply)
+        await response.write(chunk({"role": "assistant", "content": ""}))
+        for i, word in enumerate(words):
+            if truncate and i == len(words) // 2:
+                await self._cut(request, response)
+            await response.write(chunk({"content": word}))
+            await asyncio.sleep(len(word) / 4 / self.llm.tokens_per_second)
+
+        await response.write(chunk({}, "stop"))
+        if (body.get('stream_options') or {}).get('include_usage'):
+            await response.write(chunk(None, usage=usage))
+        await response.write(b"data: [DONE]\n\n")
+        await response.write_eof()
+        return response
+
+    async def _stream_audio(
+        self,
+        request: web.Request,
+        text: str,
+        speed: float,
+        fmt: str,
+        sample_rate: int,
+        bitrate_kbps: int = 128
+    ) -> web.StreamResponse:
+        """Stream synthetic audio at the mock's first-byte latency and realtime factor
+
+        Args:
+            fmt: 'mp3', 'pcm' (16-bit mono) or 'wav'
+        """
+        await self.tts.faults.maybe_fail()
+        duration = self.tts.speech_duration(text, speed)
+
+        if fmt == 'mp3':
+            audio = silent_mp3(duration, bitrate_kbps, sample_rate)
+            content_type = 'audio/mpeg'
+        else:
+            audio = speech_like_pcm(duration, sample_rate)
+            content_type = 'audio/pcm'
+            if fmt == 'wav':
+                buffer = io.BytesIO()
+                with wave.open(buffer, 'wb') as wav:
+                    wav.setnchannels(1)
+                    wav.setsampwidth(2)
+                    wav.setframerate(sample_rate)
+                    wav.writeframes(audio)
+                audio = buffer.getvalue()
+                content_type = 'audio/wav'
+
+        await asyncio.sleep(self.tts.latency.sample())
+        truncate = self._should_truncate()
+
+        response = web.StreamResponse()
+        response.content_type = content_type
+        await response.prepare(request)
+
+        chunk_size = max(1, int(len(audio) * AUDIO_CHUNK_SECONDS / duration)) if duration > 0 else len(audio)
+        for offset in range(0, len(audio), chunk_size):
+            if truncate and offset >= len(audio) // 2:
+                await self._cut(request, response)
+            await response.write(audio[offset:offset + chunk_size])
+            await asyncio.sleep(AUDIO_CHUNK_SECONDS / self.tts.realtime_factor)
+
+        await response.write_eof()
+        return response
+
+    def _store_file(self, content: bytes, filename: str, purpose: str) -> Dict[str, Any]:
+        file_id = f"file-{uuid.uuid4().hex[:24]}"
+        self._files[file_id] = {
+            "id": file_id,
+            "object": "file",
+            "bytes": len(content),
+            "created_at": int(time.time()),
+            "filename": filename,
+            "purpose": purpose,
+            "content": content
+        }
+        return self._files[file_id]
+
+    async def _openai_upload(self, request: web.Request) -> web.Response:
+        """POST /v1/files (multipart upload)"""
+        fields = await request.post()
+        upload = fields.get('file')
+        if upload is None or not hasattr(upload, 'file'):
+            return self._error(request, 400, "Missing file")
+        stored = self._store_file(upload.file.read(), upload.filename, str(fields.get('purpose', '')))
+        return web.json_response({k: v for k, v in stored.items() if k != 'content'})
+
+    async def _openai_file_content(self, request: web.Request) -> web.Response:
+        """GET /v1/files/{file_id}/content"""
+        stored = self._files.get(request.match_info['file_id'])
+        if stored is None:
+            return self._error(request, 404, "No such file")
+        return web.Response(body=stored['content'], content_type='application/octet-stream')
+
+    async def _openai_create_batch(self, request: web.Request) -> web.Response:
+        """POST /v1/batches; results are ready batch_seconds later"""
+        body = await request.json()
+        input_file = self._files.get(body.get('input_file_id'))
+        if input_file is None:
+            return self._error(request, 400, "Input file not found")
+
+        lines = [json.loads(line) for line in input_file['content'].decode('utf-8').splitlines() if line.strip()]
+        batch_id = f"batch_{uuid.uuid4().hex[:24]}"
+        self._batches[batch_id] = {
+            "id": batch_id,
+            "object": "batch",
+            "endpoint": body.get('endpoint', '/v1/chat/completions'),
+            "errors": None,
+            "input_file_id": input_file['id'],
+            "completion_window": body.get('completion_window', '24h'),
+            "status": "in_progress",
+            "output_file_id": None,
+            "error_file_id": None,
+            "created_at": int(time.time()),
+            "in_progress_at": int(time.time()),
+            "completed_at": None,
+            "cancelled_at": None,
+            "request_counts": {"total": len(lines), "completed": 0, "failed": 0},
+            "metadata": body.get('metadata')
+        }
+        self.stats['batches'] += 1
+        self._batch_tasks[batch_id] = asyncio.create_task(self._run_batch(batch_id, lines))
+        return web.json_response(self._batches[batch_id])
+
+    async def _run_batch(self, batch_id: str, lines: List[Dict[str, Any]]) -> None:
+        """Answer every request of a batch with the mock, then publish the result files"""
+        async def answer(line: Dict[str, Any]) -> tuple[bool, Dict[str, Any]]:
+            body = line.get('body') or {}
+            result = {"id": f"batch_req_{uuid.uuid4().hex[:24]}", "custom_id": line.get('custom_id'), "error": None}
+            try:
+                await self.llm.faults.maybe_fail()
+            except ProviderError as e:
+                status = e.status_code or 408
+                result["response"] = {
+                    "status_code": status,
+                    "request_id": uuid.uuid4().hex,
+                    "body": {"error": {"message": str(e), "type": "stand_in_error", "code": status}}
+                }
+                return False, result
+
+            messages = body.get('messages', [])
+            reply = self.llm.script_reply(messages)
+            usage_stats: Dict[str, Any] = {}
+            self.llm.record_usage(
+                usage_stats, messages, reply, body.get('max_completion_tokens') or body.get('max_tokens') or 150
+            )
+            result["response"] = {
+                "status_code": 200,
+                "request_id": uuid.uuid4().hex,
+                "body": {
+                    "id": f"chatcmpl-{uuid.uuid4().hex[:24]}",
+                    "object": "chat.completion",
+                    "created": int(time.time()),
+                    "model": body.get('model', 'gpt-4.1'),
+                    "choices": [{
+                        "index": 0,
+                        "message": {"role": "assistant", "content": reply},
+                        "finish_reason": "stop"
+                    }],
+                    "usage": {
+                        "prompt_tokens": usage_stats['prompt_tokens'],
+                        "completion_tokens": usage_stats['completion_tokens'],
+                        "total_tokens": usage_stats['prompt_tokens'] + usage_stats['completion_tokens'],
+                        "prompt_tokens_details": {"cached_tokens": 0}
+                    }
+                }
+            }
+            return True, result
+
+        await asyncio.sleep(self.batch_seconds)
+        outcomes = await asyncio.gather(*(answer(line) for line in lines))
+
+        batch = self._batches[batch_id]
+        if batch['status'] == 'cancelling':
+            batch.update(status="cancelled", cancelled_at=int(time.time()))
+            return
+
+        succeeded = [json.dumps(result) for ok, result in outcomes if ok]
+        failed = [json.dumps(result) for ok, result in outcomes if not ok]
+        if succeeded:
+            batch['output_file_id'] = self._store_file(
+                "\n".join(succeeded).encode() + b"\n", f"{batch_id}_output.jsonl", "batch_output"
+            )['id']
+        if failed:
+            batch['error_file_id'] = self._store_file(
+                "\n".join(failed).encode() + b"\n", f"{batch_id}_error.jsonl", "batch_output"
+            )['id']
+        batch.update(
+            status="completed",
+            completed_at=int(time.time()),
+            request_counts={"total": len(lines), "completed": len(succeeded), "failed": len(failed)}
+        )
+
+    async def _openai_get_batch(self, request: web.Request) -> web.Response:
+        """GET /v1/batches/{batch_id}"""
+        batch = self._batches.get(request.match_info['batch_id'])
+        if batch is None:
+            return self._error(request, 404, "No such batch")
+        return web.json_response(batch)
+
+    async def _openai_cancel_batch(self, request: web.Request) -> web.Response:
+        """POST /v1/batches/{batch_id}/cancel"""
+        batch = self._batches.get(request.match_info['batch_id'])
+        if batch is None:
+            return self._error(request, 404, "No such batch")
+        if batch['status'] == 'in_progress':
+            batch['status'] = 'cancelling'
+        return web.json_response(batch)
+
+    async def _openai_speech(self, request: web.Request) -> web.StreamResponse:
+        """POST /v1/audio/speech"""
+        body = await request.json()
+        fmt = body.get('response_format', 'mp3')
+        if fmt in ('pcm', 'wav'):
+            return await self._stream_audio(request, body.get('input', ''), body.get('speed', 1.0), fmt, 24000)
+        return await self._stream_audio(request, body.get('input', ''), body.get('speed', 1.0), 'mp3', 44100)
+
+    async def _cartesia_bytes(self, request: web.Request) -> web.StreamResponse:
+        """POST /tts/bytes"""
+        body = await request.json()
+        output_format = body.get('output_format') or {}
+        container = output_format.get('container', 'raw')
+        sample_rate = output_format.get('sample_rate', 44100)
+
+        if container == 'mp3':
+            sample_rate = sample_rate if sample_rate in MP3_SAMPLE_RATES else 44100
+            bitrate_kbps = (output_format.get('bit_rate') or 128000) // 1000
+            bitrate_kbps = bitrate_kbps if bitrate_kbps in MP3_BITRATES else 128
+            return await self._stream_audio(request, body.get('transcript', ''), 1.0, 'mp3', sample_rate, bitrate_kbps)
+        fmt = 'wav' if container == 'wav' else 'pcm'
+        return await self._stream_audio(request, body.get('transcript', ''), 1.0, fmt, sample_rate)
+
+    async def _elevenlabs_convert(self, request: web.Request) -> web.StreamResponse:
+        """POST /v1/text-to-speech/{voice_id}?output_format=mp3_44100_128"""
+        body = await request.json()
+        text = body.get('text', '')
+        speed = (body.get('voice_settings') or {}).get('speed') or 1.0
+        output_format = request.query.get('output_format', 'mp3_44100_128')
+
+        match = re.fullmatch(r'(mp3|pcm)_(\d+)(?:_(\d+))?', output_format)
+        if match and match.group(1) == 'pcm':
+            return await self._stream_audio(request, text, speed, 'pcm', int(match.group(2)))
+
+        sample_rate = int(match.group(2)) if match else 44100
+        bitrate_kbps = int(match.group(3) or 128) if match else 128
+        if sample_rate not in MP3_SAMPLE_RATES or bitrate_kbps not in MP3_BITRATES:
+            sample_rate, bitrate_kbps = 44100, 128
+        return await self._stream_audio(request, text, speed, 'mp3', sample_rate, bitrate_kbps)
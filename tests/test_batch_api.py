@@ -0,0 +1,60 @@
+from voice_conversation_generator.models import BatchJob, ConversationConfig
+from voice_conversation_generator.providers import (
+    BatchingLLMProvider,
+    LocalStorageProvider,
+    MockTTSProvider,
+    OpenAILLMProvider,
+)
+from voice_conversation_generator.services import (
+    ConversationOrchestrator,
+    PersonaService,
+)
+from voice_conversation_generator.standin import StandInServer
+
+
+async def test_conversations_advance_in_lockstep_through_batches(tmp_path) -> None:
+    async with StandInServer(port=0, seed=7, batch_seconds=0.05) as server:
+        llm = BatchingLLMProvider(
+            OpenAILLMProvider(
+                {"api_key": "stand-in", "base_url": server.base_urls()["openai"]}
+            ),
+            collect_seconds=0.1,
+            poll_interval=0.02,
+            timeout=30,
+        )
+        orchestrator = ConversationOrchestrator(
+            llm,
+            MockTTSProvider({"output_format": "mp3"}),
+            LocalStorageProvider({"base_path": str(tmp_path)}),
+            verbose=False,
+        )
+
+        personas = PersonaService(tts_provider="openai")
+        personas.load_default_personas()
+        support = personas.get_support_persona("default")
+        customers = list(personas.customer_personas.values())[:3]
+        config = ConversationConfig(
+            max_turns=4, audio_mode="text_only", prompt_mode="messages"
+        )
+        jobs = [
+            BatchJob(customer, support, config, job_id=f"job{i}")
+            for i, customer in enumerate(customers)
+        ]
+
+        results = await orchestrator.generate_batch(
+            jobs, max_concurrency=len(jobs), save=False
+        )
+
+    assert [result.error for result in results] == [None] * len(jobs)
+    for result in results:
+        assert all(turn.text for turn in result.conversation.turns)
+        assert result.metrics.prompt_tokens > 0
+        assert result.metrics.completion_tokens > 0
+
+    batching = llm.batch_snapshot()
+    calls = [result.metrics.llm_calls for result in results]
+    assert batching["requests"] == sum(calls)
+    assert batching["failed_requests"] == 0
+    # Every turn of every conversation shares one batch
+    assert batching["batches"] == max(calls)
+    assert server.stats["batches"] == batching["batches"]
@@ -0,0 +1,77 @@
+from voice_conversation_generator.models import BatchJob, ConversationConfig
+from voice_conversation_generator.providers import (
+    LocalStorageProvider,
+    MockLLMProvider,
+    MockTTSProvider,
+)
+from voice_conversation_generator.services import (
+    ConversationOrchestrator,
+    PersonaService,
+)
+
+
+def make_orchestrator(tmp_path) -> ConversationOrchestrator:
+    llm = MockLLMProvider(
+        {
+            "seed": 1,
+            "latency": {
+                "distribution": "constant",
+                "ttft_ms": 1,
+                "tokens_per_second": 1e6,
+            },
+        }
+    )
+    tts = MockTTSProvider(
+        {"output_format": "mp3", "latency": {"distribution": "constant", "ttfb_ms": 1}}
+    )
+    storage = LocalStorageProvider({"base_path": str(tmp_path)})
+    return ConversationOrchestrator(llm, tts, storage, verbose=False)
+
+
+async def test_resuming_a_completed_checkpoint_does_not_double_count_turns(
+    tmp_path,
+) -> None:
+    personas = PersonaService(tts_provider="openai")
+    personas.load_default_personas()
+    customer = personas.get_customer_persona("cooperative_parent")
+    support = personas.get_support_persona("default")
+    config = ConversationConfig(max_turns=6, audio_mode="text_only", checkpoint=True)
+
+    conversation, metrics = await make_orchestrator(tmp_path).generate_conversation(
+        customer, support, config
+    )
+    assert len(metrics.turn_latencies) == len(conversation.turns)
+
+    resumed, resumed_metrics = await make_orchestrator(tmp_path).generate_conversation(
+        customer, support, config, conversation_id=conversation.id, resume=True
+    )
+
+    assert len(resumed.turns) == len(conversation.turns)
+    assert len(resumed_metrics.turn_latencies) == len(resumed.turns)
+    assert all(
+        len(samples) <= len(resumed.turns)
+        for samples in resumed_metrics.stage_latencies.values()
+    )
+
+
+async def test_batch_saves_partial_conversation_when_audio_fails_without_checkpoints(
+    tmp_path,
+) -> None:
+    personas = PersonaService(tts_provider="openai")
+    personas.load_default_personas()
+    customer = personas.get_customer_persona("cooperative_parent")
+    support = personas.get_support_persona("default")
+    orchestrator = make_orchestrator(tmp_path)
+    orchestrator.tts = MockTTSProvider(
+        {"output_format": "mp3", "errors": {"server_error_rate": 1.0}}
+    )
+
+    config = ConversationConfig(max_turns=2, audio_mode="script_first")
+    [result] = await orchestrator.generate_batch(
+        [BatchJob(customer, support, config, job_id="job")]
+    )
+
+    assert result.error and result.error.startswith("Audio failed")
+    assert result.conversation.metadata["partial"] is True
+    assert all("audio_error" in turn.metadata for turn in result.conversation.turns)
+    assert result.storage_paths
@@ -0,0 +1,34 @@
+import asyncio
+
+import pytest
+
+from voice_conversation_generator.providers.errors import ProviderError
+from voice_conversation_generator.services.concurrency import AdaptiveLimiter
+
+
+async def test_rate_limit_halves_the_limit() -> None:
+    limiter = AdaptiveLimiter("llm:test", initial_limit=8)
+
+    with pytest.raises(ProviderError):
+        async with limiter.slot():
+            raise ProviderError("slow down", status_code=429)
+
+    assert limiter.limit == 4
+    assert limiter.overloads == 1
+    assert limiter.in_flight == 0
+
+
+async def test_limit_grows_only_while_saturated() -> None:
+    limiter = AdaptiveLimiter("llm:test", initial_limit=2)
+
+    async def request() -> None:
+        async with limiter.slot():
+            await asyncio.sleep(0.01)
+
+    for _ in range(3):
+        await request()
+    assert limiter.limit == 2
+
+    for _ in range(3):
+        await asyncio.gather(request(), request())
+    assert limiter.limit > 2
@@ -0,0 +1,91 @@
+from voice_conversation_generator.models import ConversationConfig
+from voice_conversation_generator.providers import (
+    LocalStorageProvider,
+    MockLLMProvider,
+    MockTTSProvider,
+)
+from voice_conversation_generator.services import (
+    ConversationOrchestrator,
+    PersonaService,
+)
+
+
+def make_orchestrator(
+    tmp_path, ttft_ms: float, ttfb_ms: float = 1
+) -> ConversationOrchestrator:
+    llm = MockLLMProvider(
+        {
+            "seed": 1,
+            "latency": {
+                "distribution": "constant",
+                "ttft_ms": ttft_ms,
+                "tokens_per_second": 1e6,
+            },
+        }
+    )
+    tts = MockTTSProvider(
+        {
+            "output_format": "mp3",
+            "latency": {"distribution": "constant", "ttfb_ms": ttfb_ms},
+        }
+    )
+    storage = LocalStorageProvider({"base_path": str(tmp_path)})
+    return ConversationOrchestrator(llm, tts, storage, verbose=False)
+
+
+def load_personas():
+    personas = PersonaService(tts_provider="openai")
+    personas.load_default_personas()
+    return (
+        personas.get_customer_persona("cooperative_parent"),
+        personas.get_support_persona("default"),
+    )
+
+
+async def test_turn_timeout_ends_the_conversation_as_partial(tmp_path) -> None:
+    customer, support = load_personas()
+    config = ConversationConfig(max_turns=6, audio_mode="text_only", turn_timeout=0.05)
+
+    conversation, _ = await make_orchestrator(
+        tmp_path, ttft_ms=200
+    ).generate_conversation(customer, support, config)
+
+    assert conversation.metadata["stop_reason"] == "turn_timeout"
+    assert conversation.metadata["partial"] is True
+    assert conversation.turns == []
+
+
+async def test_conversation_timeout_keeps_the_finished_turns(tmp_path) -> None:
+    customer, support = load_personas()
+    config = ConversationConfig(
+        max_turns=20, min_turns=20, audio_mode="text_only", conversation_timeout=0.2
+    )
+
+    conversation, metrics = await make_orchestrator(
+        tmp_path, ttft_ms=30
+    ).generate_conversation(customer, support, config)
+
+    assert conversation.metadata["stop_reason"] == "conversation_timeout"
+    assert conversation.metadata["partial"] is True
+    assert 1 <= len(conversation.turns) < 20
+    assert metrics.total_turns == len(conversation.turns)
+
+
+async def test_conversation_timeout_leaves_unrendered_turns_silent(tmp_path) -> None:
+    customer, support = load_personas()
+    config = ConversationConfig(
+        max_turns=4, audio_mode="script_first", conversation_timeout=0.3
+    )
+
+    conversation, metrics = await make_orchestrator(
+        tmp_path, ttft_ms=1, ttfb_ms=1000
+    ).generate_conversation(customer, support, config)
+
+    assert conversation.metadata["stop_reason"] == "conversation_timeout"
+    assert conversation.metadata["partial"] is True
+    assert conversation.turns
+    assert all(
+        "audio_error" in turn.metadata and not turn.audio_data
+        for turn in conversation.turns
+    )
+    assert metrics.turns_missing_audio == len(conversation.turns)
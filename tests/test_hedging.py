@@ -0,0 +1,53 @@
+import asyncio
+from typing import Optional
+
+from voice_conversation_generator.models import VoiceConfig
+from voice_conversation_generator.providers import TTSProvider
+from voice_conversation_generator.services import HedgedTTSProvider
+
+
+class StallingTTS(TTSProvider):
+    """Answers quickly except for the requests listed in stall_on"""
+
+    def __init__(self, stall_on: list[int]):
+        super().__init__({})
+        self.stall_on = set(stall_on)
+        self.calls = 0
+
+    async def generate_speech(
+        self, text: str, voice_config: VoiceConfig, **kwargs
+    ) -> bytes:
+        self.calls += 1
+        await asyncio.sleep(1.0 if self.calls in self.stall_on else 0.001)
+        kwargs["stats"]["characters"] = len(text)
+        return text.encode()
+
+    def get_supported_voices(self) -> list[str]:
+        return []
+
+    def get_provider_name(self) -> str:
+        return "stalling"
+
+    def get_pricing(self, model: Optional[str] = None) -> dict[str, float]:
+        return {"characters": 1_000_000.0}
+
+
+async def test_hedge_reports_the_losing_request_cost() -> None:
+    provider = StallingTTS(stall_on=[4])
+    hedged = HedgedTTSProvider(
+        provider, min_samples=3, max_hedge_rate=1.0, min_delay_ms=10
+    )
+    voice = VoiceConfig(provider="openai", voice_name="alloy")
+
+    for _ in range(3):
+        stats: dict = {}
+        await hedged.generate_speech("hello", voice, stats=stats)
+        assert not stats["hedged"]
+
+    stats = {}
+    assert await hedged.generate_speech("hello", voice, stats=stats) == b"hello"
+
+    assert stats["hedged"] and stats["hedge_won"]
+    assert stats["hedge_extra_characters"] == len("hello")
+    assert stats["hedge_extra_cost_usd"] == len("hello")
+    assert hedged.hedge_snapshot()["extra_characters"] == len("hello")
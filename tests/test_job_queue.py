@@ -0,0 +1,58 @@
+import time
+
+from voice_conversation_generator.jobs.job_queue import JobQueue
+
+
+def make_queue(tmp_path, **settings) -> JobQueue:
+    return JobQueue(str(tmp_path / "queue.db"), **settings)
+
+
+def test_leases_by_priority_and_idempotency_key(tmp_path) -> None:
+    queue = make_queue(tmp_path)
+    low = queue.enqueue("cooperative_parent", idempotency_key="a")
+    high = queue.enqueue("angry_customer", priority=5)
+
+    assert queue.enqueue("cooperative_parent", idempotency_key="a").id == low.id
+    assert [job.id for job in queue.lease("w1", limit=5)] == [high.id, low.id]
+    assert queue.lease("w2") == []
+
+
+def test_failed_jobs_back_off_then_dead_letter(tmp_path) -> None:
+    queue = make_queue(tmp_path, max_attempts=2, retry_delay=0)
+    job = queue.enqueue("cooperative_parent")
+
+    queue.lease("w1")
+    assert queue.fail(job.id, "w1", "boom")
+    assert queue.get(job.id).status == "queued"
+
+    queue.lease("w1")
+    queue.fail(job.id, "w1", "boom again")
+    assert queue.get(job.id).status == "dead"
+    assert queue.get(job.id).last_error == "boom again"
+
+    assert queue.requeue_dead() == 1
+    assert queue.lease("w1")[0].attempts == 1
+
+
+def test_expired_lease_is_taken_over(tmp_path) -> None:
+    queue = make_queue(tmp_path, lease_seconds=0.05)
+    job = queue.enqueue("cooperative_parent")
+
+    queue.lease("w1")
+    time.sleep(0.1)
+    assert queue.lease("w2")[0].id == job.id
+
+    # The first worker lost the lease and can no longer settle the job
+    assert not queue.complete(job.id, "w1")
+    assert queue.complete(job.id, "w2", {"total_turns": 4})
+    assert queue.get(job.id).result == {"total_turns": 4}
+
+
+def test_release_does_not_count_an_attempt(tmp_path) -> None:
+    queue = make_queue(tmp_path)
+    job = queue.enqueue("cooperative_parent")
+
+    queue.lease("w1")
+    assert queue.release(job.id, "w1")
+    assert queue.get(job.id).attempts == 0
+    assert queue.stats()["queued"] == 1
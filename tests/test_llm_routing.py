@@ -0,0 +1,94 @@
+import pytest
+
+from voice_conversation_generator.config.config import Config
+from voice_conversation_generator.models import ConversationConfig
+from voice_conversation_generator.providers import LocalStorageProvider, MockTTSProvider
+from voice_conversation_generator.services import (
+    ConversationOrchestrator,
+    PersonaService,
+    ProviderFactory,
+)
+
+
+def mock_section(model: str) -> dict:
+    return {
+        "type": "mock",
+        "model": model,
+        "seed": 1,
+        "latency": {"distribution": "constant", "ttft_ms": 1, "tokens_per_second": 1e6},
+    }
+
+
+def make_orchestrator(tmp_path, **llm_providers) -> ConversationOrchestrator:
+    config = Config()
+    config.providers.llm = mock_section("mock-large")
+    return ConversationOrchestrator(
+        ProviderFactory.create_llm_provider(config),
+        MockTTSProvider({"output_format": "mp3"}),
+        LocalStorageProvider({"base_path": str(tmp_path)}),
+        verbose=False,
+        llm_providers={
+            name: ProviderFactory.create_llm_provider(config, section)
+            for name, section in llm_providers.items()
+        },
+    )
+
+
+def load_personas():
+    personas = PersonaService(tts_provider="openai")
+    personas.load_default_personas()
+    return personas.get_customer_persona(
+        "cooperative_parent"
+    ), personas.get_support_persona("default")
+
+
+def test_role_settings_fall_back_to_shared_settings() -> None:
+    config = ConversationConfig(
+        temperature=0.5,
+        max_tokens=100,
+        customer_llm_provider="cheap",
+        support_max_tokens=300,
+    )
+
+    assert config.llm_settings("customer") == {
+        "provider": "cheap",
+        "model": None,
+        "temperature": 0.5,
+        "max_tokens": 100,
+    }
+    assert config.llm_settings("support") == {
+        "provider": None,
+        "model": None,
+        "temperature": 0.5,
+        "max_tokens": 300,
+    }
+
+
+async def test_unknown_role_provider_is_rejected_before_generating(tmp_path) -> None:
+    customer, support = load_personas()
+    config = ConversationConfig(
+        max_turns=2, audio_mode="text_only", customer_llm_provider="cheap"
+    )
+
+    with pytest.raises(ValueError, match="cheap"):
+        await make_orchestrator(tmp_path).generate_conversation(
+            customer, support, config
+        )
+
+
+async def test_routed_llms_report_separate_circuit_breakers(tmp_path) -> None:
+    customer, support = load_personas()
+    orchestrator = make_orchestrator(tmp_path, cheap=mock_section("mock-small"))
+    config = ConversationConfig(
+        max_turns=2, audio_mode="text_only", customer_llm_provider="cheap"
+    )
+
+    _, metrics = await orchestrator.generate_conversation(customer, support, config)
+
+    assert (
+        orchestrator.llm.circuit_breaker
+        is not orchestrator.llm_providers["cheap"].circuit_breaker
+    )
+    assert {"llm:mock:mock-large", "llm:mock:mock-small"} <= set(
+        metrics.circuit_breakers
+    )
@@ -0,0 +1,49 @@
+from voice_conversation_generator.services.context_manager import ContextManager
+from voice_conversation_generator.services.phrase_matcher import (
+    PhraseMatcher,
+    get_phrase_matcher,
+)
+
+
+def test_matches_whole_words_only() -> None:
+    matcher = PhraseMatcher(["can", "let me"])
+
+    assert matcher.matches("I can do that")
+    assert matcher.matches("Let  me check")
+    assert not matcher.matches("I want to cancel my order")
+
+
+def test_matches_devanagari_and_hinglish() -> None:
+    satisfied = get_phrase_matcher("satisfied")
+
+    assert satisfied.matches("बहुत धन्यवाद, मेरा काम हो गया।")
+    assert satisfied.matches("Ok, shukriya beta")
+    # A word that merely starts with a phrase is not a match
+    assert not PhraseMatcher(["समझ"]).matches("समझदार")
+
+
+def test_bare_fragments_do_not_signal_resolution() -> None:
+    satisfied = get_phrase_matcher("satisfied")
+    ending = get_phrase_matcher("ending")
+
+    assert not satisfied.matches("Payment fail ho gaya, ab kya karun?")
+    assert not satisfied.matches("मेरा पेमेंट फेल हो गया")
+    assert not ending.matches("Mujhe kuch aur time chahiye")
+    assert ending.matches("Kya aapko aur kuch madad chahiye?")
+
+
+def test_normalizes_spelling_variants() -> None:
+    solution = get_phrase_matcher("solution")
+
+    assert solution.matches("मैं अभी देखता हूँ")
+    assert get_phrase_matcher("satisfied").matches("That’s fine")  # noqa: RUF001
+
+
+def test_context_ending_uses_shared_matcher() -> None:
+    context = "Support: Aapka issue hal ho gaya hai.\nCustomer: Theek hai, alvida!"
+
+    assert ContextManager.is_conversation_ending(context)
+    assert not ContextManager.is_conversation_ending("Customer: My order is late")
+    assert ContextManager.is_conversation_ending(
+        "Customer: cheers", keywords=["cheers"]
+    )
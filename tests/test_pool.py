@@ -0,0 +1,50 @@
+import asyncio
+from typing import Any
+
+from voice_conversation_generator.providers import MockLLMProvider
+from voice_conversation_generator.providers.pool import PooledLLMProvider
+
+
+def mock_llm(ttft_ms: float = 1, **errors: float) -> MockLLMProvider:
+    return MockLLMProvider(
+        {
+            "seed": 1,
+            "latency": {
+                "distribution": "constant",
+                "ttft_ms": ttft_ms,
+                "tokens_per_second": 1e6,
+            },
+            "errors": {"retry_after": 0, **errors},
+        }
+    )
+
+
+async def test_fails_over_and_takes_a_failing_endpoint_out_of_rotation() -> None:
+    pool = PooledLLMProvider(
+        [mock_llm(rate_limit_rate=1.0), mock_llm()],
+        names=["dead", "healthy"],
+        failure_threshold=2,
+        reset_timeout=60,
+    )
+
+    for _ in range(6):
+        stats: dict[str, Any] = {}
+        assert await pool.generate_completion("hello", stats=stats)
+        assert stats["endpoint"] == "healthy"
+
+    endpoints = pool.pool_snapshot()["endpoints"]
+    assert endpoints["dead"]["requests"] == 2
+    assert endpoints["dead"]["state"] == "open"
+    assert endpoints["healthy"]["requests"] == 6
+    assert pool.failovers == 2
+
+
+async def test_least_outstanding_spreads_concurrent_requests() -> None:
+    pool = PooledLLMProvider(
+        [mock_llm(ttft_ms=50), mock_llm(ttft_ms=50)], names=["a", "b"]
+    )
+
+    await asyncio.gather(*(pool.generate_completion("hello") for _ in range(6)))
+
+    endpoints = pool.pool_snapshot()["endpoints"]
+    assert endpoints["a"]["requests"] == endpoints["b"]["requests"] == 3
@@ -0,0 +1,60 @@
+import asyncio
+
+import pytest
+
+from voice_conversation_generator.providers.rate_limit import (
+    RateLimiter,
+    TokenBucket,
+    get_rate_limiter,
+)
+
+
+def test_endpoints_get_their_own_rate_limiter() -> None:
+    settings = {"requests_per_minute": 600}
+    openai = get_rate_limiter("llm", "openai", "key", settings)
+    other_org = get_rate_limiter("llm", "openai", "key", settings, organization="org-2")
+    self_hosted = get_rate_limiter(
+        "llm", "openai", None, settings, base_url="http://vllm:8000/v1"
+    )
+
+    assert len({id(openai), id(other_org), id(self_hosted)}) == 3
+    assert get_rate_limiter("llm", "openai", "key", settings) is openai
+
+
+async def test_waiters_are_served_in_arrival_order() -> None:
+    # 10 units of burst refilling at 1000 per second
+    limiter = RateLimiter("llm:test", units_per_minute=60_000, burst_seconds=0.01)
+    await limiter.acquire(10)
+    order: list[str] = []
+
+    async def request(name: str, units: float) -> None:
+        await limiter.acquire(units)
+        order.append(name)
+
+    await asyncio.gather(
+        request("large", 10), *(request(f"small{i}", 1) for i in range(3))
+    )
+
+    assert order == ["large", "small0", "small1", "small2"]
+    assert limiter.waits >= 1
+
+
+async def test_settle_corrects_the_estimate() -> None:
+    limiter = RateLimiter("llm:test", units_per_minute=60)
+    await limiter.acquire(50)
+    assert limiter.units.available == pytest.approx(10, abs=0.5)
+
+    limiter.settle(estimated_units=50, actual_units=20)
+    assert limiter.units.available == pytest.approx(40, abs=0.5)
+
+    limiter.settle(estimated_units=10, actual_units=30)
+    assert limiter.units.available == pytest.approx(20, abs=0.5)
+
+
+def test_oversized_request_waits_for_a_full_bucket_then_goes_into_debt() -> None:
+    bucket = TokenBucket(per_minute=60)
+    bucket.consume(30)
+
+    assert bucket.wait_time(100) == pytest.approx(30, abs=0.5)
+    bucket.reserve(100)
+    assert bucket.available == pytest.approx(-70, abs=0.5)
@@ -0,0 +1,55 @@
+import pytest
+
+from voice_conversation_generator.providers.errors import ProviderError
+from voice_conversation_generator.providers.resilience import (
+    CircuitBreaker,
+    RetryPolicy,
+    call_with_retry,
+)
+from voice_conversation_generator.services.concurrency import AdaptiveLimiter
+
+
+def failing_request(*errors: ProviderError):
+    remaining = list(errors)
+
+    async def request() -> str:
+        if remaining:
+            raise remaining.pop(0)
+        return "ok"
+
+    return request
+
+
+async def test_retried_rate_limits_back_off_the_limiter() -> None:
+    limiter = AdaptiveLimiter("llm:test", initial_limit=8)
+    request = failing_request(
+        ProviderError("slow down", status_code=429, retry_after=0)
+    )
+
+    async with limiter.slot():
+        result = await call_with_retry(
+            request,
+            RetryPolicy(base_delay=0),
+            CircuitBreaker("llm:test"),
+            on_retry=limiter.record_retry,
+        )
+
+    assert result == "ok"
+    assert limiter.overloads == 1
+    assert limiter.limit < 8
+
+
+async def test_client_errors_leave_the_breaker_alone() -> None:
+    breaker = CircuitBreaker("llm:test", failure_threshold=2)
+    breaker.record_failure()
+
+    with pytest.raises(ProviderError):
+        await call_with_retry(
+            failing_request(ProviderError("bad request", status_code=400)),
+            RetryPolicy(),
+            breaker,
+        )
+
+    assert breaker.consecutive_failures == 1
+    breaker.record_failure()
+    assert breaker.state == "open"
@@ -0,0 +1,45 @@
+from typing import Any
+
+import pytest
+
+from voice_conversation_generator.providers import MockLLMProvider
+from voice_conversation_generator.providers.response_cache import (
+    CacheMissError,
+    CachingLLMProvider,
+    SQLiteResponseCache,
+)
+
+
+def make_provider() -> MockLLMProvider:
+    return MockLLMProvider(
+        {"seed": 1, "latency": {"distribution": "constant", "ttft_ms": 1}}
+    )
+
+
+async def test_hits_skip_the_provider_and_report_no_usage(tmp_path) -> None:
+    cache = SQLiteResponseCache(str(tmp_path / "llm_cache.db"))
+    llm = CachingLLMProvider(make_provider(), cache)
+
+    first: dict[str, Any] = {}
+    text = await llm.generate_completion("hello", system_prompt="be brief", stats=first)
+    second: dict[str, Any] = {}
+
+    assert (
+        await llm.generate_completion("hello", system_prompt="be brief", stats=second)
+        == text
+    )
+    assert first["cache_hit"] is False and first["prompt_tokens"] > 0
+    assert second["cache_hit"] is True and "prompt_tokens" not in second
+    assert (llm.hits, llm.misses) == (1, 1)
+
+
+async def test_replay_serves_recordings_and_fails_on_a_miss(tmp_path) -> None:
+    cache = SQLiteResponseCache(str(tmp_path / "llm_cache.db"))
+    text = await CachingLLMProvider(
+        make_provider(), cache, mode="record"
+    ).generate_completion("hello")
+
+    replay = CachingLLMProvider(make_provider(), cache, mode="replay")
+    assert await replay.generate_completion("hello") == text
+    with pytest.raises(CacheMissError):
+        await replay.generate_completion("something new")
@@ -0,0 +1,23 @@
+import json
+from pathlib import Path
+
+from voice_conversation_generator.models import Conversation, ConversationMetrics
+from voice_conversation_generator.providers import LocalStorageProvider
+
+
+async def test_saved_metrics_include_the_storage_write_time(tmp_path) -> None:
+    storage = LocalStorageProvider({"base_path": str(tmp_path)})
+    conversation = Conversation(id="conv1", scenario_name="late_order")
+    metrics = ConversationMetrics(conversation_id="conv1")
+
+    paths = await storage.save_conversation(
+        conversation, metrics, audio_data=b"\xff\xfb" * 50_000
+    )
+
+    saved = json.loads(Path(paths["metrics"]).read_text())
+    assert metrics.storage_write_ms > 0
+    assert saved["storage_write_ms"] == metrics.storage_write_ms
+    assert (
+        json.loads(Path(paths["transcript"]).read_text())["metrics"]["storage_write_ms"]
+        == metrics.storage_write_ms
+    )
@@ -0,0 +1,131 @@
+import asyncio
+
+from voice_conversation_generator.models import (
+    ConversationConfig,
+    ConversationEvent,
+    ConversationFinished,
+    MetricsUpdated,
+    TurnAudioReady,
+    TurnTextReady,
+)
+from voice_conversation_generator.providers import (
+    LocalStorageProvider,
+    MockLLMProvider,
+    MockTTSProvider,
+)
+from voice_conversation_generator.services import (
+    ConversationOrchestrator,
+    PersonaService,
+)
+
+
+def make_orchestrator(tmp_path, ttft_ms: float = 1) -> ConversationOrchestrator:
+    llm = MockLLMProvider(
+        {
+            "seed": 1,
+            "latency": {
+                "distribution": "constant",
+                "ttft_ms": ttft_ms,
+                "tokens_per_second": 1e6,
+            },
+        }
+    )
+    tts = MockTTSProvider(
+        {"output_format": "mp3", "latency": {"distribution": "constant", "ttfb_ms": 1}}
+    )
+    storage = LocalStorageProvider({"base_path": str(tmp_path)})
+    return ConversationOrchestrator(llm, tts, storage, verbose=False)
+
+
+def load_personas():
+    personas = PersonaService(tts_provider="openai")
+    personas.load_default_personas()
+    return personas.get_customer_persona(
+        "cooperative_parent"
+    ), personas.get_support_persona("default")
+
+
+async def test_events_arrive_in_order(tmp_path) -> None:
+    customer, support = load_personas()
+    config = ConversationConfig(max_turns=4, audio_mode="pipelined")
+
+    events: list[ConversationEvent] = [
+        event
+        async for event in make_orchestrator(tmp_path).stream_conversation(
+            customer, support, config
+        )
+    ]
+
+    finished = events[-1]
+    assert isinstance(finished, ConversationFinished)
+    assert not any(isinstance(event, ConversationFinished) for event in events[:-1])
+    assert any(isinstance(event, MetricsUpdated) for event in events)
+
+    for turn in finished.conversation.turns:
+        text_at = next(
+            i
+            for i, e in enumerate(events)
+            if isinstance(e, TurnTextReady) and e.turn is turn
+        )
+        audio_at = next(
+            i
+            for i, e in enumerate(events)
+            if isinstance(e, TurnAudioReady) and e.turn is turn
+        )
+        assert text_at < audio_at
+    text_turns = [e.turn for e in events if isinstance(e, TurnTextReady)]
+    assert text_turns == finished.conversation.turns
+
+
+async def test_closing_the_stream_cancels_generation(tmp_path) -> None:
+    customer, support = load_personas()
+    orchestrator = make_orchestrator(tmp_path, ttft_ms=20)
+    config = ConversationConfig(max_turns=10, audio_mode="pipelined", checkpoint=True)
+
+    stream = orchestrator.stream_conversation(
+        customer, support, config, conversation_id="conv1"
+    )
+    async for event in stream:
+        if isinstance(event, TurnTextReady):
+            break
+    await stream.aclose()
+
+    await asyncio.sleep(0.05)
+    assert [
+        task for task in asyncio.all_tasks() if task is not asyncio.current_task()
+    ] == []
+    checkpoint = await orchestrator.storage.load_checkpoint("conv1")
+    assert checkpoint["status"] == "interrupted"
+    assert 1 <= len(checkpoint["conversation"].turns) < 10
+
+
+async def test_resume_replays_restored_turns_first(tmp_path) -> None:
+    customer, support = load_personas()
+    config = ConversationConfig(
+        max_turns=8, min_turns=8, audio_mode="text_only", checkpoint=True
+    )
+
+    stream = make_orchestrator(tmp_path).stream_conversation(
+        customer, support, config, conversation_id="conv1"
+    )
+    seen = 0
+    async for event in stream:
+        seen += isinstance(event, TurnTextReady)
+        if seen == 3:
+            break
+    await stream.aclose()
+    restored = (await make_orchestrator(tmp_path).storage.load_checkpoint("conv1"))[
+        "conversation"
+    ].turns
+
+    events = [
+        event
+        async for event in make_orchestrator(tmp_path).stream_conversation(
+            customer, support, config, conversation_id="conv1", resume=True
+        )
+    ]
+
+    texts = [event.turn.text for event in events if isinstance(event, TurnTextReady)]
+    assert texts[: len(restored)] == [turn.text for turn in restored]
+    assert len(texts) > len(restored)
+    assert [turn.text for turn in events[-1].conversation.turns] == texts